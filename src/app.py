@@ -3,12 +3,16 @@
 Simple Flask App
 """
 
-from flask import Flask, request
+from flask import Flask, request, g
 import logging
 import json
+import threading
 from datetime import datetime, timezone
 from src.handlers import handle_ec2_power, handle_list_instances, handle_ec2_schedule, handle_ec2_disable_schedule, handle_fuzzy_search, handle_ec2_stakeholder
-import os
+from src.aws_client import warmup, dumps_json
+from src.clock import start_request_clock, stop_request_clock, request_now
+from src.config import AWS_CLIENT_WARMUP
+from src.config import POD_NAME, POD_NAMESPACE, DEPLOYMENT_NAME
 
 app = Flask(__name__)
 
@@ -16,6 +20,11 @@ app = Flask(__name__)
 class StructuredFormatter(logging.Formatter):
     """Custom formatter for structured JSON logging"""
     def format(self, record):
+        # AWS audit entries carry their dict on the record; add the standard fields and serialize it once
+        audit = getattr(record, 'audit', None)
+        if audit is not None:
+            return dumps_json(dict(audit, level=record.levelname, logger=record.name))
+        
         # If the message is already a JSON string, parse it
         if record.getMessage().startswith('AUDIT:') or record.getMessage().startswith('AWS_AUDIT:') or record.getMessage().startswith('SCHEDULE_AUDIT:') or record.getMessage().startswith('REQUEST_AUDIT:'):
             # Extract the JSON part after the prefix
@@ -36,18 +45,69 @@ class StructuredFormatter(logging.Formatter):
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
-            'pod_name': os.environ.get('HOSTNAME', 'unknown'),
-            'namespace': os.environ.get('POD_NAMESPACE', 'unknown'),
-            'deployment': os.environ.get('DEPLOYMENT_NAME', 'unknown')
+            'pod_name': POD_NAME,
+            'namespace': POD_NAMESPACE,
+            'deployment': DEPLOYMENT_NAME
         }
         return json.dumps(log_data)
 
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that batches formatted records into large writes
+
+    Records are written once buffer_size bytes have accumulated, every flush_interval seconds,
+    and immediately for WARNING and above so failures are never held back.
+    """
+    def __init__(self, stream=None, buffer_size=65536, flush_interval=0.2):
+        super().__init__(stream)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._stop_flushing = threading.Event()
+        # logging.shutdown() flushes and closes handlers at exit, so nothing buffered is lost
+        threading.Thread(target=self._flush_periodically, name="log-flusher", daemon=True).start()
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        # Handler.handle() already holds self.lock around emit
+        self._buffer.append(msg)
+        self._buffered_bytes += len(msg)
+        if self._buffered_bytes >= self.buffer_size or record.levelno >= logging.WARNING:
+            self.flush()
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._buffer:
+                self.stream.write(''.join(self._buffer))
+                self._buffer.clear()
+                self._buffered_bytes = 0
+            super().flush()
+        finally:
+            self.release()
+
+    def close(self):
+        self._stop_flushing.set()
+        self.flush()
+        super().close()
+
+    def _flush_periodically(self):
+        while not self._stop_flushing.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                pass
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.StreamHandler()
+        BufferedStreamHandler()
     ]
 )
 
@@ -58,9 +118,13 @@ for handler in root_logger.handlers:
 
 logger = logging.getLogger(__name__)
 
+# Warm the EC2 client in the background so the worker starts serving immediately
+if AWS_CLIENT_WARMUP:
+    threading.Thread(target=warmup, name="aws-warmup", daemon=True).start()
+
 def _log_request():
     """Log incoming requests for auditing purposes"""
-    timestamp = datetime.now(timezone.utc).isoformat()
+    timestamp = request_now().isoformat()
     user_id = request.form.get('user_id', 'unknown')
     user_name = request.form.get('user_name', 'unknown')
     
@@ -72,9 +136,9 @@ def _log_request():
         'user_name': user_name,
         'remote_addr': request.remote_addr,
         'user_agent': request.headers.get('User-Agent', 'unknown'),
-        'pod_name': os.environ.get('HOSTNAME', 'unknown'),
-        'namespace': os.environ.get('POD_NAMESPACE', 'unknown'),
-        'deployment': os.environ.get('DEPLOYMENT_NAME', 'unknown')
+        'pod_name': POD_NAME,
+        'namespace': POD_NAMESPACE,
+        'deployment': DEPLOYMENT_NAME
     }
     
     # Log form data for POST requests (excluding sensitive data)
@@ -89,9 +153,17 @@ def _log_request():
 
 @app.before_request
 def before_request():
-    """Log all incoming requests"""
+    """Fix the request's clock and log all incoming requests"""
+    g.clock_token = start_request_clock()
     _log_request()
 
+@app.teardown_request
+def teardown_request(exc):
+    """Release the request's clock"""
+    token = g.pop('clock_token', None)
+    if token is not None:
+        stop_request_clock(token)
+
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint"""
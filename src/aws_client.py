@@ -1,264 +1,784 @@
 import boto3 # type: ignore
+from botocore.config import Config # type: ignore
+import botocore.session # type: ignore
 import logging
 import os
 import json
+import queue
+import re
+import threading
+import time
+import atexit
+import functools
+import hashlib
+import heapq
+from itertools import chain, islice
+from operator import itemgetter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from src.config import AWS_REGION
 from src.config import INSTANCE_NAME_SUFFIX
+from src.config import INSTANCE_CACHE_TTL_SECONDS
+from src.config import INSTANCE_CACHE_MAX_ENTRIES
+from src.config import SEARCH_INDEX_TTL_SECONDS
+from src.config import AWS_CONNECT_TIMEOUT_SECONDS, AWS_READ_TIMEOUT_SECONDS, AWS_MAX_ATTEMPTS
+from src.config import AWS_AUDIT_ENABLED
+from src.config import AWS_AUDIT_EMF
+from src.config import POD_NAME, POD_NAMESPACE
 
 logger = logging.getLogger(__name__)
 
+def _json_default(value):
+    """Serialize values the JSON encoder does not handle natively (datetimes as ISO-8601)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+# Audit entries are serialized with orjson when it is installed (it encodes datetimes natively
+# and is several times faster on small dicts), otherwise with the standard library
+try:
+    import orjson # type: ignore
+    dumps_json = lambda value: orjson.dumps(value, default=str).decode()
+except ImportError:
+    dumps_json = lambda value: json.dumps(value, default=_json_default)
+
+class _AuditJson:
+    """An audit entry passed as a lazy log argument, serialized only if a handler renders the message"""
+    __slots__ = ('entry',)
+
+    def __init__(self, entry):
+        self.entry = entry
+
+    def __str__(self):
+        return dumps_json(self.entry)
+
 # Get AWS region from environment variable
 aws_region = os.environ.get('AWS_REGION', 'us-east-1')
 
-# Initialize AWS EC2 client - defer until needed
+# Shared client configuration: a larger connection pool so concurrent requests reuse
+# connections, adaptive retries to back off under EC2 throttling, TCP keep-alive, and
+# timeouts so a stalled endpoint fails the attempt instead of hanging the request
+_client_config = Config(
+    region_name=aws_region,
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'total_max_attempts': AWS_MAX_ATTEMPTS},
+    tcp_keepalive=True,
+    connect_timeout=AWS_CONNECT_TIMEOUT_SECONDS,
+    read_timeout=AWS_READ_TIMEOUT_SECONDS
+)
+
+# One boto3 session for the whole module so credentials are resolved once - defer until needed
+_session = None
+
+# EC2 instance IDs are 'i-' followed by 8 (legacy) or 17 lowercase hex characters
+_IID_RE = re.compile(r'^i-[0-9a-f]{8}([0-9a-f]{9})?$')
+
+# Name tag values lookups accept: EC2 tag values may hold any Unicode up to 256 characters, but the
+# '*' and '?' filter wildcards would match other instances' Names and control characters never come
+# from a Slack command, so those are rejected before a describe call is spent on them
+_NAME_RE = re.compile(r'[^*?\x00-\x1f\x7f]{1,256}')
+
+# Slack user IDs in a Stakeholders tag value, skipping the commas and any whitespace around them
+_STAKEHOLDER_RE = re.compile(r'[^,\s]+')
+
+# Instance states worth listing or controlling; terminated and shutting-down instances are skipped.
+# botocore only reads request parameters, so the filter dict is shared across calls.
+_ACTIVE_STATES = ('pending', 'running', 'stopping', 'stopped')
+_STATE_FILTER = {'Name': 'instance-state-name', 'Values': list(_ACTIVE_STATES)}
+
+# Server-side filter limiting describe_instances to instances that carry the control tag at all
+_CONTROL_TAG_FILTER = {'Name': 'tag-key', 'Values': ['EC2ControlsEnabled']}
+
+# EC2ControlsEnabled values (case-folded) that do not allow control; an empty value counts as unset
+_FALSY_TAG_VALUES = frozenset({'false', '0', 'no', 'disabled', 'off', ''})
+
+# Initialize AWS EC2 client - defer until needed; the lock keeps concurrent first requests
+# from each building their own session and client
 _ec2_client = None
+_client_lock = threading.Lock()
+
+# Bounded worker pool for fanning independent boto3 calls out concurrently; boto3 clients
+# are thread-safe so the workers share the module's EC2 client
+_pool = ThreadPoolExecutor(max_workers=20, thread_name_prefix='ec2')
+
+# Start/stop/reboot calls handed off by request handlers; kept separate from _pool so queued
+# mutations never hold workers the describe fan-out needs, and small so a burst of commands
+# reaches EC2 as a few concurrent mutations rather than all at once
+_power_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ec2-power')
+
+# Default for optional pre-fetched instance arguments, distinct from a None lookup result
+_NOT_FETCHED = object()
+
+# Short-lived cache for describe_instances lookups, keyed by (operation, identifier); entries are
+# kept in insertion order so the oldest can be evicted once INSTANCE_CACHE_MAX_ENTRIES is reached
+_cache = {}
+_cache_lock = threading.Lock()
+
+def _cache_peek(key, ttl):
+    """Return the cached result for key if it is younger than ttl seconds, otherwise None"""
+    with _cache_lock:
+        entry = _cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+def _cached(key, ttl, fn):
+    """Return the cached result for key if it is younger than ttl seconds, otherwise call fn and cache it"""
+    value = _cache_peek(key, ttl)
+    if value is not None:
+        return value
+    value = fn()
+    # Failed lookups return None and are not cached so the next call goes back to AWS
+    if value is not None:
+        _cache_store(key, value)
+    return value
+
+def _cache_store(key, value):
+    """Store a freshly fetched value in the lookup cache"""
+    with _cache_lock:
+        _cache.pop(key, None)
+        _cache[key] = (time.monotonic(), value)
+        while len(_cache) > INSTANCE_CACHE_MAX_ENTRIES:
+            del _cache[next(iter(_cache))]
+
+def invalidate(instance_id=None):
+    """Drop cached lookups for an instance, or the whole cache when no instance is given
+
+    Instance names survive per-instance invalidation since start/stop/reboot do not change them.
+    The fuzzy search index is dropped too, since it holds every instance's state and tags.
+    """
+    with _cache_lock:
+        if instance_id is None:
+            _cache.clear()
+            _lookup_instance_name.cache_clear()
+            return
+        for key in [key for key in _cache if key[1] == instance_id]:
+            del _cache[key]
+        _cache.pop(_SEARCH_INDEX_KEY, None)
+
+# AWS error codes mapped to the error types reported to users, matched in one regex scan
+_AWS_ERROR_TYPES = {
+    'IncorrectInstanceState': 'incorrect_instance_state',
+    'InvalidInstanceID': 'invalid_instance_id',
+    'UnauthorizedOperation': 'unauthorized_operation',
+    'RequestLimitExceeded': 'rate_limit_exceeded',
+    'InsufficientInstanceCapacity': 'insufficient_capacity',
+    'Unsupported': 'unsupported_operation'
+}
+_AWS_ERROR_RE = re.compile('|'.join(_AWS_ERROR_TYPES))
+_INCORRECT_STATE_RE = re.compile(r'not in a state from which it can be (started|stopped)')
 
 def _parse_aws_error_message(error_str):
     """Parse AWS error messages to extract meaningful information for user feedback"""
     if not error_str:
         return "Unknown AWS error"
     
-    # Common AWS error patterns
-    if "IncorrectInstanceState" in error_str:
-        if "not in a state from which it can be started" in error_str:
-            return "instance_cannot_start_from_current_state"
-        elif "not in a state from which it can be stopped" in error_str:
-            return "instance_cannot_stop_from_current_state"
-        else:
-            return "incorrect_instance_state"
-    elif "InvalidInstanceID" in error_str:
-        return "invalid_instance_id"
-    elif "UnauthorizedOperation" in error_str:
-        return "unauthorized_operation"
-    elif "RequestLimitExceeded" in error_str:
-        return "rate_limit_exceeded"
-    elif "InsufficientInstanceCapacity" in error_str:
-        return "insufficient_capacity"
-    elif "Unsupported" in error_str:
-        return "unsupported_operation"
-    else:
+    # botocore puts the error code first ("An error occurred (Code) when calling ..."), so the
+    # leftmost known code is the one that applies
+    match = _AWS_ERROR_RE.search(error_str)
+    if match is None:
         return "aws_error"
+    code = match.group()
+    if code == 'IncorrectInstanceState':
+        state_match = _INCORRECT_STATE_RE.search(error_str)
+        if state_match:
+            return "instance_cannot_start_from_current_state" if state_match.group(1) == 'started' else "instance_cannot_stop_from_current_state"
+    return _AWS_ERROR_TYPES[code]
+
+def _get_session():
+    """Get or create the shared boto3 session"""
+    global _session
+    if _session is None:
+        # Probe the instance metadata service once rather than retrying on every miss, and
+        # resolve credentials up front so clients share the session's cached (refreshing) credentials
+        botocore_session = botocore.session.get_session()
+        botocore_session.set_config_variable('metadata_service_num_attempts', 1)
+        _session = boto3.Session(botocore_session=botocore_session)
+        credentials = _session.get_credentials()
+        if credentials is None:
+            logger.warning("No AWS credentials found in the default credential chain")
+        else:
+            logger.info("AWS credentials resolved via %s", credentials.method)
+    return _session
 
 def _get_ec2_client():
     """Get or create the EC2 client with proper region configuration"""
 
     global _ec2_client
     if _ec2_client is None:
+        with _client_lock:
+            if _ec2_client is None:
+                try:
+                    client = _get_session().client('ec2', region_name=aws_region, config=_client_config)
+                    if AWS_AUDIT_EMF:
+                        _register_latency_hooks(client)
+                    _ec2_client = client
+                    logger.info("EC2 client initialized, using region: %s", aws_region)
+                except Exception as e:
+                    logger.error("Failed to initialize AWS client: %s", e)
+                    raise
+    return _ec2_client
+
+def warmup():
+    """Create the EC2 client and make one cheap call so the first request skips the TLS handshake
+
+    Returns True if the call succeeded; failures are logged and left for the first request to retry.
+    """
+    try:
+        _get_ec2_client().describe_regions(RegionNames=[aws_region])
+        logger.info("EC2 client warmed up")
+        return True
+    except Exception as e:
+        logger.warning("EC2 client warmup failed: %s", e)
+        return False
+
+# Audit entries are serialized and logged by a background thread so the JSON encoding
+# and log I/O stay off the request path. Entries are dropped (and counted) if the queue fills.
+_audit_q = queue.Queue(maxsize=10000)
+_audit_dropped = 0
+
+# CloudWatch Embedded Metric Format: when enabled, each audit line also carries the metadata
+# CloudWatch Logs needs to extract per-operation call counts and latency at ingest
+_EMF_NAMESPACE = 'ec2-controls'
+
+# Latency of the most recent EC2 API call on this thread, recorded by botocore event hooks
+_call_timing = threading.local()
+
+def _before_ec2_call(context, **kwargs):
+    """botocore before-parameter-build hook: note when the API call started"""
+    context['audit_started'] = time.perf_counter()
+
+def _after_ec2_call(context, **kwargs):
+    """botocore after-call hook: record how long the API call took, including failed calls"""
+    started = context.get('audit_started')
+    if started is not None:
+        _call_timing.latency_ms = (time.perf_counter() - started) * 1000
+
+def _register_latency_hooks(client):
+    """Time every API call made through client so audit entries can report its latency"""
+    client.meta.events.register('before-parameter-build.ec2', _before_ec2_call)
+    client.meta.events.register('after-call.ec2', _after_ec2_call)
+    client.meta.events.register('after-call-error.ec2', _after_ec2_call)
+
+def _emf_metadata(entry):
+    """Build the EMF _aws block for an audit entry"""
+    metrics = [{'Name': 'Operations', 'Unit': 'Count'}]
+    if entry.get('Latency') is not None:
+        metrics.append({'Name': 'Latency', 'Unit': 'Milliseconds'})
+    return {
+        'Timestamp': entry['timestamp'] // 1_000_000,
+        'CloudWatchMetrics': [{
+            'Namespace': _EMF_NAMESPACE,
+            'Dimensions': [['aws_operation', 'status']],
+            'Metrics': metrics
+        }]
+    }
+
+@functools.lru_cache(maxsize=4)
+def _format_second(epoch_seconds):
+    """ISO-8601 UTC timestamp for a whole epoch second, without the fraction or offset"""
+    return datetime.fromtimestamp(epoch_seconds, timezone.utc).strftime('%Y-%m-%dT%H:%M:%S')
+
+def _format_timestamp(epoch_ns):
+    """Format a time.time_ns() value like datetime.isoformat() on an aware UTC datetime"""
+    seconds, ns = divmod(epoch_ns, 1_000_000_000)
+    return f"{_format_second(seconds)}.{ns // 1000:06d}+00:00"
+
+def _write_audit_entry(entry):
+    """Serialize and log a single queued audit entry"""
+    if AWS_AUDIT_EMF:
+        entry['Operations'] = 1
+        entry['_aws'] = _emf_metadata(entry)
+    # Entries are stamped with time.time_ns() when queued and formatted here, off the request thread
+    entry['timestamp'] = _format_timestamp(entry['timestamp'])
+    # The dict rides on the record so the structured formatter serializes it once, directly
+    logger.info("AWS_AUDIT: %s", _AuditJson(entry), extra={'audit': entry})
+
+# Most audit entries the writer takes off the queue per wakeup
+_AUDIT_BATCH_SIZE = 256
+
+def _take_audit_batch(block=True):
+    """Wait for one queued audit entry, then take whatever else is already queued up to the batch size
+
+    With block=False, raise queue.Empty instead of waiting when nothing is queued.
+    """
+    batch = [_audit_q.get(block)]
+    while len(batch) < _AUDIT_BATCH_SIZE:
         try:
-            _ec2_client = boto3.client('ec2', region_name=aws_region)
-            logger.info(f"AWS credentials found in environment variables, using region: {aws_region}")
+            batch.append(_audit_q.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
+def _write_audit_batch(batch):
+    """Write a batch of audit entries, one log line each, and mark them done on the queue"""
+    for entry in batch:
+        try:
+            _write_audit_entry(entry)
         except Exception as e:
-            logger.error(f"Failed to initialize AWS client: {e}")
-            raise
-    return _ec2_client
+            logger.error("Failed to write AWS audit entry: %s", e)
+        finally:
+            _audit_q.task_done()
+
+def _drain_audit_queue():
+    """Background loop that writes queued audit entries"""
+    while True:
+        _write_audit_batch(_take_audit_batch())
+
+def _flush_audit_queue():
+    """Write any audit entries still queued, e.g. at interpreter shutdown"""
+    while True:
+        try:
+            batch = _take_audit_batch(block=False)
+        except queue.Empty:
+            return
+        _write_audit_batch(batch)
+
+if AWS_AUDIT_ENABLED:
+    threading.Thread(target=_drain_audit_queue, name="aws-audit-writer", daemon=True).start()
+    atexit.register(_flush_audit_queue)
 
 def _log_aws_operation(operation, target, details=None, success=True, error=None):
     """Log AWS operations for auditing purposes"""
-    timestamp = datetime.now(timezone.utc).isoformat()
+    global _audit_dropped
+    # Audit entries are logged at INFO; skip building and queueing one that would be dropped
+    if not logger.isEnabledFor(logging.INFO):
+        return
     status = "SUCCESS" if success else "FAILED"
     log_entry = {
-        'timestamp': timestamp,
+        'timestamp': time.time_ns(),
         'aws_operation': operation,
         'target': target,
         'region': aws_region,
         'details': details,
         'status': status,
-        'pod_name': os.environ.get('HOSTNAME', 'unknown'),
-        'namespace': os.environ.get('POD_NAMESPACE', 'unknown')
+        'pod_name': POD_NAME,
+        'namespace': POD_NAMESPACE
     }
     if error:
         log_entry['error'] = str(error)
+    if AWS_AUDIT_EMF:
+        log_entry['Latency'] = getattr(_call_timing, 'latency_ms', None)
+        _call_timing.latency_ms = None
     
-    logger.info(f"AWS_AUDIT: {json.dumps(log_entry)}")
-
-def get_instance_state(instance_id):
-    """Get the current state of an EC2 instance"""
-    logger.info(f"get_instance_state called with instance_id: {instance_id}")
     try:
-        response = _get_ec2_client().describe_instances(InstanceIds=[instance_id])
-        if response['Reservations']:
-            instance = response['Reservations'][0]['Instances'][0]
-            state = instance['State']['Name']
-            _log_aws_operation("describe_instances", instance_id, {
-                "instance_state": state,
-                "instance_type": instance.get('InstanceType'),
-                "launch_time": instance.get('LaunchTime').isoformat() if instance.get('LaunchTime') else None
-            })
-            return state
-        _log_aws_operation("describe_instances", instance_id, {"error": "no_reservations_found"}, False)
-        return None
-    except Exception as e:
-        logger.error(f"AWS Error getting instance state: {e}")
-        _log_aws_operation("describe_instances", instance_id, {"error": str(e)}, False, e)
-        return None
+        _audit_q.put_nowait(log_entry)
+    except queue.Full:
+        _audit_dropped += 1
+        if _audit_dropped % 1000 == 1:
+            logger.warning("AWS audit queue full, %s audit entries dropped so far", _audit_dropped)
+
+if not AWS_AUDIT_ENABLED:
+    # Audit logging is switched off: swap in a no-op once so call sites pay nothing
+    _log_aws_operation = lambda *args, **kwargs: None
+
+_instance_id = itemgetter('InstanceId')
+
+# Listings longer than this are audited as a sample plus a digest of the full ID set
+_AUDIT_MAX_IDS = 50
+
+def _audit_instance_ids(instances, field):
+    """Audit details naming instances: the full ID list when short, otherwise a sample and a digest
+
+    The digest (BLAKE2b of the sorted, comma-joined IDs) lets large listings be correlated
+    without serializing thousands of IDs into every audit line.
+    """
+    instance_ids = list(map(_instance_id, instances))
+    if len(instance_ids) <= _AUDIT_MAX_IDS:
+        return {field: instance_ids}
+    digest = hashlib.blake2b(','.join(sorted(instance_ids)).encode(), digest_size=16).hexdigest()
+    return {f"{field}_sample": instance_ids[:10], f"{field}_blake2b": digest}
+
+def _flatten_instances(response):
+    """Iterate over every Instance in a describe_instances response, across all reservations"""
+    return chain.from_iterable(reservation['Instances'] for reservation in response['Reservations'])
+
+def _paginate_instances(page_size, **kwargs):
+    """Iterate over every Instance matched by describe_instances, following NextToken across pages"""
+    paginator = _get_ec2_client().get_paginator('describe_instances')
+    pages = paginator.paginate(PaginationConfig={'PageSize': page_size}, **kwargs)
+    return chain.from_iterable(map(_flatten_instances, pages))
+
+def _describe_instances_by_ids(instance_ids):
+    """Describe instances by ID and index the returned Instance dicts by InstanceId"""
+    response = _get_ec2_client().describe_instances(InstanceIds=instance_ids)
+    return {instance['InstanceId']: instance for instance in _flatten_instances(response)}
+
+def _settle(future, result=None, error=None):
+    """Complete a batched call's future, recording the API latency measured on this thread"""
+    future.latency_ms = getattr(_call_timing, 'latency_ms', None)
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+def _batched_result(future):
+    """Return a completed batched call's result, handing its API latency to this thread's next audit entry"""
+    # The API call ran on whichever thread led the batch, not necessarily this one
+    _call_timing.latency_ms = getattr(future, 'latency_ms', None)
+    return future.result()
+
+class _DescribeBatcher:
+    """Coalesce concurrent single-instance DescribeInstances lookups into multi-ID requests.
+
+    A caller that finds no request in flight sends one for every instance ID queued so far.
+    Callers that arrive while a request is in flight wait for it and then go out together
+    in the next request, so a lone caller never waits on a timer.
+    """
+
+    def __init__(self, max_batch):
+        self.max_batch = max_batch
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._in_flight = False
+
+    def submit(self, instance_id):
+        """Return the Instance dict for instance_id, or None if AWS did not return it"""
+        with self._cond:
+            future = self._pending.get(instance_id)
+            if future is None:
+                future = self._pending[instance_id] = Future()
+            while self._in_flight and not future.done():
+                self._cond.wait()
+            if future.done():
+                return _batched_result(future)
+            self._in_flight = True
+            batch = {instance_id: self._pending.pop(instance_id)}
+            for pending_id in list(self._pending)[:self.max_batch - 1]:
+                batch[pending_id] = self._pending.pop(pending_id)
+        try:
+            self._describe(batch)
+        finally:
+            with self._cond:
+                self._in_flight = False
+                self._cond.notify_all()
+        return _batched_result(future)
+
+    def _describe(self, batch):
+        try:
+            instances = _describe_instances_by_ids(list(batch))
+        except Exception as e:
+            if len(batch) == 1:
+                _settle(next(iter(batch.values())), error=e)
+                return
+            # One unknown or malformed ID fails the whole request, so retry each ID on its own
+            logger.warning("Batched describe_instances for %s instances failed, retrying individually: %s", len(batch), e)
+            for instance_id, future in batch.items():
+                try:
+                    instance = _describe_instances_by_ids([instance_id]).get(instance_id)
+                except Exception as single_error:
+                    _settle(future, error=single_error)
+                else:
+                    _settle(future, instance)
+            return
+        for instance_id, future in batch.items():
+            _settle(future, instances.get(instance_id))
+
+# DescribeInstances accepts up to 1000 instance IDs per request
+_describe_batcher = _DescribeBatcher(max_batch=1000)
+
+class _TagWriteBatcher:
+    """Coalesce concurrent create_tags/delete_tags calls that write the same tags into one request.
+
+    Same group-commit scheme as _DescribeBatcher: writes queued while a request is in flight go
+    out together in the next one, grouped by (operation, tags) with the instance IDs as Resources.
+    """
 
-def can_control_instance_by_id(instance_id):
-    """Check if a specific instance can be controlled by this service"""
+    def __init__(self, max_batch):
+        self.max_batch = max_batch
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._in_flight = False
+
+    def submit(self, operation, instance_id, tags):
+        """Run operation ('create_tags' or 'delete_tags') with the given Tags list on instance_id"""
+        key = (operation, tuple(tuple(tag.items()) for tag in tags))
+        with self._cond:
+            group = self._pending.setdefault(key, {})
+            future = group.get(instance_id)
+            if future is None:
+                future = group[instance_id] = Future()
+            while self._in_flight and not future.done():
+                self._cond.wait()
+            if future.done():
+                return _batched_result(future)
+            self._in_flight = True
+            group = self._pending[key]
+            batch = {instance_id: group.pop(instance_id)}
+            for pending_id in list(group)[:self.max_batch - 1]:
+                batch[pending_id] = group.pop(pending_id)
+            if not group:
+                del self._pending[key]
+        try:
+            self._write(operation, tags, batch)
+        finally:
+            with self._cond:
+                self._in_flight = False
+                self._cond.notify_all()
+        return _batched_result(future)
+
+    def _write(self, operation, tags, batch):
+        try:
+            call = getattr(_get_ec2_client(), operation)
+        except Exception as e:
+            for future in batch.values():
+                _settle(future, error=e)
+            return
+        try:
+            call(Resources=list(batch), Tags=tags)
+        except Exception as e:
+            if len(batch) == 1:
+                _settle(next(iter(batch.values())), error=e)
+                return
+            # One unknown or malformed ID fails the whole request, so retry each ID on its own
+            logger.warning("Batched %s for %s instances failed, retrying individually: %s", operation, len(batch), e)
+            for instance_id, future in batch.items():
+                try:
+                    call(Resources=[instance_id], Tags=tags)
+                except Exception as single_error:
+                    _settle(future, error=single_error)
+                else:
+                    _settle(future)
+            return
+        for future in batch.values():
+            _settle(future)
+
+# CreateTags and DeleteTags accept up to 1000 resource IDs per request
+_tag_writer = _TagWriteBatcher(max_batch=1000)
+
+def get_instance_state(instance_id, bulk=None, instance=None):
+    """Get the current state of an EC2 instance
+
+    bulk is an optional result of get_instances_bulk and instance the instance's already-fetched
+    details; when either is given, the state is read from it instead of calling AWS.
+    """
+    logger.info("get_instance_state called with instance_id: %s", instance_id)
+    if instance is not None:
+        return instance['State']['Name']
+    if bulk is not None:
+        instance = bulk.get(instance_id)
+        return instance['State']['Name'] if instance else None
+    # State comes from the shared details cache entry, so a state check followed by a
+    # control action or name lookup costs a single DescribeInstances
+    instance = get_instance_details(instance_id)
+    return instance['State']['Name'] if instance else None
+
+def can_control_instance_by_id(instance_id, instance=_NOT_FETCHED):
+    """Check if a specific instance can be controlled by this service
+
+    instance is the instance's already-fetched details (None if the lookup found nothing);
+    when omitted they are looked up.
+    """
     try:
-        instance = get_instance_details(instance_id)
+        if instance is _NOT_FETCHED:
+            instance = get_instance_details(instance_id)
         if not instance:
-            logger.warning(f"Cannot control instance {instance_id}: instance not found")
+            logger.warning("Cannot control instance %s: instance not found", instance_id)
             return False
         
         can_control = can_control_instance(instance)
         if not can_control:
-            logger.warning(f"Cannot control instance {instance_id}: EC2ControlsEnabled tag not set to truthy value")
+            logger.warning("Cannot control instance %s: EC2ControlsEnabled tag not set to truthy value", instance_id)
         
         return can_control
     except Exception as e:
-        logger.error(f"Error checking if instance {instance_id} can be controlled: {e}")
+        logger.error("Error checking if instance %s can be controlled: %s", instance_id, e)
         return False
 
-def start_instance(instance_id):
-    """Start an EC2 instance"""
-    # Check if instance can be controlled before starting
-    if not can_control_instance_by_id(instance_id):
-        logger.error(f"Cannot start instance {instance_id}: not authorized to control this instance")
-        _log_aws_operation("start_instances", instance_id, {"error": "instance_not_controllable"}, False)
+# Waiters poll every 5s for at most 90s, which keeps wait=True inside gunicorn's 120s worker
+# timeout; instances that take longer report failure rather than getting the worker killed
+_WAITER_CONFIG = {'Delay': 5, 'MaxAttempts': 18}
+
+def _wait_for_instance(instance_id, waiter_name, operation):
+    """Block on a boto3 waiter until the instance reaches the waiter's target state"""
+    try:
+        _get_ec2_client().get_waiter(waiter_name).wait(
+            InstanceIds=[instance_id],
+            WaiterConfig=_WAITER_CONFIG
+        )
+        _log_aws_operation(operation, instance_id, {"waiter": waiter_name, "wait_result": "target_state_reached"})
+        return True
+    except Exception as e:
+        logger.error("AWS Error waiting for instance %s (%s): %s", instance_id, waiter_name, e)
+        _log_aws_operation(operation, instance_id, {"waiter": waiter_name, "error": str(e)}, False, e)
         return False
-    
-    # Check current state before attempting start
-    current_state = get_instance_state(instance_id)
+    finally:
+        invalidate(instance_id)
+
+# Power actions: the audited EC2 operation, the states each can run from, and the specific
+# rejection (error type, reason) for states where the action is already underway or unsafe
+_POWER_OPERATIONS = {'start': 'start_instances', 'stop': 'stop_instances', 'restart': 'reboot_instances'}
+_POWER_GERUNDS = {'start': 'starting', 'stop': 'stopping', 'restart': 'restarting'}
+_VALID_FROM = {
+    'start': frozenset({'stopped'}),
+    'stop': frozenset({'running'}),
+    'restart': frozenset({'running'})
+}
+_TRANSITION_ERRORS = {
+    'start': {
+        'running': ('already_running', "instance is already running"),
+        'pending': ('already_starting', "instance is already starting (pending)"),
+        'stopping': ('currently_stopping', "instance is currently stopping")
+    },
+    'stop': {
+        'stopped': ('already_stopped', "instance is already stopped"),
+        'stopping': ('already_stopping', "instance is already stopping"),
+        'pending': ('currently_starting', "instance is currently starting (pending)")
+    },
+    'restart': {
+        'stopped': ('instance_stopped', "instance is currently stopped"),
+        'pending': ('currently_starting', "instance is currently starting (pending)"),
+        'stopping': ('currently_stopping', "instance is currently stopping")
+    }
+}
+
+def is_valid_transition(action, current_state):
+    """Check whether action ('start', 'stop' or 'restart') can run from current_state"""
+    return current_state in _VALID_FROM[action]
+
+def submit_power_action(action_fn, instance_id):
+    """Run a power action (start_instance, stop_instance or restart_instance) on the background pool
+
+    Returns the Future; the outcome is reported through the action's own AWS_AUDIT entries.
+    """
+    return _power_pool.submit(action_fn, instance_id)
+
+def _validate_transition(action, instance_id, current_state):
+    """Check that action ('start', 'stop' or 'restart') can run from current_state, logging and auditing a rejection"""
+    operation = _POWER_OPERATIONS[action]
     if current_state is None:
-        logger.error(f"Cannot start instance {instance_id}: unable to determine current state")
-        _log_aws_operation("start_instances", instance_id, {"error": "state_unknown"}, False)
+        logger.error("Cannot %s instance %s: unable to determine current state", action, instance_id)
+        _log_aws_operation(operation, instance_id, {"error": "state_unknown"}, False)
         return False
+    if is_valid_transition(action, current_state):
+        return True
+    error, reason = _TRANSITION_ERRORS[action].get(current_state) or (
+        f"invalid_state_for_{action}", f"instance is in invalid state '{current_state}' for {_POWER_GERUNDS[action]}")
+    logger.error("Cannot %s instance %s: %s", action, instance_id, reason)
+    _log_aws_operation(operation, instance_id, {"error": error, "current_state": current_state}, False)
+    return False
+
+def start_instance(instance_id, wait=False, instance=None):
+    """Start an EC2 instance
+
+    With wait=True, block until the instance is running using the instance_running waiter
+    and return False if it does not get there. Callers that already hold the instance's
+    details (e.g. from get_controllable_instances) can pass them as instance to skip the lookup.
+    """
+    # Fetch the instance once and reuse it for the control check, state and name
+    if instance is None:
+        instance = get_instance_details(instance_id)
     
-    # Validate that instance can be started from current state
-    if current_state == 'running':
-        logger.error(f"Cannot start instance {instance_id}: instance is already running")
-        _log_aws_operation("start_instances", instance_id, {"error": "already_running", "current_state": current_state}, False)
-        return False
-    elif current_state == 'pending':
-        logger.error(f"Cannot start instance {instance_id}: instance is already starting (pending)")
-        _log_aws_operation("start_instances", instance_id, {"error": "already_starting", "current_state": current_state}, False)
-        return False
-    elif current_state == 'stopping':
-        logger.error(f"Cannot start instance {instance_id}: instance is currently stopping")
-        _log_aws_operation("start_instances", instance_id, {"error": "currently_stopping", "current_state": current_state}, False)
+    # Check if instance can be controlled before starting
+    if not can_control_instance_by_id(instance_id, instance=instance):
+        logger.error("Cannot start instance %s: not authorized to control this instance", instance_id)
+        _log_aws_operation("start_instances", instance_id, {"error": "instance_not_controllable"}, False)
         return False
-    elif current_state not in ['stopped']:
-        logger.error(f"Cannot start instance {instance_id}: instance is in invalid state '{current_state}' for starting")
-        _log_aws_operation("start_instances", instance_id, {"error": "invalid_state_for_start", "current_state": current_state}, False)
+    
+    # Check current state before attempting start
+    current_state = get_instance_state(instance_id, instance=instance)
+    if not _validate_transition('start', instance_id, current_state):
         return False
     
     try:
         response = _get_ec2_client().start_instances(InstanceIds=[instance_id])
-        instance_name = get_instance_name(instance_id)
+        invalidate(instance_id)
+        instance_name = get_instance_name(instance_id, instance=instance)
         display_name = f"{instance_name} ({instance_id})" if instance_name else f"unnamed ({instance_id})"
-        logger.info(f"AWS: Started {display_name}")
+        logger.info("AWS: Started %s", display_name)
         _log_aws_operation("start_instances", instance_id, {
             "previous_state": response['StartingInstances'][0]['PreviousState']['Name'],
             "current_state": response['StartingInstances'][0]['CurrentState']['Name']
         })
+        if wait:
+            return _wait_for_instance(instance_id, 'instance_running', "start_instances")
         return True
     except Exception as e:
         error_type = _parse_aws_error_message(str(e))
-        logger.error(f"AWS Error starting instance: {e}")
+        logger.error("AWS Error starting instance: %s", e)
         _log_aws_operation("start_instances", instance_id, {
             "error": str(e),
             "error_type": error_type
         }, False, e)
         return False
 
-def stop_instance(instance_id):
-    """Stop an EC2 instance"""
+def stop_instance(instance_id, wait=False, instance=None):
+    """Stop an EC2 instance
+
+    With wait=True, block until the instance is stopped using the instance_stopped waiter
+    and return False if it does not get there. Callers that already hold the instance's
+    details (e.g. from get_controllable_instances) can pass them as instance to skip the lookup.
+    """
+    # Fetch the instance once and reuse it for the control check, state and name
+    if instance is None:
+        instance = get_instance_details(instance_id)
+    
     # Check if instance can be controlled before stopping
-    if not can_control_instance_by_id(instance_id):
-        logger.error(f"Cannot stop instance {instance_id}: not authorized to control this instance")
+    if not can_control_instance_by_id(instance_id, instance=instance):
+        logger.error("Cannot stop instance %s: not authorized to control this instance", instance_id)
         _log_aws_operation("stop_instances", instance_id, {"error": "instance_not_controllable"}, False)
         return False
     
     # Check current state before attempting stop
-    current_state = get_instance_state(instance_id)
-    if current_state is None:
-        logger.error(f"Cannot stop instance {instance_id}: unable to determine current state")
-        _log_aws_operation("stop_instances", instance_id, {"error": "state_unknown"}, False)
-        return False
-    
-    # Validate that instance can be stopped from current state
-    if current_state == 'stopped':
-        logger.error(f"Cannot stop instance {instance_id}: instance is already stopped")
-        _log_aws_operation("stop_instances", instance_id, {"error": "already_stopped", "current_state": current_state}, False)
-        return False
-    elif current_state == 'stopping':
-        logger.error(f"Cannot stop instance {instance_id}: instance is already stopping")
-        _log_aws_operation("stop_instances", instance_id, {"error": "already_stopping", "current_state": current_state}, False)
-        return False
-    elif current_state == 'pending':
-        logger.error(f"Cannot stop instance {instance_id}: instance is currently starting (pending)")
-        _log_aws_operation("stop_instances", instance_id, {"error": "currently_starting", "current_state": current_state}, False)
-        return False
-    elif current_state not in ['running']:
-        logger.error(f"Cannot stop instance {instance_id}: instance is in invalid state '{current_state}' for stopping")
-        _log_aws_operation("stop_instances", instance_id, {"error": "invalid_state_for_stop", "current_state": current_state}, False)
+    current_state = get_instance_state(instance_id, instance=instance)
+    if not _validate_transition('stop', instance_id, current_state):
         return False
     
     try:
         response = _get_ec2_client().stop_instances(InstanceIds=[instance_id])
-        instance_name = get_instance_name(instance_id)
+        invalidate(instance_id)
+        instance_name = get_instance_name(instance_id, instance=instance)
         display_name = f"{instance_name} ({instance_id})" if instance_name else f"unnamed ({instance_id})"
-        logger.info(f"AWS: Stopped {display_name}")
+        logger.info("AWS: Stopped %s", display_name)
         _log_aws_operation("stop_instances", instance_id, {
             "previous_state": response['StoppingInstances'][0]['PreviousState']['Name'],
             "current_state": response['StoppingInstances'][0]['CurrentState']['Name']
         })
+        if wait:
+            return _wait_for_instance(instance_id, 'instance_stopped', "stop_instances")
         return True
     except Exception as e:
         error_type = _parse_aws_error_message(str(e))
-        logger.error(f"AWS Error stopping instance: {e}")
+        logger.error("AWS Error stopping instance: %s", e)
         _log_aws_operation("stop_instances", instance_id, {
             "error": str(e),
             "error_type": error_type
         }, False, e)
         return False
 
-def restart_instance(instance_id):
-    """Restart an EC2 instance"""
+def restart_instance(instance_id, instance=None):
+    """Restart an EC2 instance
+
+    Callers that already hold the instance's details can pass them as instance to skip the lookup.
+    """
+    # Fetch the instance once and reuse it for the control check, state and name
+    if instance is None:
+        instance = get_instance_details(instance_id)
+    
     # Check if instance can be controlled before restarting
-    if not can_control_instance_by_id(instance_id):
-        logger.error(f"Cannot restart instance {instance_id}: not authorized to control this instance")
+    if not can_control_instance_by_id(instance_id, instance=instance):
+        logger.error("Cannot restart instance %s: not authorized to control this instance", instance_id)
         _log_aws_operation("reboot_instances", instance_id, {"error": "instance_not_controllable"}, False)
         return False
     
     # Check current state before attempting restart
-    current_state = get_instance_state(instance_id)
-    if current_state is None:
-        logger.error(f"Cannot restart instance {instance_id}: unable to determine current state")
-        _log_aws_operation("reboot_instances", instance_id, {"error": "state_unknown"}, False)
-        return False
-    
-    # Validate that instance can be restarted from current state
-    if current_state == 'stopped':
-        logger.error(f"Cannot restart instance {instance_id}: instance is currently stopped")
-        _log_aws_operation("reboot_instances", instance_id, {"error": "instance_stopped", "current_state": current_state}, False)
-        return False
-    elif current_state == 'pending':
-        logger.error(f"Cannot restart instance {instance_id}: instance is currently starting (pending)")
-        _log_aws_operation("reboot_instances", instance_id, {"error": "currently_starting", "current_state": current_state}, False)
-        return False
-    elif current_state == 'stopping':
-        logger.error(f"Cannot restart instance {instance_id}: instance is currently stopping")
-        _log_aws_operation("reboot_instances", instance_id, {"error": "currently_stopping", "current_state": current_state}, False)
-        return False
-    elif current_state not in ['running']:
-        logger.error(f"Cannot restart instance {instance_id}: instance is in invalid state '{current_state}' for restarting")
-        _log_aws_operation("reboot_instances", instance_id, {"error": "invalid_state_for_restart", "current_state": current_state}, False)
+    current_state = get_instance_state(instance_id, instance=instance)
+    if not _validate_transition('restart', instance_id, current_state):
         return False
     
     try:
         response = _get_ec2_client().reboot_instances(InstanceIds=[instance_id])
-        instance_name = get_instance_name(instance_id)
+        invalidate(instance_id)
+        instance_name = get_instance_name(instance_id, instance=instance)
         display_name = f"{instance_name} ({instance_id})" if instance_name else f"unnamed ({instance_id})"
-        logger.info(f"AWS: Restarted {display_name}")
+        logger.info("AWS: Restarted %s", display_name)
         _log_aws_operation("reboot_instances", instance_id, {
             "operation": "reboot_requested"
         })
         return True
     except Exception as e:
         error_type = _parse_aws_error_message(str(e))
-        logger.error(f"AWS Error restarting instance: {e}")
+        logger.error("AWS Error restarting instance: %s", e)
         _log_aws_operation("reboot_instances", instance_id, {
             "error": str(e),
             "error_type": error_type
@@ -267,263 +787,380 @@ def restart_instance(instance_id):
 
 def get_instance_by_name(instance_name):
     """Find an EC2 instance by its Name tag - only returns controllable instances"""
+    return _cached(("get_instance_by_name", instance_name), INSTANCE_CACHE_TTL_SECONDS, lambda: _fetch_instance_by_name(instance_name))
+
+def _fetch_instance_by_name(instance_name):
+    """Look up a controllable EC2 instance by its Name tag in AWS"""
     try:
-        logger.info(f"Searching for controllable instance with Name tag: {instance_name}")
-        response = _get_ec2_client().describe_instances(
-            Filters=[
-                {
-                    'Name': 'tag:Name',
-                    'Values': [instance_name]
-                },
-                {
-                    'Name': 'instance-state-name',
-                    'Values': ['pending', 'running', 'stopping', 'stopped']
-                }
-            ]
-        )
-        
-        instances = []
-        for reservation in response['Reservations']:
-            for instance in reservation['Instances']:
-                # Only include instances that can be controlled
-                if can_control_instance(instance):
-                    instances.append(instance)
+        logger.info("Searching for controllable instance with Name tag: %s", instance_name)
+        filters = [{'Name': 'tag:Name', 'Values': [instance_name]}, _STATE_FILTER, _CONTROL_TAG_FILTER]
+        # A Name tag normally matches a single instance, so small pages keep the common case to one
+        # request; further pages are only fetched until a second match shows the name is ambiguous.
+        # Only include instances that can be controlled.
+        instances = list(islice(filter(can_control_instance, _paginate_instances(50, Filters=filters)), 2))
         
-        logger.info(f"Found {len(instances)} controllable instances with name '{instance_name}'")
+        logger.info("Found %s controllable instances with name '%s'", len(instances), instance_name)
         
         if len(instances) == 1:
             instance_id = instances[0]['InstanceId']
-            logger.info(f"Returning single controllable instance: {instance_id}")
+            # The control check, state and name lookups that follow a resolution reuse this describe
+            _warm_details_cache(instances)
+            logger.info("Returning single controllable instance: %s", instance_id)
             _log_aws_operation("describe_instances_by_name", instance_name, {
                 "found_instance_id": instance_id,
                 "instance_count": 1
             })
             return instance_id
         elif len(instances) > 1:
-            instance_ids = [i['InstanceId'] for i in instances]
-            logger.warning(f"Multiple controllable instances found with name '{instance_name}': {instance_ids}")
+            instance_ids = list(map(_instance_id, instances))
+            logger.warning("Multiple controllable instances found with name '%s': %s", instance_name, instance_ids)
             _log_aws_operation("describe_instances_by_name", instance_name, {
                 "error": "multiple_controllable_instances_found",
                 "instance_ids": instance_ids
             }, False)
             return None
         else:
-            logger.warning(f"No controllable instances found with name '{instance_name}'")
+            logger.warning("No controllable instances found with name '%s'", instance_name)
             _log_aws_operation("describe_instances_by_name", instance_name, {
                 "error": "no_controllable_instances_found"
             }, False)
             return None
     except Exception as e:
-        logger.error(f"AWS Error finding controllable instance by name '{instance_name}': {e}")
+        logger.error("AWS Error finding controllable instance by name '%s': %s", instance_name, e)
         _log_aws_operation("describe_instances_by_name", instance_name, {"error": str(e)}, False, e)
         return None
 
 def get_instance_details(instance_id):
     """Get detailed information about an EC2 instance including Name tag"""
+    return _cached(("get_instance_details", instance_id), INSTANCE_CACHE_TTL_SECONDS, lambda: _fetch_instance_details(instance_id))
+
+def _fetch_instance_details(instance_id):
+    """Fetch detailed information about an EC2 instance from AWS"""
     try:
-        response = _get_ec2_client().describe_instances(InstanceIds=[instance_id])
-        if response['Reservations']:
-            instance = response['Reservations'][0]['Instances'][0]
-            _log_aws_operation("describe_instances_details", instance_id, {
-                "instance_type": instance.get('InstanceType'),
-                "launch_time": instance.get('LaunchTime').isoformat() if instance.get('LaunchTime') else None,
-                "state": instance['State']['Name']
-            })
+        instance = _describe_batcher.submit(instance_id)
+        if instance:
+            _log_aws_operation("describe_instances_details", instance_id, _instance_summary(instance))
             return instance
         _log_aws_operation("describe_instances_details", instance_id, {"error": "no_reservations_found"}, False)
         return None
     except Exception as e:
-        logger.error(f"AWS Error getting instance details: {e}")
+        logger.error("AWS Error getting instance details: %s", e)
         _log_aws_operation("describe_instances_details", instance_id, {"error": str(e)}, False, e)
         return None
 
-def get_instance_name(instance_id):
-    """Get the Name tag of an EC2 instance"""
+def _describe_instance_chunk(instance_ids):
+    """Describe one chunk of instance IDs, retrying them individually if the batched request fails"""
+    try:
+        return _describe_instances_by_ids(instance_ids)
+    except Exception as e:
+        if len(instance_ids) == 1:
+            logger.error("AWS Error describing instance %s: %s", instance_ids[0], e)
+            return {}
+        logger.warning("Batched describe_instances for %s instances failed, retrying individually: %s", len(instance_ids), e)
+        instances = {}
+        for instance_id in instance_ids:
+            instances.update(_describe_instance_chunk([instance_id]))
+        return instances
+
+def _warm_details_cache(instances):
+    """Store already-described instances in the get_instance_details cache"""
+    for instance in instances:
+        _cache_store(("get_instance_details", instance['InstanceId']), instance)
+
+def get_instances_bulk(instance_ids, chunk_size=200):
+    """Describe many instances with one DescribeInstances call per chunk of IDs
+
+    Returns a dict of InstanceId -> Instance dict for every instance AWS returned, and warms
+    the get_instance_details cache with the results. Instances already in that cache (e.g. from
+    the listing that produced the IDs) are served from it and not described again.
+    """
+    instance_ids = list(dict.fromkeys(instance_ids))
+    if not instance_ids:
+        return {}
+    
+    instances = {}
+    missing = []
+    for instance_id in instance_ids:
+        instance = _cache_peek(("get_instance_details", instance_id), INSTANCE_CACHE_TTL_SECONDS)
+        if instance is not None:
+            instances[instance_id] = instance
+        else:
+            missing.append(instance_id)
+    cached_count = len(instances)
+    
+    chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+    if len(chunks) == 1:
+        results = [_describe_instance_chunk(chunks[0])]
+    else:
+        results = map_instances(chunks, _describe_instance_chunk)
+    
+    described = {}
+    for result in results:
+        described.update(result)
+    _warm_details_cache(described.values())
+    instances.update(described)
+    
+    logger.info("Described %s of %s instances in %s request(s), %s from cache", len(instances), len(instance_ids), len(chunks), cached_count)
+    _log_aws_operation("describe_instances_bulk", "bulk", {
+        "requested_count": len(instance_ids),
+        "found_count": len(instances),
+        "cached_count": cached_count,
+        "request_count": len(chunks)
+    }, len(instances) == len(instance_ids))
+    return instances
+
+def map_instances(items, fn):
+    """Call fn for each item (an instance ID or a chunk of them) on the shared worker pool and return the results in order"""
+    return list(_pool.map(fn, items))
+
+def _instance_summary(instance):
+    """Return the type/launch time/state summary logged for an instance, built once and kept on the instance dict"""
+    summary = instance.get('_summary')
+    if summary is None:
+        launch_time = instance.get('LaunchTime')
+        summary = {
+            "instance_type": instance.get('InstanceType'),
+            "launch_time": launch_time.isoformat() if launch_time else None,
+            "state": instance['State']['Name']
+        }
+        instance['_summary'] = summary
+    return summary
+
+def _tags_dict(instance):
+    """Return an instance's Tags as a {Key: Value} dict, built once and kept on the instance dict"""
+    tags = instance.get('_tags')
+    if tags is None:
+        tags = {tag['Key']: tag['Value'] for tag in instance.get('Tags') or []}
+        instance['_tags'] = tags
+    return tags
+
+def get_instance_name(instance_id, bulk=None, instance=None):
+    """Get the Name tag of an EC2 instance
+
+    bulk is an optional result of get_instances_bulk and instance the instance's already-fetched
+    details; when either is given, the name is read from it instead of calling AWS.
+    """
+    if instance is not None:
+        return _tags_dict(instance).get('Name')
+    if bulk is not None:
+        instance = bulk.get(instance_id)
+        return _tags_dict(instance).get('Name') if instance else None
+    try:
+        return _lookup_instance_name(instance_id)
+    except LookupError:
+        return None
+
+@functools.lru_cache(maxsize=1024)
+def _lookup_instance_name(instance_id):
+    """Look up an instance's Name tag, cached for the life of the process
+
+    Name tags are effectively fixed while the service runs. A missing instance raises
+    LookupError so the failure is not cached.
+    """
     instance = get_instance_details(instance_id)
-    if instance and 'Tags' in instance:
-        for tag in instance['Tags']:
-            if tag['Key'] == 'Name':
-                return tag['Value']
-    return None
+    if not instance:
+        raise LookupError(instance_id)
+    return _tags_dict(instance).get('Name')
 
 def can_control_instance(instance):
     """Check if an instance can be controlled by this service based on EC2ControlsEnabled tag"""
     if not instance or 'Tags' not in instance:
         return False
     
-    for tag in instance['Tags']:
-        if tag['Key'] == 'EC2ControlsEnabled':
-            # Any truthy value allows control
-            tag_value = tag['Value']
-            if tag_value and str(tag_value).lower() not in ['false', '0', 'no', 'disabled', 'off']:
-                return True
-            return False
+    tag_value = _tags_dict(instance).get('EC2ControlsEnabled')
+    if tag_value is None:
+        # No EC2ControlsEnabled tag found - assume false (secure by default)
+        return False
     
-    # No EC2ControlsEnabled tag found - assume false (secure by default)
-    return False
+    # Any truthy value allows control; AWS tag values are always strings and usually
+    # already lowercase, in which case no case-folded copy is made
+    if not isinstance(tag_value, str):
+        tag_value = str(tag_value)
+    if tag_value in _FALSY_TAG_VALUES:
+        return False
+    return tag_value.islower() or tag_value.casefold() not in _FALSY_TAG_VALUES
+
+def _iter_all_instances(filters=None):
+    """Lazily yield every active EC2 instance in the region, fetching one page of 1000 at a time
 
-def get_all_instances():
-    """Get all EC2 instances in the region"""
+    filters is an optional list of extra describe_instances Filters applied server-side.
+    """
+    return _paginate_instances(1000, Filters=[_STATE_FILTER] + (filters or []))
+
+def _iter_controllable_instances():
+    """Lazily yield the EC2 instances this service can control"""
+    return filter(can_control_instance, _iter_all_instances([_CONTROL_TAG_FILTER]))
+
+def get_all_instances(filters=None):
+    """Get all EC2 instances in the region
+
+    filters is an optional list of extra describe_instances Filters applied server-side.
+    """
     try:
-        response = _get_ec2_client().describe_instances(
-            Filters=[
-                {
-                    'Name': 'instance-state-name',
-                    'Values': ['pending', 'running', 'stopping', 'stopped']
-                }
-            ]
-        )
-        
-        instances = []
-        for reservation in response['Reservations']:
-            for instance in reservation['Instances']:
-                instances.append(instance)
+        instances = list(_iter_all_instances(filters))
         
-        logger.info(f"Found {len(instances)} instances in region {aws_region}")
+        logger.info("Found %s instances in region %s", len(instances), aws_region)
         _log_aws_operation("describe_instances_all", "all", {
             "instance_count": len(instances),
-            "instance_ids": [i['InstanceId'] for i in instances]
+            **_audit_instance_ids(instances, "instance_ids")
         })
         return instances
     except Exception as e:
-        logger.error(f"AWS Error getting all instances: {e}")
+        logger.error("AWS Error getting all instances: %s", e)
         _log_aws_operation("describe_instances_all", "all", {"error": str(e)}, False, e)
         return []
 
 def get_controllable_instances():
     """Get all EC2 instances that can be controlled by this service"""
     try:
-        all_instances = get_all_instances()
-        controllable_instances = [instance for instance in all_instances if can_control_instance(instance)]
+        # Only instances carrying the control tag come back from EC2; the tag value is still
+        # checked here since falsy values such as "false" or "off" deny control
+        tagged_instances = get_all_instances(filters=[_CONTROL_TAG_FILTER])
+        controllable_instances = list(filter(can_control_instance, tagged_instances))
+        # Per-instance state, name and tag lookups that follow a listing are then served from the cache
+        _warm_details_cache(controllable_instances)
         
-        logger.info(f"Found {len(controllable_instances)} controllable instances out of {len(all_instances)} total instances")
+        logger.info("Found %s controllable instances out of %s tagged instances", len(controllable_instances), len(tagged_instances))
         _log_aws_operation("describe_controllable_instances", "all", {
-            "total_instances": len(all_instances),
+            "tagged_instances": len(tagged_instances),
             "controllable_instances": len(controllable_instances),
-            "controllable_instance_ids": [i['InstanceId'] for i in controllable_instances]
+            **_audit_instance_ids(controllable_instances, "controllable_instance_ids")
         })
         return controllable_instances
     except Exception as e:
-        logger.error(f"AWS Error getting controllable instances: {e}")
+        logger.error("AWS Error getting controllable instances: %s", e)
         _log_aws_operation("describe_controllable_instances", "all", {"error": str(e)}, False, e)
         return []
 
 def resolve_instance_identifier(identifier):
     """Resolve an instance identifier (ID or Name) to instance ID"""
-    logger.info(f"Resolving instance identifier: {identifier}")
+    logger.info("Resolving instance identifier: %s", identifier)
     
-    # If it looks like an instance ID, return it directly
-    if identifier.startswith('i-'):
-        logger.info(f"Identifier '{identifier}' looks like an instance ID, returning directly")
+    # If it is shaped like an instance ID, return it directly; names such as "i-web" fall through to the Name tag lookup
+    if _IID_RE.match(identifier):
+        logger.info("Identifier '%s' looks like an instance ID, returning directly", identifier)
         return identifier
     
     # Otherwise, treat it as a Name tag
-    logger.info(f"Treating '{identifier}' as instance name, looking up by Name tag")
+    if not _NAME_RE.fullmatch(identifier):
+        logger.warning("Identifier '%s' is not a valid instance ID or Name tag value", identifier)
+        return None
+
+    logger.info("Treating '%s' as instance name, looking up by Name tag", identifier)
     instance_id = get_instance_by_name(identifier)
-    logger.info(f"get_instance_by_name('{identifier}') returned: {instance_id}")
+    logger.info("get_instance_by_name('%s') returned: %s", identifier, instance_id)
     if instance_id:
-        logger.info(f"Found instance '{identifier}' with ID: {instance_id}")
+        logger.info("Found instance '%s' with ID: %s", identifier, instance_id)
         return instance_id
 
     # If not found and identifier seems like a short prefix, try appending the domain suffix
     if '.' not in identifier and INSTANCE_NAME_SUFFIX:
         suffix = INSTANCE_NAME_SUFFIX.lstrip('.')
         fq_name = f"{identifier}.{suffix}" if suffix else identifier
-        logger.info(f"No instance found by short name; trying with suffix: '{fq_name}'")
+        logger.info("No instance found by short name; trying with suffix: '%s'", fq_name)
         instance_id = get_instance_by_name(fq_name)
-        logger.info(f"get_instance_by_name('{fq_name}') returned: {instance_id}")
+        logger.info("get_instance_by_name('%s') returned: %s", fq_name, instance_id)
         if instance_id:
-            logger.info(f"Found instance '{fq_name}' with ID: {instance_id}")
+            logger.info("Found instance '%s' with ID: %s", fq_name, instance_id)
             return instance_id
 
-    logger.warning(f"No instance found with name: {identifier}")
+    logger.warning("No instance found with name: %s", identifier)
     return None
 
+# Cache key for the fuzzy search index, kept alongside the per-instance lookups
+_SEARCH_INDEX_KEY = ("fuzzy_search_index", "all")
+
+def _build_search_index():
+    """Build flat (id, name, id_lower, name_lower, state) rows for every controllable instance"""
+    rows = []
+    for instance in _iter_controllable_instances():
+        instance_id = instance['InstanceId']
+        instance_name = _tags_dict(instance).get('Name') or ''
+        rows.append((instance_id, instance_name, instance_id.lower(), instance_name.lower(), instance['State']['Name']))
+    return rows
+
+def _search_index():
+    """Return the cached fuzzy search index, rebuilding it from AWS once it is older than its TTL"""
+    return _cached(_SEARCH_INDEX_KEY, SEARCH_INDEX_TTL_SECONDS, _build_search_index)
+
 def fuzzy_search_instances(search_term):
     """Search for EC2 instances by name or ID using fuzzy matching - only returns controllable instances"""
     try:
-        logger.info(f"Performing fuzzy search for: {search_term}")
+        logger.info("Performing fuzzy search for: %s", search_term)
         
-        # Get only controllable instances
-        instances = get_controllable_instances()
-        
-        # Perform fuzzy matching
-        matching_instances = []
+        # Scan the cached flat index of controllable instances, computing each match's sort key
+        # in the same pass: exact matches first, then prefix matches, then by name, then by ID
+        matches = []
         search_term_lower = search_term.lower()
         
-        for instance in instances:
-            instance_id = instance['InstanceId']
-            instance_name = None
-            
-            # Get instance name from tags
-            if 'Tags' in instance:
-                for tag in instance['Tags']:
-                    if tag['Key'] == 'Name':
-                        instance_name = tag['Value']
-                        break
-            
-            # Check if search term matches instance ID (exact or partial)
-            if search_term_lower in instance_id.lower():
-                matching_instances.append({
-                    'InstanceId': instance_id,
-                    'Name': instance_name,
-                    'State': instance['State']['Name']
-                })
-                continue
-            
-            # Check if search term matches instance name (exact or partial)
-            if instance_name and search_term_lower in instance_name.lower():
-                matching_instances.append({
-                    'InstanceId': instance_id,
-                    'Name': instance_name,
-                    'State': instance['State']['Name']
-                })
+        for instance_id, instance_name, id_lower, name_lower, state in _search_index():
+            # Check if search term matches instance ID or name (exact or partial)
+            if search_term_lower not in id_lower and search_term_lower not in name_lower:
                 continue
-        
-        # Sort results: exact matches first, then by name, then by ID
-        def sort_key(instance):
-            instance_id = instance['InstanceId'].lower()
-            instance_name = (instance['Name'] or '').lower()
             
-            # Exact matches get highest priority
-            if search_term_lower == instance_id or search_term_lower == instance_name:
-                return (0, instance_name, instance_id)
+            if search_term_lower == id_lower or search_term_lower == name_lower:
+                priority = 0
+            elif id_lower.startswith(search_term_lower) or name_lower.startswith(search_term_lower):
+                priority = 1
+            else:
+                priority = 2
             
-            # Starts with search term gets second priority
-            if instance_id.startswith(search_term_lower) or instance_name.startswith(search_term_lower):
-                return (1, instance_name, instance_id)
-            
-            # Contains search term gets third priority
-            return (2, instance_name, instance_id)
-        
-        matching_instances.sort(key=sort_key)
+            # Instance IDs are unique, so the tuple comparison never reaches the record dict
+            matches.append((priority, name_lower, id_lower, {
+                'InstanceId': instance_id,
+                'Name': instance_name or None,
+                'State': state
+            }))
         
         # Limit results to prevent overwhelming responses
         max_results = 10
-        if len(matching_instances) > max_results:
-            matching_instances = matching_instances[:max_results]
-            logger.info(f"Limited results to {max_results} instances")
+        matching_instances = [match[3] for match in heapq.nsmallest(max_results, matches)]
+        if len(matches) > max_results:
+            logger.info("Limited results to %s instances", max_results)
         
-        logger.info(f"Found {len(matching_instances)} controllable instances matching '{search_term}'")
+        logger.info("Found %s controllable instances matching '%s'", len(matching_instances), search_term)
         _log_aws_operation("fuzzy_search_instances", search_term, {
             "search_term": search_term,
             "results_count": len(matching_instances),
-            "instance_ids": [i['InstanceId'] for i in matching_instances]
+            "instance_ids": list(map(_instance_id, matching_instances))
         })
         
         return matching_instances
         
     except Exception as e:
-        logger.error(f"AWS Error performing fuzzy search for '{search_term}': {e}")
+        logger.error("AWS Error performing fuzzy search for '%s': %s", search_term, e)
         _log_aws_operation("fuzzy_search_instances", search_term, {"error": str(e)}, False, e)
         return []
 
 def get_instance_tags(instance_id):
     """Get all tags for an EC2 instance"""
+    tags = _cached(("get_instance_tags", instance_id), INSTANCE_CACHE_TTL_SECONDS, lambda: _fetch_instance_tags(instance_id))
+    return tags if tags is not None else []
+
+def _get_tag_dict(instance_id):
+    """Get an EC2 instance's tags as a {Key: Value} dict, empty if the lookup failed"""
+    tags = _lookup_tag_dict(instance_id)
+    return tags if tags is not None else {}
+
+def _lookup_tag_dict(instance_id):
+    """Get an EC2 instance's tags as a {Key: Value} dict projected once per cached tag list, or None if the lookup failed"""
+    def project():
+        tags = _cached(("get_instance_tags", instance_id), INSTANCE_CACHE_TTL_SECONDS, lambda: _fetch_instance_tags(instance_id))
+        return None if tags is None else {tag['Key']: tag['Value'] for tag in tags}
+    return _cached(("get_tag_dict", instance_id), INSTANCE_CACHE_TTL_SECONDS, project)
+
+def _fetch_instance_tags(instance_id):
+    """Fetch all tags for an EC2 instance from AWS, or None if the lookup failed
+
+    Tags are read from instance details already in the cache when there are any, so a tag read
+    right after a details lookup makes no API call; otherwise they come from the shared batcher.
+    """
+    instance = _cache_peek(("get_instance_details", instance_id), INSTANCE_CACHE_TTL_SECONDS)
+    if instance is not None:
+        return instance.get('Tags', [])
     try:
-        response = _get_ec2_client().describe_instances(InstanceIds=[instance_id])
-        if response['Reservations']:
-            instance = response['Reservations'][0]['Instances'][0]
+        instance = _describe_batcher.submit(instance_id)
+        if instance:
             tags = instance.get('Tags', [])
             _log_aws_operation("get_instance_tags", instance_id, {
                 "tag_count": len(tags),
@@ -531,295 +1168,368 @@ def get_instance_tags(instance_id):
             })
             return tags
         _log_aws_operation("get_instance_tags", instance_id, {"error": "no_reservations_found"}, False)
-        return []
+        return None
     except Exception as e:
-        logger.error(f"AWS Error getting instance tags: {e}")
+        logger.error("AWS Error getting instance tags: %s", e)
         _log_aws_operation("get_instance_tags", instance_id, {"error": str(e)}, False, e)
-        return []
+        return None
 
 def get_power_schedule_tags(instance_id):
     """Get power schedule tags for an EC2 instance"""
-    tags = get_instance_tags(instance_id)
+    tags = _get_tag_dict(instance_id)
     schedule_tags = {}
     
-    for tag in tags:
-        if tag['Key'] == 'PowerScheduleOnTime':
-            schedule_tags['on_time'] = tag['Value']
-        elif tag['Key'] == 'PowerScheduleOffTime':
-            schedule_tags['off_time'] = tag['Value']
+    if 'PowerScheduleOnTime' in tags:
+        schedule_tags['on_time'] = tags['PowerScheduleOnTime']
+    if 'PowerScheduleOffTime' in tags:
+        schedule_tags['off_time'] = tags['PowerScheduleOffTime']
     
     _log_aws_operation("get_power_schedule_tags", instance_id, {
         "schedule_tags_found": schedule_tags
     })
     return schedule_tags
 
+def _aws_operation(operation, action, failure_details=None, failure_return=False):
+    """Decorator for AWS calls on an instance that turns an exception into a logged, audited failure
+
+    The wrapped function's first argument is the audit target. On an exception the error is logged
+    as "AWS Error <action> for <target>", audited as a FAILED operation (with failure_details(*args,
+    **kwargs) merged into the details when given) and failure_return is returned.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(target, *args, **kwargs):
+            try:
+                return fn(target, *args, **kwargs)
+            except Exception as e:
+                logger.error("AWS Error %s for %s: %s", action, target, e)
+                details = {"error": str(e)}
+                if failure_details is not None:
+                    details.update(failure_details(target, *args, **kwargs))
+                _log_aws_operation(operation, target, details, False, e)
+                return failure_return
+        return wrapper
+    return decorator
+
+# CreateTags accepts at most 50 tags per call
+_MAX_TAGS_PER_CALL = 50
+
+def _create_tags(instance_id, tags):
+    """Write tags ({Key: Value}) to an instance in one create_tags call and return the Tags list sent"""
+    tags_to_set = [{'Key': key, 'Value': value} for key, value in tags.items()]
+    _tag_writer.submit('create_tags', instance_id, tags_to_set)
+    invalidate(instance_id)
+    return tags_to_set
+
+@_aws_operation("set_instance_tags", "setting tags", lambda instance_id, tags: {"tags_set": list(tags)})
+def set_instance_tags(instance_id, tags):
+    """Set several tags ({Key: Value}) on an EC2 instance with a single create_tags call"""
+    if not tags:
+        logger.warning("No tags to set for instance %s", instance_id)
+        return False
+    if len(tags) > _MAX_TAGS_PER_CALL:
+        logger.error("Cannot set %s tags on %s: create_tags accepts at most %s", len(tags), instance_id, _MAX_TAGS_PER_CALL)
+        _log_aws_operation("set_instance_tags", instance_id, {"error": "too_many_tags", "tag_count": len(tags)}, False)
+        return False
+    tags_to_set = _create_tags(instance_id, tags)
+    
+    logger.info("Successfully set tags for %s: %s", instance_id, tags_to_set)
+    _log_aws_operation("set_instance_tags", instance_id, {
+        "tags_set": list(tags)
+    })
+    return True
+
+@_aws_operation("set_power_schedule_tags", "setting power schedule tags", lambda instance_id, on_time=None, off_time=None: {"on_time": on_time, "off_time": off_time})
 def set_power_schedule_tags(instance_id, on_time=None, off_time=None):
     """Set power schedule tags for an EC2 instance"""
-    try:
-        tags_to_set = []
-        
-        if on_time is not None:
-            tags_to_set.append({
-                'Key': 'PowerScheduleOnTime',
-                'Value': on_time
-            })
-        
-        if off_time is not None:
-            tags_to_set.append({
-                'Key': 'PowerScheduleOffTime',
-                'Value': off_time
-            })
-        
-        if not tags_to_set:
-            logger.warning(f"No tags to set for instance {instance_id}")
-            return False
-        
-        response = _get_ec2_client().create_tags(
-            Resources=[instance_id],
-            Tags=tags_to_set
-        )
-        
-        logger.info(f"Successfully set power schedule tags for {instance_id}: {tags_to_set}")
-        _log_aws_operation("set_power_schedule_tags", instance_id, {
-            "tags_set": [tag['Key'] for tag in tags_to_set],
-            "on_time": on_time,
-            "off_time": off_time
-        })
-        return True
-        
-    except Exception as e:
-        logger.error(f"AWS Error setting power schedule tags for {instance_id}: {e}")
-        _log_aws_operation("set_power_schedule_tags", instance_id, {
-            "error": str(e),
-            "on_time": on_time,
-            "off_time": off_time
-        }, False, e)
+    tags = {}
+    
+    if on_time is not None:
+        tags['PowerScheduleOnTime'] = on_time
+    
+    if off_time is not None:
+        tags['PowerScheduleOffTime'] = off_time
+    
+    if not tags:
+        logger.warning("No tags to set for instance %s", instance_id)
         return False
+    
+    tags_to_set = _create_tags(instance_id, tags)
+    
+    logger.info("Successfully set power schedule tags for %s: %s", instance_id, tags_to_set)
+    _log_aws_operation("set_power_schedule_tags", instance_id, {
+        "tags_set": [tag['Key'] for tag in tags_to_set],
+        "on_time": on_time,
+        "off_time": off_time
+    })
+    return True
 
+@_aws_operation("delete_power_schedule_tags", "deleting power schedule tags")
 def delete_power_schedule_tags(instance_id):
     """Delete power schedule tags for an EC2 instance"""
-    try:
-        response = _get_ec2_client().delete_tags(
-            Resources=[instance_id],
-            Tags=[
-                {'Key': 'PowerScheduleOnTime'},
-                {'Key': 'PowerScheduleOffTime'}
-            ]
-        )
-        
-        logger.info(f"Successfully deleted power schedule tags for {instance_id}")
-        _log_aws_operation("delete_power_schedule_tags", instance_id, {
-            "tags_deleted": ["PowerScheduleOnTime", "PowerScheduleOffTime"]
-        })
-        return True
-        
-    except Exception as e:
-        logger.error(f"AWS Error deleting power schedule tags for {instance_id}: {e}")
-        _log_aws_operation("delete_power_schedule_tags", instance_id, {
-            "error": str(e)
-        }, False, e)
-        return False
+    _tag_writer.submit('delete_tags', instance_id, [
+        {'Key': 'PowerScheduleOnTime'},
+        {'Key': 'PowerScheduleOffTime'}
+    ])
+    invalidate(instance_id)
+    
+    logger.info("Successfully deleted power schedule tags for %s", instance_id)
+    _log_aws_operation("delete_power_schedule_tags", instance_id, {
+        "tags_deleted": ["PowerScheduleOnTime", "PowerScheduleOffTime"]
+    })
+    return True
 
 def get_disable_schedule_tag(instance_id):
     """Get disable schedule tag for an EC2 instance"""
-    tags = get_instance_tags(instance_id)
+    value = _get_tag_dict(instance_id).get('PowerScheduleDisabledUntil')
     
-    for tag in tags:
-        if tag['Key'] == 'PowerScheduleDisabledUntil':
-            _log_aws_operation("get_disable_schedule_tag", instance_id, {
-                "disable_schedule_tag_found": tag['Value']
-            })
-            return tag['Value']
+    if value is not None:
+        _log_aws_operation("get_disable_schedule_tag", instance_id, {
+            "disable_schedule_tag_found": value
+        })
+        return value
     
     _log_aws_operation("get_disable_schedule_tag", instance_id, {
         "disable_schedule_tag_found": False
     })
     return None
 
+@_aws_operation("set_disable_schedule_tag", "setting disable schedule tag", lambda instance_id, disable_until=None: {"disable_until": disable_until})
 def set_disable_schedule_tag(instance_id, disable_until=None):
     """Set disable schedule tag for an EC2 instance"""
-    try:
-        tags_to_set = []
-        
-        if disable_until is not None:
-            tags_to_set.append({
-                'Key': 'PowerScheduleDisabledUntil',
-                'Value': disable_until
-            })
-        
-        if not tags_to_set:
-            logger.warning(f"No tags to set for instance {instance_id}")
-            return False
-        
-        response = _get_ec2_client().create_tags(
-            Resources=[instance_id],
-            Tags=tags_to_set
-        )
-        
-        logger.info(f"Successfully set disable schedule tag for {instance_id}: {tags_to_set}")
-        _log_aws_operation("set_disable_schedule_tag", instance_id, {
-            "tags_set": [tag['Key'] for tag in tags_to_set],
-            "disable_until": disable_until
-        })
-        return True
-        
-    except Exception as e:
-        logger.error(f"AWS Error setting disable schedule tag for {instance_id}: {e}")
-        _log_aws_operation("set_disable_schedule_tag", instance_id, {
-            "error": str(e),
-            "disable_until": disable_until
-        }, False, e)
+    if disable_until is None:
+        logger.warning("No tags to set for instance %s", instance_id)
         return False
+    
+    tags_to_set = _create_tags(instance_id, {'PowerScheduleDisabledUntil': disable_until})
+    
+    logger.info("Successfully set disable schedule tag for %s: %s", instance_id, tags_to_set)
+    _log_aws_operation("set_disable_schedule_tag", instance_id, {
+        "tags_set": [tag['Key'] for tag in tags_to_set],
+        "disable_until": disable_until
+    })
+    return True
 
+@_aws_operation("delete_disable_schedule_tag", "deleting disable schedule tag")
 def delete_disable_schedule_tag(instance_id):
     """Delete disable schedule tag for an EC2 instance"""
-    try:
-        response = _get_ec2_client().delete_tags(
-            Resources=[instance_id],
-            Tags=[
-                {'Key': 'PowerScheduleDisabledUntil'}
-            ]
-        )
-        
-        logger.info(f"Successfully deleted disable schedule tag for {instance_id}")
-        _log_aws_operation("delete_disable_schedule_tag", instance_id, {
-            "tags_deleted": ["PowerScheduleDisabledUntil"]
-        })
-        return True
-        
-    except Exception as e:
-        logger.error(f"AWS Error deleting disable schedule tag for {instance_id}: {e}")
-        _log_aws_operation("delete_disable_schedule_tag", instance_id, {
-            "error": str(e)
-        }, False, e)
-        return False
+    _tag_writer.submit('delete_tags', instance_id, [
+        {'Key': 'PowerScheduleDisabledUntil'}
+    ])
+    invalidate(instance_id)
+    
+    logger.info("Successfully deleted disable schedule tag for %s", instance_id)
+    _log_aws_operation("delete_disable_schedule_tag", instance_id, {
+        "tags_deleted": ["PowerScheduleDisabledUntil"]
+    })
+    return True
 
 def get_stakeholders_tag(instance_id):
     """Get stakeholders tag for an EC2 instance"""
-    tags = get_instance_tags(instance_id)
+    return _stakeholders_tag_value(instance_id, _get_tag_dict(instance_id))
+
+def _stakeholders_tag_value(instance_id, tags):
+    """Read and audit the Stakeholders value from an instance's tag dict"""
+    value = tags.get('Stakeholders')
     
-    for tag in tags:
-        if tag['Key'] == 'Stakeholders':
-            _log_aws_operation("get_stakeholders_tag", instance_id, {
-                "stakeholders_tag_found": tag['Value']
-            })
-            return tag['Value']
+    if value is not None:
+        _log_aws_operation("get_stakeholders_tag", instance_id, {
+            "stakeholders_tag_found": value
+        })
+        return value
     
     _log_aws_operation("get_stakeholders_tag", instance_id, {
         "stakeholders_tag_found": False
     })
     return None
 
+def _parse_stakeholders(value):
+    """Parse a comma-separated Stakeholders tag value into a frozenset of user IDs"""
+    if not value:
+        return frozenset()
+    return frozenset(_STAKEHOLDER_RE.findall(value))
+
+def _get_stakeholders(instance_id):
+    """Get an instance's stakeholders as a frozenset parsed once per cached tag read, or None if the tags could not be read
+
+    A failed read is kept apart from an instance with no Stakeholders tag so it is not cached as
+    an empty set.
+    """
+    def parse():
+        tags = _lookup_tag_dict(instance_id)
+        if tags is None:
+            return None
+        return _parse_stakeholders(_stakeholders_tag_value(instance_id, tags))
+    return _cached(("get_stakeholders", instance_id), INSTANCE_CACHE_TTL_SECONDS, parse)
+
+@_aws_operation("set_stakeholders_tag", "setting stakeholders tag", lambda instance_id, stakeholders_list: {
+    "stakeholders_count": len(stakeholders_list),
+    "stakeholders": stakeholders_list
+})
 def set_stakeholders_tag(instance_id, stakeholders_list):
     """Set stakeholders tag for an EC2 instance"""
-    try:
-        # Convert list to comma-separated string
-        stakeholders_str = ','.join(stakeholders_list)
-        
-        tags_to_set = [{
-            'Key': 'Stakeholders',
-            'Value': stakeholders_str
-        }]
-        
-        response = _get_ec2_client().create_tags(
-            Resources=[instance_id],
-            Tags=tags_to_set
-        )
-        
-        logger.info(f"Successfully set stakeholders tag for {instance_id}: {stakeholders_str}")
+    # Convert list to comma-separated string, sorted so ordering alone never reads as a change
+    stakeholders_str = ','.join(sorted(stakeholders_list))
+    
+    # Skip the CreateTags call when the tag already holds exactly this value
+    cached_tags = _cache_peek(("get_tag_dict", instance_id), INSTANCE_CACHE_TTL_SECONDS)
+    if cached_tags is not None and cached_tags.get('Stakeholders') == stakeholders_str:
+        logger.info("Stakeholders tag for %s already set to %s, skipping write", instance_id, stakeholders_str)
         _log_aws_operation("set_stakeholders_tag", instance_id, {
-            "tags_set": [tag['Key'] for tag in tags_to_set],
-            "stakeholders_count": len(stakeholders_list),
-            "stakeholders": stakeholders_list
+            "action": "noop",
+            "stakeholders_count": len(stakeholders_list)
         })
         return True
-        
-    except Exception as e:
-        logger.error(f"AWS Error setting stakeholders tag for {instance_id}: {e}")
-        _log_aws_operation("set_stakeholders_tag", instance_id, {
-            "error": str(e),
-            "stakeholders_count": len(stakeholders_list),
-            "stakeholders": stakeholders_list
-        }, False, e)
-        return False
+    
+    tags_to_set = _create_tags(instance_id, {'Stakeholders': stakeholders_str})
+    
+    logger.info("Successfully set stakeholders tag for %s: %s", instance_id, stakeholders_str)
+    _log_aws_operation("set_stakeholders_tag", instance_id, {
+        "tags_set": [tag['Key'] for tag in tags_to_set],
+        "stakeholders_count": len(stakeholders_list),
+        "stakeholders": stakeholders_list
+    })
+    return True
 
+@_aws_operation("delete_stakeholders_tag", "deleting stakeholders tag")
 def delete_stakeholders_tag(instance_id):
     """Delete stakeholders tag for an EC2 instance"""
-    try:
-        response = _get_ec2_client().delete_tags(
-            Resources=[instance_id],
-            Tags=[
-                {'Key': 'Stakeholders'}
-            ]
-        )
-        
-        logger.info(f"Successfully deleted stakeholders tag for {instance_id}")
-        _log_aws_operation("delete_stakeholders_tag", instance_id, {
-            "tags_deleted": ["Stakeholders"]
-        })
-        return True
-        
-    except Exception as e:
-        logger.error(f"AWS Error deleting stakeholders tag for {instance_id}: {e}")
-        _log_aws_operation("delete_stakeholders_tag", instance_id, {
-            "error": str(e)
-        }, False, e)
-        return False
+    _tag_writer.submit('delete_tags', instance_id, [
+        {'Key': 'Stakeholders'}
+    ])
+    invalidate(instance_id)
+    
+    logger.info("Successfully deleted stakeholders tag for %s", instance_id)
+    _log_aws_operation("delete_stakeholders_tag", instance_id, {
+        "tags_deleted": ["Stakeholders"]
+    })
+    return True
+
+# Most stakeholders an instance can have
+_MAX_STAKEHOLDERS = 10
+
+class _StakeholderEditBatcher:
+    """Coalesce concurrent stakeholder edits on the same instance into one tag write.
+
+    Same group-commit scheme as _DescribeBatcher, per instance: edits queued while an instance's
+    read-modify-write is in flight are applied together, in arrival order, in the next one. Concurrent
+    adds and removes then cost a single CreateTags and cannot overwrite each other's changes.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._in_flight = set()
+
+    def submit(self, instance_id, action, user_id):
+        """Apply action ('add' or 'remove') for user_id and return (result, previous_count, new_count)"""
+        future = Future()
+        with self._cond:
+            self._pending.setdefault(instance_id, []).append((action, user_id, future))
+            while instance_id in self._in_flight and not future.done():
+                self._cond.wait()
+            if future.done():
+                return _batched_result(future)
+            self._in_flight.add(instance_id)
+            edits = self._pending.pop(instance_id)
+        try:
+            self._apply(instance_id, edits)
+        finally:
+            with self._cond:
+                self._in_flight.discard(instance_id)
+                self._cond.notify_all()
+        return _batched_result(future)
+
+    def _apply(self, instance_id, edits):
+        try:
+            stakeholders = original = _get_stakeholders(instance_id)
+            if original is None:
+                # Without the current tag a write would replace every existing stakeholder
+                error = LookupError(f"could not read stakeholders for {instance_id}")
+                for _, _, future in edits:
+                    _settle(future, error=error)
+                return
+            outcomes = []
+            for action, user_id, future in edits:
+                previous_count = len(stakeholders)
+                if action == 'add':
+                    if user_id in stakeholders:
+                        result = "already_stakeholder"
+                    elif previous_count >= _MAX_STAKEHOLDERS:
+                        result = "max_limit_reached"
+                    else:
+                        stakeholders = stakeholders | {user_id}
+                        result = "added"
+                elif user_id in stakeholders:
+                    stakeholders = stakeholders - {user_id}
+                    result = "removed"
+                else:
+                    result = "not_stakeholder"
+                outcomes.append((future, result, previous_count, len(stakeholders)))
+            
+            # One write for the whole batch; the tag is deleted outright once nobody is left
+            if stakeholders == original:
+                written = True
+            elif stakeholders:
+                written = set_stakeholders_tag(instance_id, sorted(stakeholders))
+            else:
+                written = delete_stakeholders_tag(instance_id)
+        except Exception as e:
+            for _, _, future in edits:
+                _settle(future, error=e)
+            return
+        for future, result, previous_count, new_count in outcomes:
+            if result in ("added", "removed") and not written:
+                result = "failed"
+            elif result == "removed" and not new_count and not stakeholders:
+                result = "removed_and_deleted_tag"
+            _settle(future, (result, previous_count, new_count))
+
+_stakeholder_editor = _StakeholderEditBatcher()
 
 def add_stakeholder(instance_id, user_id):
     """Add a stakeholder to an EC2 instance"""
     try:
-        # Get current stakeholders
-        current_stakeholders_str = get_stakeholders_tag(instance_id)
-        current_stakeholders = []
-        
-        if current_stakeholders_str:
-            current_stakeholders = [s.strip() for s in current_stakeholders_str.split(',') if s.strip()]
+        result, previous_count, new_count = _stakeholder_editor.submit(instance_id, 'add', user_id)
         
-        # Check if user is already a stakeholder
-        if user_id in current_stakeholders:
-            logger.info(f"User {user_id} is already a stakeholder for instance {instance_id}")
+        if result == "already_stakeholder":
+            logger.info("User %s is already a stakeholder for instance %s", user_id, instance_id)
             _log_aws_operation("add_stakeholder", instance_id, {
                 "user_id": user_id,
                 "action": "already_stakeholder",
-                "current_stakeholders_count": len(current_stakeholders)
+                "current_stakeholders_count": previous_count
             })
             return True, "already_stakeholder"
         
-        # Check if we're at the maximum limit
-        if len(current_stakeholders) >= 10:
-            logger.warning(f"Cannot add stakeholder {user_id} to instance {instance_id}: max limit reached")
+        if result == "max_limit_reached":
+            logger.warning("Cannot add stakeholder %s to instance %s: max limit reached", user_id, instance_id)
             _log_aws_operation("add_stakeholder", instance_id, {
                 "user_id": user_id,
                 "action": "max_limit_reached",
-                "current_stakeholders_count": len(current_stakeholders)
+                "current_stakeholders_count": previous_count
             }, False)
             return False, "max_limit_reached"
         
-        # Add new stakeholder
-        new_stakeholders = current_stakeholders + [user_id]
-        success = set_stakeholders_tag(instance_id, new_stakeholders)
-        
-        if success:
-            logger.info(f"Successfully added stakeholder {user_id} to instance {instance_id}")
+        if result == "added":
+            logger.info("Successfully added stakeholder %s to instance %s", user_id, instance_id)
             _log_aws_operation("add_stakeholder", instance_id, {
                 "user_id": user_id,
                 "action": "added",
-                "previous_stakeholders_count": len(current_stakeholders),
-                "new_stakeholders_count": len(new_stakeholders)
+                "previous_stakeholders_count": previous_count,
+                "new_stakeholders_count": new_count
             })
             return True, "added"
         else:
-            logger.error(f"Failed to add stakeholder {user_id} to instance {instance_id}")
+            logger.error("Failed to add stakeholder %s to instance %s", user_id, instance_id)
             _log_aws_operation("add_stakeholder", instance_id, {
                 "user_id": user_id,
                 "action": "failed",
-                "current_stakeholders_count": len(current_stakeholders)
+                "current_stakeholders_count": previous_count
             }, False)
             return False, "failed"
             
     except Exception as e:
-        logger.error(f"Error adding stakeholder {user_id} to instance {instance_id}: {e}")
+        logger.error("Error adding stakeholder %s to instance %s: %s", user_id, instance_id, e)
         _log_aws_operation("add_stakeholder", instance_id, {
             "user_id": user_id,
             "action": "error",
@@ -830,54 +1540,37 @@ def add_stakeholder(instance_id, user_id):
 def remove_stakeholder(instance_id, user_id):
     """Remove a stakeholder from an EC2 instance"""
     try:
-        # Get current stakeholders
-        current_stakeholders_str = get_stakeholders_tag(instance_id)
-        current_stakeholders = []
+        result, previous_count, new_count = _stakeholder_editor.submit(instance_id, 'remove', user_id)
         
-        if current_stakeholders_str:
-            current_stakeholders = [s.strip() for s in current_stakeholders_str.split(',') if s.strip()]
-        
-        # Check if user is a stakeholder
-        if user_id not in current_stakeholders:
-            logger.info(f"User {user_id} is not a stakeholder for instance {instance_id}")
+        if result == "not_stakeholder":
+            logger.info("User %s is not a stakeholder for instance %s", user_id, instance_id)
             _log_aws_operation("remove_stakeholder", instance_id, {
                 "user_id": user_id,
                 "action": "not_stakeholder",
-                "current_stakeholders_count": len(current_stakeholders)
+                "current_stakeholders_count": previous_count
             })
             return True, "not_stakeholder"
         
-        # Remove stakeholder
-        new_stakeholders = [s for s in current_stakeholders if s != user_id]
-        
-        # If no stakeholders remain, delete the tag entirely
-        if not new_stakeholders:
-            success = delete_stakeholders_tag(instance_id)
-            action = "removed_and_deleted_tag"
-        else:
-            success = set_stakeholders_tag(instance_id, new_stakeholders)
-            action = "removed"
-        
-        if success:
-            logger.info(f"Successfully removed stakeholder {user_id} from instance {instance_id}")
+        if result != "failed":
+            logger.info("Successfully removed stakeholder %s from instance %s", user_id, instance_id)
             _log_aws_operation("remove_stakeholder", instance_id, {
                 "user_id": user_id,
-                "action": action,
-                "previous_stakeholders_count": len(current_stakeholders),
-                "new_stakeholders_count": len(new_stakeholders)
+                "action": result,
+                "previous_stakeholders_count": previous_count,
+                "new_stakeholders_count": new_count
             })
-            return True, action
+            return True, result
         else:
-            logger.error(f"Failed to remove stakeholder {user_id} from instance {instance_id}")
+            logger.error("Failed to remove stakeholder %s from instance %s", user_id, instance_id)
             _log_aws_operation("remove_stakeholder", instance_id, {
                 "user_id": user_id,
                 "action": "failed",
-                "current_stakeholders_count": len(current_stakeholders)
+                "current_stakeholders_count": previous_count
             }, False)
             return False, "failed"
             
     except Exception as e:
-        logger.error(f"Error removing stakeholder {user_id} from instance {instance_id}: {e}")
+        logger.error("Error removing stakeholder %s from instance %s: %s", user_id, instance_id, e)
         _log_aws_operation("remove_stakeholder", instance_id, {
             "user_id": user_id,
             "action": "error",
@@ -888,25 +1581,21 @@ def remove_stakeholder(instance_id, user_id):
 def get_instances_by_stakeholder(user_id):
     """Get all instances where a user is a stakeholder"""
     try:
-        # Get all controllable instances
-        instances = get_controllable_instances()
+        # One paginated DescribeInstances narrowed server-side to instances whose Stakeholders tag
+        # mentions the user; the wildcard also matches longer IDs, so membership is checked here
+        # against the tags already in the response instead of re-describing each instance
+        filters = [_CONTROL_TAG_FILTER, {'Name': 'tag:Stakeholders', 'Values': [f'*{user_id}*']}]
         user_instances = []
         
-        for instance in instances:
-            instance_id = instance['InstanceId']
-            stakeholders_str = get_stakeholders_tag(instance_id)
-            
-            if stakeholders_str:
-                stakeholders = [s.strip() for s in stakeholders_str.split(',') if s.strip()]
-                if user_id in stakeholders:
-                    instance_name = get_instance_name(instance_id)
-                    user_instances.append({
-                        'instance_id': instance_id,
-                        'instance_name': instance_name,
-                        'state': get_instance_state(instance_id)
-                    })
+        for instance in filter(can_control_instance, _iter_all_instances(filters)):
+            if user_id in _parse_stakeholders(_tags_dict(instance).get('Stakeholders')):
+                user_instances.append({
+                    'instance_id': instance['InstanceId'],
+                    'instance_name': get_instance_name(instance['InstanceId'], instance=instance),
+                    'state': get_instance_state(instance['InstanceId'], instance=instance)
+                })
         
-        logger.info(f"Found {len(user_instances)} instances where user {user_id} is a stakeholder")
+        logger.info("Found %s instances where user %s is a stakeholder", len(user_instances), user_id)
         _log_aws_operation("get_instances_by_stakeholder", user_id, {
             "instances_found": len(user_instances),
             "instance_ids": [inst['instance_id'] for inst in user_instances]
@@ -914,7 +1603,7 @@ def get_instances_by_stakeholder(user_id):
         return user_instances
         
     except Exception as e:
-        logger.error(f"Error getting instances for stakeholder {user_id}: {e}")
+        logger.error("Error getting instances for stakeholder %s: %s", user_id, e)
         _log_aws_operation("get_instances_by_stakeholder", user_id, {
             "error": str(e)
         }, False, e)
@@ -924,15 +1613,18 @@ def is_user_stakeholder(instance_id, user_id):
     """Check if a user is a stakeholder for a specific instance"""
     try:
         # Get current stakeholders
-        current_stakeholders_str = get_stakeholders_tag(instance_id)
-        current_stakeholders = []
-        
-        if current_stakeholders_str:
-            current_stakeholders = [s.strip() for s in current_stakeholders_str.split(',') if s.strip()]
+        current_stakeholders = _get_stakeholders(instance_id)
+        if current_stakeholders is None:
+            logger.error("Could not read stakeholders for instance %s", instance_id)
+            _log_aws_operation("is_user_stakeholder", instance_id, {
+                "user_id": user_id,
+                "error": "tags_unavailable"
+            }, False)
+            return False
         
         is_stakeholder = user_id in current_stakeholders
         
-        logger.info(f"User {user_id} is {'a' if is_stakeholder else 'not a'} stakeholder for instance {instance_id}")
+        logger.info("User %s is %s stakeholder for instance %s", user_id, 'a' if is_stakeholder else 'not a', instance_id)
         _log_aws_operation("is_user_stakeholder", instance_id, {
             "user_id": user_id,
             "is_stakeholder": is_stakeholder,
@@ -941,7 +1633,7 @@ def is_user_stakeholder(instance_id, user_id):
         return is_stakeholder
         
     except Exception as e:
-        logger.error(f"Error checking if user {user_id} is stakeholder for instance {instance_id}: {e}")
+        logger.error("Error checking if user %s is stakeholder for instance %s: %s", user_id, instance_id, e)
         _log_aws_operation("is_user_stakeholder", instance_id, {
             "user_id": user_id,
             "error": str(e)
@@ -0,0 +1,18 @@
+import contextvars
+from datetime import datetime, timezone
+
+# Start time of the request being handled, set by the app for the duration of each request
+_request_now = contextvars.ContextVar('request_now', default=None)
+
+def start_request_clock():
+    """Fix the time request_now() returns for the current request, returning a token for stop_request_clock"""
+    return _request_now.set(datetime.now(timezone.utc))
+
+def stop_request_clock(token):
+    """Make request_now() read the live clock again"""
+    _request_now.reset(token)
+
+def request_now():
+    """Return the current request's start time in UTC, or the live time outside a request"""
+    now = _request_now.get()
+    return now if now is not None else datetime.now(timezone.utc)
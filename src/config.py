@@ -3,4 +3,22 @@ import os
 AWS_REGION = 'us-west-2'
 INSTANCE_NAME_SUFFIX = os.environ.get('INSTANCE_NAME_SUFFIX', 'aopstest.com')
 # Schedule configuration
-ON_TIME_LATEST_HOUR = int(os.environ.get('ON_TIME_LATEST_HOUR', 6))
\ No newline at end of file
+ON_TIME_LATEST_HOUR = int(os.environ.get('ON_TIME_LATEST_HOUR', 6))
+# Instance lookup cache configuration
+INSTANCE_CACHE_TTL_SECONDS = float(os.environ.get('INSTANCE_CACHE_TTL_SECONDS', 5))
+INSTANCE_CACHE_MAX_ENTRIES = int(os.environ.get('INSTANCE_CACHE_MAX_ENTRIES', 2048))
+SEARCH_INDEX_TTL_SECONDS = float(os.environ.get('SEARCH_INDEX_TTL_SECONDS', 30))
+# EC2 API client timeouts and total attempts per call (first try included); together they bound how long one call can block
+AWS_CONNECT_TIMEOUT_SECONDS = float(os.environ.get('AWS_CONNECT_TIMEOUT_SECONDS', 1))
+AWS_READ_TIMEOUT_SECONDS = float(os.environ.get('AWS_READ_TIMEOUT_SECONDS', 5))
+AWS_MAX_ATTEMPTS = int(os.environ.get('AWS_MAX_ATTEMPTS', 3))
+# Audit logging configuration (set EC2_CONTROLS_AUDIT=0 to disable AWS_AUDIT entries)
+AWS_AUDIT_ENABLED = os.environ.get('EC2_CONTROLS_AUDIT', '1') == '1'
+# Emit AWS_AUDIT entries in CloudWatch Embedded Metric Format (set EC2_CONTROLS_AUDIT_EMF=1)
+AWS_AUDIT_EMF = os.environ.get('EC2_CONTROLS_AUDIT_EMF', '0') == '1'
+# Create the EC2 client and open its connection at startup (set EC2_CONTROLS_WARMUP=1)
+AWS_CLIENT_WARMUP = os.environ.get('EC2_CONTROLS_WARMUP', '0') == '1'
+# Pod identity reported in audit and log entries; fixed for the life of the process
+POD_NAME = os.environ.get('HOSTNAME', 'unknown')
+POD_NAMESPACE = os.environ.get('POD_NAMESPACE', 'unknown')
+DEPLOYMENT_NAME = os.environ.get('DEPLOYMENT_NAME', 'unknown')
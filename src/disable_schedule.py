@@ -1,15 +1,21 @@
+import functools
 import logging
+import re
 from datetime import datetime, timezone, timedelta
 from dateutil import parser
 import json
-import os
 from src.aws_client import get_disable_schedule_tag, set_disable_schedule_tag, delete_disable_schedule_tag, can_control_instance_by_id
+from src.clock import request_now
+from src.config import POD_NAME, POD_NAMESPACE
 
 logger = logging.getLogger(__name__)
 
 def _log_disable_schedule_operation(operation, instance_id, details=None, success=True, error=None):
     """Log disable schedule operations for auditing purposes"""
-    timestamp = datetime.now(timezone.utc).isoformat()
+    # Audit entries are logged at INFO; skip building and serializing one that would be dropped
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    timestamp = request_now().isoformat()
     status = "SUCCESS" if success else "FAILED"
     log_entry = {
         'timestamp': timestamp,
@@ -17,20 +23,23 @@ def _log_disable_schedule_operation(operation, instance_id, details=None, succes
         'instance_id': instance_id,
         'details': details,
         'status': status,
-        'pod_name': os.environ.get('HOSTNAME', 'unknown'),
-        'namespace': os.environ.get('POD_NAMESPACE', 'unknown')
+        'pod_name': POD_NAME,
+        'namespace': POD_NAMESPACE
     }
     if error:
         log_entry['error'] = str(error)
     
-    logger.info(f"DISABLE_SCHEDULE_AUDIT: {json.dumps(log_entry)}")
+    logger.info("DISABLE_SCHEDULE_AUDIT: %s", json.dumps(log_entry))
 
+# Real inputs are a handful of durations, so each distinct string is parsed, logged and audited
+# once; invalid strings are cached as None too so repeats of them cost a lookup as well
+@functools.lru_cache(maxsize=64)
 def parse_hours(hours_str):
     """Parse hours string in 'Nh' format (e.g., '2h', '24h')"""
     try:
         # Handle None or empty input
         if not hours_str or not hours_str.strip():
-            logger.error(f"Empty or None hours string provided")
+            logger.error("Empty or None hours string provided")
             _log_disable_schedule_operation("parse_hours", "hours", {"hours_str": hours_str, "error": "empty_input"}, False)
             return None
         
@@ -39,7 +48,7 @@ def parse_hours(hours_str):
         
         # Check if it ends with 'h'
         if not hours_str.endswith('h'):
-            logger.error(f"Hours string must end with 'h': {hours_str}")
+            logger.error("Hours string must end with 'h': %s", hours_str)
             _log_disable_schedule_operation("parse_hours", "hours", {"hours_str": hours_str, "error": "must_end_with_h"}, False)
             return None
         
@@ -47,29 +56,46 @@ def parse_hours(hours_str):
         try:
             hours = int(hours_str[:-1])
         except ValueError:
-            logger.error(f"Invalid number in hours string: {hours_str}")
+            logger.error("Invalid number in hours string: %s", hours_str)
             _log_disable_schedule_operation("parse_hours", "hours", {"hours_str": hours_str, "error": "invalid_number"}, False)
             return None
         
         # Validate minimum 1 hour
         if hours < 1:
-            logger.error(f"Hours must be at least 1: {hours}")
+            logger.error("Hours must be at least 1: %s", hours)
             _log_disable_schedule_operation("parse_hours", "hours", {"hours_str": hours_str, "hours": hours, "error": "below_minimum"}, False)
             return None
         
-        logger.info(f"Successfully parsed hours '{hours_str}' to {hours}")
+        logger.info("Successfully parsed hours '%s' to %s", hours_str, hours)
         return hours
     except Exception as e:
-        logger.error(f"Error parsing hours '{hours_str}': {e}")
+        logger.error("Error parsing hours '%s': %s", hours_str, e)
         _log_disable_schedule_operation("parse_hours", "hours", {"hours_str": hours_str, "error": str(e)}, False)
         return None
 
+# The exact form set_disable_schedule writes: UTC isoformat() with or without microseconds
+_DISABLE_UNTIL_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})T([0-9]{2}):([0-9]{2}):([0-9]{2})(?:\.([0-9]{6}))?\+00:00')
 
+# The tag holds one value per pause, so repeated reads of it share a single parse
+@functools.lru_cache(maxsize=1024)
+def _parse_disable_until(value):
+    """Parse a PowerScheduleDisabledUntil tag value, assuming UTC when it has no offset"""
+    match = _DISABLE_UNTIL_RE.fullmatch(value)
+    if match:
+        try:
+            return datetime(*(int(part) for part in match.groups('0')), tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    # Anything else, such as a hand-edited tag, goes through the general parser
+    disable_datetime = datetime.fromisoformat(value)
+    if disable_datetime.tzinfo is None:
+        disable_datetime = disable_datetime.replace(tzinfo=timezone.utc)
+    return disable_datetime
 
 def get_disable_schedule(instance_id):
     """Get disable schedule for an instance from EC2 tags"""
     try:
-        logger.info(f"Getting disable schedule for instance {instance_id} from EC2 tags")
+        logger.info("Getting disable schedule for instance %s from EC2 tags", instance_id)
         disable_until = get_disable_schedule_tag(instance_id)
         
         if not disable_until:
@@ -81,10 +107,7 @@ def get_disable_schedule(instance_id):
         
         # Parse the datetime string back to datetime object
         try:
-            disable_datetime = datetime.fromisoformat(disable_until)
-            if disable_datetime.tzinfo is None:
-                # Assume UTC if no timezone specified
-                disable_datetime = disable_datetime.replace(tzinfo=timezone.utc)
+            disable_datetime = _parse_disable_until(disable_until)
         except ValueError:
             _log_disable_schedule_operation("get_disable_schedule", instance_id, {
                 "error": "invalid_datetime_format",
@@ -100,7 +123,7 @@ def get_disable_schedule(instance_id):
         return disable_datetime
         
     except Exception as e:
-        logger.error(f"Error getting disable schedule for {instance_id}: {e}")
+        logger.error("Error getting disable schedule for %s: %s", instance_id, e)
         _log_disable_schedule_operation("get_disable_schedule", instance_id, {
             "error": str(e)
         }, False, e)
@@ -109,11 +132,11 @@ def get_disable_schedule(instance_id):
 def set_disable_schedule(instance_id, hours):
     """Set disable schedule for an instance using EC2 tags"""
     try:
-        logger.info(f"Setting disable schedule for instance {instance_id} for {hours} hours")
+        logger.info("Setting disable schedule for instance %s for %s hours", instance_id, hours)
         
         # Check if instance can be controlled by this service
         if not can_control_instance_by_id(instance_id):
-            logger.error(f"Cannot set disable schedule for instance {instance_id}: not authorized to control this instance")
+            logger.error("Cannot set disable schedule for instance %s: not authorized to control this instance", instance_id)
             _log_disable_schedule_operation("set_disable_schedule", instance_id, {
                 "error": "instance_not_controllable",
                 "hours": hours
@@ -121,7 +144,7 @@ def set_disable_schedule(instance_id, hours):
             return False
         
         # Calculate disable until datetime (current time + hours)
-        now = datetime.now(timezone.utc)
+        now = request_now()
         disable_until = now + timedelta(hours=hours)
         
         # Format datetime for EC2 tags (ISO format)
@@ -146,7 +169,7 @@ def set_disable_schedule(instance_id, hours):
         return success
         
     except Exception as e:
-        logger.error(f"Error setting disable schedule for {instance_id}: {e}")
+        logger.error("Error setting disable schedule for %s: %s", instance_id, e)
         _log_disable_schedule_operation("set_disable_schedule", instance_id, {
             "error": str(e),
             "hours": hours
@@ -156,11 +179,11 @@ def set_disable_schedule(instance_id, hours):
 def delete_disable_schedule(instance_id):
     """Delete disable schedule for an instance by removing EC2 tags"""
     try:
-        logger.info(f"Deleting disable schedule for instance {instance_id}")
+        logger.info("Deleting disable schedule for instance %s", instance_id)
         
         # Check if instance can be controlled by this service
         if not can_control_instance_by_id(instance_id):
-            logger.error(f"Cannot delete disable schedule for instance {instance_id}: not authorized to control this instance")
+            logger.error("Cannot delete disable schedule for instance %s: not authorized to control this instance", instance_id)
             _log_disable_schedule_operation("delete_disable_schedule", instance_id, {
                 "error": "instance_not_controllable"
             }, False)
@@ -181,7 +204,7 @@ def delete_disable_schedule(instance_id):
         return success
         
     except Exception as e:
-        logger.error(f"Error deleting disable schedule for {instance_id}: {e}")
+        logger.error("Error deleting disable schedule for %s: %s", instance_id, e)
         _log_disable_schedule_operation("delete_disable_schedule", instance_id, {
             "error": str(e)
         }, False, e)
@@ -193,7 +216,7 @@ def format_disable_schedule_display(disable_datetime):
         return "Not paused right now"
     
     # Calculate remaining time
-    now = datetime.now(timezone.utc)
+    now = request_now()
     if now >= disable_datetime:
         return "Not paused right now"
     
@@ -217,12 +240,12 @@ def is_schedule_disabled(instance_id):
             return False
         
         # Check if the disable period has expired
-        now = datetime.now(timezone.utc)
+        now = request_now()
         is_disabled = now < disable_until
         
-        logger.info(f"Schedule disable check for {instance_id}: disabled until {disable_until}, currently disabled: {is_disabled}")
+        logger.info("Schedule disable check for %s: disabled until %s, currently disabled: %s", instance_id, disable_until, is_disabled)
         return is_disabled
         
     except Exception as e:
-        logger.error(f"Error checking if schedule is disabled for {instance_id}: {e}")
+        logger.error("Error checking if schedule is disabled for %s: %s", instance_id, e)
         return False 
\ No newline at end of file
@@ -3,12 +3,12 @@ import re
 import json
 from datetime import datetime, time, timezone
 from flask import jsonify
-from src.aws_client import get_instance_state, start_instance, stop_instance, restart_instance, resolve_instance_identifier, get_instance_name, fuzzy_search_instances, can_control_instance_by_id, add_stakeholder, remove_stakeholder, is_user_stakeholder
+from src.aws_client import get_instance_state, get_instances_bulk, start_instance, stop_instance, restart_instance, is_valid_transition, submit_power_action, resolve_instance_identifier, get_instance_name, fuzzy_search_instances, can_control_instance_by_id, add_stakeholder, remove_stakeholder, is_user_stakeholder
 from src.auth import get_all_region_instances
 from src.schedule import parse_time, get_schedule, set_schedule, format_schedule_display, delete_schedule
 from src.disable_schedule import parse_hours, get_disable_schedule, set_disable_schedule, delete_disable_schedule, format_disable_schedule_display
-import os
 from src.config import ON_TIME_LATEST_HOUR
+from src.config import POD_NAME, POD_NAMESPACE, DEPLOYMENT_NAME
 
 logger = logging.getLogger(__name__)
 
@@ -25,8 +25,14 @@ ACTION_ALIASES_STAKEHOLDER = {
 	'check': {'check', 'status', 'show', 'view', 'see', 'info', 'get', 'stat'}
 }
 
-ALIASES_SCHEDULE_CLEAR = {'clear', 'reset', 'unset', 'no', 'remove', 'delete', 'none', 'empty'}
-ALIASES_DISABLE_CANCEL = {'cancel', 'clear', 'reset', 'unset', 'no', 'remove', 'delete', 'resume', 'enable', 're-enable', 'reenable', 'unpause', 'continue'}
+ALIASES_SCHEDULE_CLEAR = frozenset({'clear', 'reset', 'unset', 'no', 'remove', 'delete', 'none', 'empty'})
+ALIASES_DISABLE_CANCEL = frozenset({'cancel', 'clear', 'reset', 'unset', 'no', 'remove', 'delete', 'resume', 'enable', 're-enable', 'reenable', 'unpause', 'continue'})
+
+# Power command text: an instance identifier and an optional power state, whitespace-separated
+_POWER_COMMAND_RE = re.compile(r'(\S+)(?:\s+(\S+))?')
+
+# EC2 instance IDs: i- followed by 8 or 17 lowercase hex characters
+_INSTANCE_ID_RE = re.compile(r'i-(?:[0-9a-f]{8}|[0-9a-f]{17})')
 
 
 def normalize_command(value, alias_map):
@@ -38,7 +44,31 @@ def normalize_command(value, alias_map):
 			return canonical
 	return v
 
-def _log_user_action(user_id, user_name, action, target, details=None, success=True):
+def _apply_power_action(action_fn, action, instance_id, current_state, user_id, user_name):
+    """Apply a power action without waiting on EC2 when current_state allows it
+
+    Valid transitions are queued on the background pool and reported as requested, so the Slack
+    response does not wait for the mutation; if EC2 then fails it, a WARNING audit entry names
+    the requesting user. Others are run inline, where they are rejected without an EC2 call and
+    return False so the caller can say why.
+    """
+    if not is_valid_transition(action, current_state):
+        return action_fn(instance_id)
+    
+    def report_failure(future):
+        error = future.exception()
+        if error is None and future.result():
+            return
+        logger.warning("Background %s of instance %s requested by %s failed: %s", action, instance_id, user_id, error or "aws_operation_failed")
+        _log_user_action(user_id, user_name, f"ec2_power_{action}_failed", instance_id, {
+            "previous_state": current_state,
+            "error": str(error) if error else "aws_operation_failed"
+        }, False, level=logging.WARNING)
+    
+    submit_power_action(action_fn, instance_id).add_done_callback(report_failure)
+    return True
+
+def _log_user_action(user_id, user_name, action, target, details=None, success=True, level=logging.INFO):
     """Log user actions for auditing purposes"""
     timestamp = datetime.now(timezone.utc).isoformat()
     status = "SUCCESS" if success else "FAILED"
@@ -50,17 +80,16 @@ def _log_user_action(user_id, user_name, action, target, details=None, success=T
         'target': target,
         'details': details,
         'status': status,
-        'pod_name': os.environ.get('HOSTNAME', 'unknown'),
-        'namespace': os.environ.get('POD_NAMESPACE', 'unknown'),
-        'deployment': os.environ.get('DEPLOYMENT_NAME', 'unknown')
+        'pod_name': POD_NAME,
+        'namespace': POD_NAMESPACE,
+        'deployment': DEPLOYMENT_NAME
     }
-    logger.info(f"AUDIT: {json.dumps(log_entry)}")
+    logger.log(level, f"AUDIT: {json.dumps(log_entry)}")
 
 def _is_valid_instance_id(instance_id):
     """Validate EC2 instance ID format"""
-    # EC2 instance IDs follow pattern: i- followed by 8 or 17 hex characters
-    pattern = r'^i-[0-9a-f]{8}$|^i-[0-9a-f]{17}$'
-    return bool(re.match(pattern, instance_id))
+    # Only the two valid lengths reach the regex, so names are rejected without running it
+    return len(instance_id) in (10, 19) and _INSTANCE_ID_RE.fullmatch(instance_id) is not None
 
 def handle_ec2_power(request):
     """Handle the EC2 power control endpoint"""
@@ -69,11 +98,11 @@ def handle_ec2_power(request):
     text = request.form.get('text', '').strip()
     
     # Parse text: "instance-id" or "instance-name" or "instance-id on" or "instance-name on"
-    parts = text.split()
+    match = _POWER_COMMAND_RE.fullmatch(text)
     
-    if len(parts) == 1:
+    if match and match.group(2) is None:
         # Just instance identifier - return current state
-        instance_identifier = parts[0]
+        instance_identifier = match.group(1)
         
         # Resolve to instance ID
         instance_id = resolve_instance_identifier(instance_identifier)
@@ -104,9 +133,9 @@ def handle_ec2_power(request):
             }, False)
             return f"Instance `{instance_identifier}` not found"
     
-    elif len(parts) == 2:
+    elif match:
         # Instance identifier and power state - change state
-        instance_identifier, power_state = parts
+        instance_identifier, power_state = match.groups()
         
         # Normalize power state using aliases
         power_state = normalize_command(power_state, ACTION_ALIASES_POWER)
@@ -121,7 +150,7 @@ def handle_ec2_power(request):
             }, False)
             return f"Instance `{instance_identifier}` not found"
         
-        if power_state not in ['on', 'off', 'restart']:
+        if power_state not in ACTION_ALIASES_POWER:
             _log_user_action(user_id, user_name, "ec2_power_change", instance_id, {
                 "power_state": power_state,
                 "error": "invalid_power_state"
@@ -153,10 +182,10 @@ def handle_ec2_power(request):
         # Respond immediately
         response = jsonify({
             'response_type': 'ephemeral',
-            'text': f"Set `{display_name}` ({instance_id}) to {power_state}"
+            'text': f"Requested {power_state} for `{display_name}` ({instance_id})"
         })
         
-        # Then do the AWS operation using the resolved instance ID
+        # Then validate the state change and hand the AWS operation to the background pool
         logger.info(f"Calling get_instance_state with resolved instance_id: {instance_id}")
         current_state = get_instance_state(instance_id)
         if current_state:
@@ -164,7 +193,7 @@ def handle_ec2_power(request):
             
             # Change the state
             if power_state == 'on':
-                success = start_instance(instance_id)
+                success = _apply_power_action(start_instance, 'start', instance_id, current_state, user_id, user_name)
                 # Check for specific error cases and provide user-friendly messages
                 if not success:
                     if current_state == 'running':
@@ -182,19 +211,13 @@ def handle_ec2_power(request):
                             'response_type': 'ephemeral',
                             'text': f"Cannot start `{display_name}` ({instance_id}) - instance is currently stopping"
                         })
-                    elif current_state == 'stopped':
-                        # This should succeed, but if it doesn't, it's likely an AWS error
-                        response = jsonify({
-                            'response_type': 'ephemeral',
-                            'text': f"Failed to start `{display_name}` ({instance_id}) - please try again"
-                        })
                     else:
                         response = jsonify({
                             'response_type': 'ephemeral',
                             'text': f"Cannot start `{display_name}` ({instance_id}) - instance is in an invalid state ({current_state})"
                         })
             elif power_state == 'off':
-                success = stop_instance(instance_id)
+                success = _apply_power_action(stop_instance, 'stop', instance_id, current_state, user_id, user_name)
                 # Check for specific error cases and provide user-friendly messages
                 if not success:
                     if current_state == 'stopped':
@@ -212,19 +235,13 @@ def handle_ec2_power(request):
                             'response_type': 'ephemeral',
                             'text': f"Cannot stop `{display_name}` ({instance_id}) - instance is currently starting"
                         })
-                    elif current_state == 'running':
-                        # This should succeed, but if it doesn't, it's likely an AWS error
-                        response = jsonify({
-                            'response_type': 'ephemeral',
-                            'text': f"Failed to stop `{display_name}` ({instance_id}) - please try again"
-                        })
                     else:
                         response = jsonify({
                             'response_type': 'ephemeral',
                             'text': f"Cannot stop `{display_name}` ({instance_id}) - instance is in an invalid state ({current_state})"
                         })
             elif power_state == 'restart':
-                success = restart_instance(instance_id)
+                success = _apply_power_action(restart_instance, 'restart', instance_id, current_state, user_id, user_name)
                 # Check for specific error cases and provide user-friendly messages
                 if not success:
                     if current_state == 'stopped':
@@ -242,12 +259,6 @@ def handle_ec2_power(request):
                             'response_type': 'ephemeral',
                             'text': f"Cannot restart `{display_name}` ({instance_id}) - instance is currently stopping"
                         })
-                    elif current_state == 'running':
-                        # This should succeed, but if it doesn't, it's likely an AWS error
-                        response = jsonify({
-                            'response_type': 'ephemeral',
-                            'text': f"Failed to restart `{display_name}` ({instance_id}) - please try again"
-                        })
                     else:
                         response = jsonify({
                             'response_type': 'ephemeral',
@@ -288,12 +299,13 @@ def handle_list_instances(request):
         _log_user_action(user_id, user_name, "list_instances", "all", {"instance_count": 0})
         return f"No controllable instances found in the AWS region. Add the `EC2ControlsEnabled` tag with a truthy value to instances you want to control."
     
-    # Get current state for each instance
+    # Describe all instances in one batched call, then read each state and name from it
+    bulk = get_instances_bulk(instances)
     instance_states = []
     instance_details = []
     for instance_id in instances:
-        state = get_instance_state(instance_id)
-        instance_name = get_instance_name(instance_id)
+        state = get_instance_state(instance_id, bulk=bulk)
+        instance_name = get_instance_name(instance_id, bulk=bulk)
         
         instance_detail = {
             "instance_id": instance_id,
@@ -765,7 +777,7 @@ def handle_ec2_stakeholder(request):
     action = normalize_command(action, ACTION_ALIASES_STAKEHOLDER)
     
     # Validate action
-    if action not in ['claim', 'remove', 'check']:
+    if action not in ACTION_ALIASES_STAKEHOLDER:
         _log_user_action(user_id, user_name, "ec2_stakeholder", instance_identifier, {
             "error": "invalid_action",
             "action": action
@@ -2,13 +2,16 @@ import logging
 from datetime import datetime, time, timezone
 from dateutil import parser
 import json
-import os
 from src.aws_client import get_power_schedule_tags, set_power_schedule_tags, delete_power_schedule_tags, can_control_instance_by_id
+from src.config import POD_NAME, POD_NAMESPACE
 
 logger = logging.getLogger(__name__)
 
 def _log_schedule_operation(operation, instance_id, details=None, success=True, error=None):
     """Log schedule operations for auditing purposes"""
+    # Audit entries are logged at INFO; skip building and serializing one that would be dropped
+    if not logger.isEnabledFor(logging.INFO):
+        return
     timestamp = datetime.now(timezone.utc).isoformat()
     status = "SUCCESS" if success else "FAILED"
     log_entry = {
@@ -17,13 +20,13 @@ def _log_schedule_operation(operation, instance_id, details=None, success=True,
         'instance_id': instance_id,
         'details': details,
         'status': status,
-        'pod_name': os.environ.get('HOSTNAME', 'unknown'),
-        'namespace': os.environ.get('POD_NAMESPACE', 'unknown')
+        'pod_name': POD_NAME,
+        'namespace': POD_NAMESPACE
     }
     if error:
         log_entry['error'] = str(error)
     
-    logger.info(f"SCHEDULE_AUDIT: {json.dumps(log_entry)}")
+    logger.info("SCHEDULE_AUDIT: %s", json.dumps(log_entry))
 
 def parse_time(time_str):
     """Parse time string to time object, supporting various formats"""
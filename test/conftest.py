@@ -0,0 +1,12 @@
+import pytest
+from src import aws_client
+from src.disable_schedule import parse_hours
+
+@pytest.fixture(autouse=True)
+def clear_instance_cache():
+    """Keep cached AWS lookups and parsed inputs from leaking between tests"""
+    aws_client.invalidate()
+    parse_hours.cache_clear()
+    yield
+    aws_client.invalidate()
+    parse_hours.cache_clear()
@@ -1,6 +1,9 @@
+import io
+import json
+import logging
 import pytest
 from unittest.mock import Mock, patch
-from app import app
+from app import app, BufferedStreamHandler
 
 @pytest.fixture
 def client():
@@ -120,4 +123,53 @@ def test_search_endpoint_empty_term(client):
     })
     
     assert response.status_code == 200
-    assert "Please provide a search term" in response.get_data(as_text=True) 
\ No newline at end of file
+    assert "Please provide a search term" in response.get_data(as_text=True)
+
+
+def test_buffered_stream_handler_batches_writes():
+    """Test log records are written in batches, with warnings flushed immediately"""
+    stream = Mock(wraps=io.StringIO())
+    handler = BufferedStreamHandler(stream, buffer_size=1024, flush_interval=60)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    record = lambda level, msg: logging.LogRecord('test', level, __file__, 1, msg, None, None)
+    
+    handler.handle(record(logging.INFO, 'first'))
+    handler.handle(record(logging.INFO, 'second'))
+    assert stream.write.call_count == 0
+    
+    handler.handle(record(logging.WARNING, 'failure'))
+    stream.write.assert_called_once_with('first\nsecond\nfailure\n')
+    
+    handler.handle(record(logging.INFO, 'x' * 2048))
+    assert stream.write.call_count == 2
+    
+    handler.handle(record(logging.INFO, 'last'))
+    handler.close()
+    assert stream.getvalue().endswith('last\n')
+
+def test_request_clock_fixed_for_request():
+    """Test request_now() returns the request's start time during a request and the live time after it"""
+    from src.clock import request_now, _request_now
+    
+    with app.test_request_context('/health'):
+        app.preprocess_request()
+        started = request_now()
+        assert request_now() is started
+    
+    assert _request_now.get() is None
+    assert request_now() is not started
+
+def test_structured_formatter_serializes_audit_entry_once():
+    """Test AWS audit records are formatted from their dict without re-parsing the message"""
+    from app import StructuredFormatter
+    from src.aws_client import _AuditJson
+    
+    entry = {'aws_operation': 'start_instances', 'status': 'SUCCESS'}
+    record = logging.LogRecord('src.aws_client', logging.INFO, __file__, 1, "AWS_AUDIT: %s", (_AuditJson(entry),), None)
+    record.audit = entry
+    
+    with patch('app.json.loads') as mock_loads:
+        formatted = StructuredFormatter().format(record)
+        mock_loads.assert_not_called()
+    assert json.loads(formatted) == {'aws_operation': 'start_instances', 'status': 'SUCCESS', 'level': 'INFO', 'logger': 'src.aws_client'}
+    assert json.loads(record.getMessage()[len('AWS_AUDIT: '):]) == entry
@@ -13,6 +13,7 @@ app = Flask(__name__)
 def test_list_instances_with_instances():
     """Test listing instances with valid instances"""
     with patch('src.handlers.get_all_region_instances') as mock_get_instances, \
+         patch('src.handlers.get_instances_bulk'), \
          patch('src.handlers.get_instance_state') as mock_get_state, \
          patch('src.handlers.get_instance_name') as mock_get_name:
         
@@ -30,6 +31,27 @@ def test_list_instances_with_instances():
         assert "running" in result
         assert "stopped" in result
 
+def test_list_instances_uses_one_bulk_lookup():
+    """Test listing instances reads every state and name from a single bulk describe"""
+    with patch('src.handlers.get_all_region_instances') as mock_get_instances, \
+         patch('src.aws_client._get_ec2_client') as mock_client:
+        
+        mock_get_instances.return_value = ['i-1234567890abcdef0', 'i-0987654321fedcba0']
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.return_value = {'Reservations': [{'Instances': [
+            {'InstanceId': 'i-1234567890abcdef0', 'State': {'Name': 'running'}, 'Tags': [{'Key': 'Name', 'Value': 'test-instance-1'}]},
+            {'InstanceId': 'i-0987654321fedcba0', 'State': {'Name': 'stopped'}, 'Tags': [{'Key': 'Name', 'Value': 'test-instance-2'}]}
+        ]}]}
+        mock_client.return_value = mock_ec2_client
+        
+        request = Mock()
+        request.form = {'user_id': 'U08QYU6AX0V', 'user_name': 'fstjohn'}
+        
+        result = handle_list_instances(request)
+        assert "`test-instance-1` (i-1234567890abcdef0) - running" in result
+        assert "`test-instance-2` (i-0987654321fedcba0) - stopped" in result
+        mock_ec2_client.describe_instances.assert_called_once_with(InstanceIds=['i-1234567890abcdef0', 'i-0987654321fedcba0'])
+
 def test_list_instances_no_instances():
     """Test listing instances when no instances exist in the region"""
     with patch('src.handlers.get_all_region_instances') as mock_get_instances:
@@ -44,6 +66,7 @@ def test_list_instances_no_instances():
 def test_list_instances_instance_state_unknown():
     """Test listing instances when instance state is unknown"""
     with patch('src.handlers.get_all_region_instances') as mock_get_instances, \
+         patch('src.handlers.get_instances_bulk'), \
          patch('src.handlers.get_instance_state') as mock_get_state, \
          patch('src.handlers.get_instance_name') as mock_get_name:
         
@@ -113,8 +136,7 @@ def test_ec2_power_start_instance():
             request.form = {'user_id': 'U08QYU6AX0V', 'text': 'i-0df9c53001c5c837d on'}
             
             result = handle_ec2_power(request)
-            assert "Set `test-instance`" in result.json['text']
-            assert "to on" in result.json['text']
+            assert "Requested on for `test-instance`" in result.json['text']
 
 def test_ec2_power_stop_instance():
     """Test EC2 power stop instance"""
@@ -135,8 +157,7 @@ def test_ec2_power_stop_instance():
             request.form = {'user_id': 'U08QYU6AX0V', 'text': 'i-0df9c53001c5c837d off'}
             
             result = handle_ec2_power(request)
-            assert "Set `test-instance`" in result.json['text']
-            assert "to off" in result.json['text']
+            assert "Requested off for `test-instance`" in result.json['text']
 
 def test_ec2_power_restart_instance():
     """Test EC2 power restart instance"""
@@ -157,8 +178,7 @@ def test_ec2_power_restart_instance():
             request.form = {'user_id': 'U08QYU6AX0V', 'text': 'i-0df9c53001c5c837d restart'}
             
             result = handle_ec2_power(request)
-            assert "Set `test-instance`" in result.json['text']
-            assert "to restart" in result.json['text']
+            assert "Requested restart for `test-instance`" in result.json['text']
 
 def test_ec2_power_restart_stopped_instance():
     """Test EC2 power restart instance that is currently stopped"""
@@ -207,7 +227,8 @@ def test_ec2_power_restart_stopped_instance_no_name():
 # AWS Client function tests
 def test_restart_instance_stopped():
     """Test restart_instance when instance is stopped"""
-    with patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
          patch('src.aws_client.get_instance_state') as mock_get_state, \
          patch('src.aws_client.get_instance_name') as mock_get_name:
         
@@ -222,7 +243,8 @@ def test_restart_instance_stopped():
 
 def test_restart_instance_running():
     """Test restart_instance when instance is running"""
-    with patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
          patch('src.aws_client.get_instance_state') as mock_get_state, \
          patch('src.aws_client._get_ec2_client') as mock_client, \
          patch('src.aws_client.get_instance_name') as mock_get_name:
@@ -249,7 +271,8 @@ def test_restart_instance_running():
 
 def test_restart_instance_not_controllable():
     """Test restart_instance when instance cannot be controlled"""
-    with patch('src.aws_client.can_control_instance_by_id') as mock_can_control:
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control:
         mock_can_control.return_value = False
         
         from src.aws_client import restart_instance
@@ -260,7 +283,8 @@ def test_restart_instance_not_controllable():
 # New tests for comprehensive error handling
 def test_start_instance_already_running():
     """Test start_instance when instance is already running"""
-    with patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
          patch('src.aws_client.get_instance_state') as mock_get_state:
         
         mock_can_control.return_value = True
@@ -273,7 +297,8 @@ def test_start_instance_already_running():
 
 def test_start_instance_pending():
     """Test start_instance when instance is pending"""
-    with patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
          patch('src.aws_client.get_instance_state') as mock_get_state:
         
         mock_can_control.return_value = True
@@ -286,7 +311,8 @@ def test_start_instance_pending():
 
 def test_start_instance_stopping():
     """Test start_instance when instance is stopping"""
-    with patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
          patch('src.aws_client.get_instance_state') as mock_get_state:
         
         mock_can_control.return_value = True
@@ -299,7 +325,8 @@ def test_start_instance_stopping():
 
 def test_stop_instance_already_stopped():
     """Test stop_instance when instance is already stopped"""
-    with patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
          patch('src.aws_client.get_instance_state') as mock_get_state:
         
         mock_can_control.return_value = True
@@ -312,7 +339,8 @@ def test_stop_instance_already_stopped():
 
 def test_stop_instance_stopping():
     """Test stop_instance when instance is already stopping"""
-    with patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
          patch('src.aws_client.get_instance_state') as mock_get_state:
         
         mock_can_control.return_value = True
@@ -325,7 +353,8 @@ def test_stop_instance_stopping():
 
 def test_stop_instance_pending():
     """Test stop_instance when instance is pending"""
-    with patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
          patch('src.aws_client.get_instance_state') as mock_get_state:
         
         mock_can_control.return_value = True
@@ -338,7 +367,8 @@ def test_stop_instance_pending():
 
 def test_restart_instance_pending():
     """Test restart_instance when instance is pending"""
-    with patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
          patch('src.aws_client.get_instance_state') as mock_get_state:
         
         mock_can_control.return_value = True
@@ -351,7 +381,8 @@ def test_restart_instance_pending():
 
 def test_restart_instance_stopping():
     """Test restart_instance when instance is stopping"""
-    with patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
          patch('src.aws_client.get_instance_state') as mock_get_state:
         
         mock_can_control.return_value = True
@@ -466,8 +497,7 @@ def test_ec2_power_access_denied():
             request.form = {'user_id': 'U123456789', 'text': 'i-0df9c53001c5c837d on'}
             
             result = handle_ec2_power(request)
-            assert "Set `test-instance`" in result.json['text']
-            assert "to on" in result.json['text']
+            assert "Requested on for `test-instance`" in result.json['text']
 
 def test_ec2_power_instance_not_found():
     """Test EC2 power with non-existent instance"""
@@ -499,8 +529,7 @@ def test_ec2_power_valid():
             request.form = {'user_id': 'U08QYU6AX0V', 'text': 'i-0df9c53001c5c837d on'}
             
             result = handle_ec2_power(request)
-            assert "Set `i-0df9c53001c5c837d`" in result.json['text']
-            assert "to on" in result.json['text']
+            assert "Requested on for `i-0df9c53001c5c837d`" in result.json['text']
 
 def test_ec2_power_invalid_format():
     """Test EC2 power with invalid format"""
@@ -1185,6 +1214,7 @@ def test_ec2_schedule_instance_not_controllable():
 def test_list_instances_only_controllable():
     """Test that list instances only shows controllable instances"""
     with patch('src.handlers.get_all_region_instances') as mock_get_instances, \
+         patch('src.handlers.get_instances_bulk'), \
          patch('src.handlers.get_instance_state') as mock_get_state, \
          patch('src.handlers.get_instance_name') as mock_get_name:
         
@@ -2077,3 +2107,1475 @@ def test_ec2_schedule_set_on_time_too_late():
             # Error case returns a string, not JSON
             assert "Invalid ON time" in str(result)
             assert "earlier than 6:00 AM" in str(result)
+
+# Instance lookup cache tests
+def test_get_instance_details_cached():
+    """Test repeated instance detail lookups are served from the cache"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.return_value = {
+            'Reservations': [{'Instances': [{
+                'InstanceId': 'i-0df9c53001c5c837d',
+                'State': {'Name': 'running'},
+                'Tags': [{'Key': 'Name', 'Value': 'test-instance'}]
+            }]}]
+        }
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_instance_details, get_instance_name
+        
+        assert get_instance_details('i-0df9c53001c5c837d')['InstanceId'] == 'i-0df9c53001c5c837d'
+        assert get_instance_name('i-0df9c53001c5c837d') == 'test-instance'
+        assert mock_ec2_client.describe_instances.call_count == 1
+
+def test_get_instance_state_shares_details_cache():
+    """Test a state check followed by other lookups for the same instance costs one DescribeInstances"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.return_value = {'Reservations': [{'Instances': [{
+            'InstanceId': 'i-0df9c53001c5c837d',
+            'State': {'Name': 'stopped'},
+            'Tags': [{'Key': 'Name', 'Value': 'web01'}, {'Key': 'EC2ControlsEnabled', 'Value': 'true'}]
+        }]}]}
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_instance_state, get_instance_name, can_control_instance_by_id
+        
+        assert get_instance_state('i-0df9c53001c5c837d') == 'stopped'
+        assert get_instance_name('i-0df9c53001c5c837d') == 'web01'
+        assert can_control_instance_by_id('i-0df9c53001c5c837d') is True
+        assert mock_ec2_client.describe_instances.call_count == 1
+
+def test_start_instance_not_found_single_lookup():
+    """Test starting a missing instance does not repeat the failed DescribeInstances"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.return_value = {'Reservations': []}
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import start_instance
+        
+        assert start_instance('i-0df9c53001c5c837d') is False
+        assert mock_ec2_client.describe_instances.call_count == 1
+        mock_ec2_client.start_instances.assert_not_called()
+
+def test_get_instance_details_not_found_not_cached():
+    """Test failed instance lookups are retried instead of cached"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.return_value = {'Reservations': []}
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_instance_details
+        
+        assert get_instance_details('i-0df9c53001c5c837d') is None
+        assert get_instance_details('i-0df9c53001c5c837d') is None
+        assert mock_ec2_client.describe_instances.call_count == 2
+
+def test_instance_tags_cached_until_tags_change():
+    """Test tag reads are cached and dropped when this service changes the instance's tags"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.side_effect = [
+            {'Reservations': [{'Instances': [{'InstanceId': 'i-0df9c53001c5c837d', 'Tags': []}]}]},
+            {'Reservations': [{'Instances': [{'InstanceId': 'i-0df9c53001c5c837d', 'Tags': [{'Key': 'PowerScheduleOnTime', 'Value': '9am'}]}]}]}
+        ]
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_power_schedule_tags, get_disable_schedule_tag, set_power_schedule_tags
+        
+        assert get_power_schedule_tags('i-0df9c53001c5c837d') == {}
+        assert get_disable_schedule_tag('i-0df9c53001c5c837d') is None
+        assert mock_ec2_client.describe_instances.call_count == 1
+        
+        assert set_power_schedule_tags('i-0df9c53001c5c837d', on_time='9am') is True
+        assert get_power_schedule_tags('i-0df9c53001c5c837d') == {'on_time': '9am'}
+        assert mock_ec2_client.describe_instances.call_count == 2
+
+def test_instance_tags_reuse_cached_details():
+    """Test tag reads after a details lookup come from the cached Instance without another API call"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.return_value = {'Reservations': [{'Instances': [
+            {'InstanceId': 'i-0df9c53001c5c837d', 'State': {'Name': 'running'}, 'Tags': [{'Key': 'PowerScheduleDisabledUntil', 'Value': 'indefinite'}]}
+        ]}]}
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_instance_details, get_disable_schedule_tag
+        
+        assert get_instance_details('i-0df9c53001c5c837d')['InstanceId'] == 'i-0df9c53001c5c837d'
+        assert get_disable_schedule_tag('i-0df9c53001c5c837d') == 'indefinite'
+        assert mock_ec2_client.describe_instances.call_count == 1
+        mock_ec2_client.describe_tags.assert_not_called()
+
+def test_instance_cache_is_bounded():
+    """Test the lookup cache evicts its oldest entries past the configured size"""
+    with patch('src.aws_client.INSTANCE_CACHE_MAX_ENTRIES', 3):
+        from src.aws_client import _cache, _cache_store
+        
+        for n in range(5):
+            _cache_store(("get_instance_details", f"i-{n:017x}"), {})
+        
+        assert [key[1] for key in _cache] == [f"i-{n:017x}" for n in (2, 3, 4)]
+
+def test_start_instance_invalidates_cache():
+    """Test starting an instance drops its cached state"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        
+        tags = [{'Key': 'Name', 'Value': 'web01'}, {'Key': 'EC2ControlsEnabled', 'Value': 'true'}]
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.side_effect = [
+            {'Reservations': [{'Instances': [{'InstanceId': 'i-0df9c53001c5c837d', 'State': {'Name': 'stopped'}, 'Tags': tags}]}]},
+            {'Reservations': [{'Instances': [{'InstanceId': 'i-0df9c53001c5c837d', 'State': {'Name': 'pending'}, 'Tags': tags}]}]}
+        ]
+        mock_ec2_client.start_instances.return_value = {
+            'StartingInstances': [{
+                'PreviousState': {'Name': 'stopped'},
+                'CurrentState': {'Name': 'pending'}
+            }]
+        }
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import start_instance, get_instance_state
+        
+        assert start_instance('i-0df9c53001c5c837d') is True
+        # The control check, state check and name all came from a single DescribeInstances
+        assert mock_ec2_client.describe_instances.call_count == 1
+        assert get_instance_state('i-0df9c53001c5c837d') == 'pending'
+
+# DescribeInstances batching tests
+def _wait_until(condition, timeout=5):
+    """Poll condition until it is true or timeout seconds pass, returning its last result"""
+    import time as time_module
+    deadline = time_module.monotonic() + timeout
+    while not condition():
+        if time_module.monotonic() > deadline:
+            return False
+        time_module.sleep(0.001)
+    return True
+
+def test_describe_batcher_coalesces_concurrent_lookups():
+    """Test lookups queued behind an in-flight request share one DescribeInstances call"""
+    import threading
+    from src.aws_client import get_instance_details, _describe_batcher
+    
+    release_first = threading.Event()
+    
+    def describe_instances(InstanceIds):
+        if InstanceIds == ['i-aaaaaaaaaaaaaaaaa']:
+            release_first.wait(5)
+        return {'Reservations': [{'Instances': [
+            {'InstanceId': instance_id, 'State': {'Name': 'running'}} for instance_id in InstanceIds
+        ]}]}
+    
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.side_effect = describe_instances
+        mock_client.return_value = mock_ec2_client
+        
+        results = {}
+        def lookup(instance_id):
+            results[instance_id] = get_instance_details(instance_id)
+        
+        first = threading.Thread(target=lookup, args=('i-aaaaaaaaaaaaaaaaa',))
+        first.start()
+        assert _wait_until(lambda: mock_ec2_client.describe_instances.call_count > 0)
+        
+        followers = [threading.Thread(target=lookup, args=(instance_id,)) for instance_id in ('i-bbbbbbbbbbbbbbbbb', 'i-ccccccccccccccccc')]
+        for thread in followers:
+            thread.start()
+        assert _wait_until(lambda: len(_describe_batcher._pending) >= 2)
+        
+        release_first.set()
+        for thread in [first] + followers:
+            thread.join(5)
+        
+        assert mock_ec2_client.describe_instances.call_count == 2
+        second_call_ids = mock_ec2_client.describe_instances.call_args_list[1].kwargs['InstanceIds']
+        assert sorted(second_call_ids) == ['i-bbbbbbbbbbbbbbbbb', 'i-ccccccccccccccccc']
+        assert all(results[instance_id]['InstanceId'] == instance_id for instance_id in results)
+
+def test_state_and_tag_lookups_share_batches():
+    """Test get_instance_state and get_instance_tags join the same coalesced DescribeInstances"""
+    import threading
+    from src.aws_client import get_instance_details, get_instance_state, get_instance_tags, _describe_batcher
+    
+    release_first = threading.Event()
+    
+    def describe_instances(InstanceIds):
+        if InstanceIds == ['i-aaaaaaaaaaaaaaaaa']:
+            release_first.wait(5)
+        return {'Reservations': [{'Instances': [
+            {'InstanceId': instance_id, 'State': {'Name': 'stopped'}, 'Tags': [{'Key': 'Name', 'Value': instance_id}]}
+            for instance_id in InstanceIds
+        ]}]}
+    
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.side_effect = describe_instances
+        mock_client.return_value = mock_ec2_client
+        
+        results = {}
+        first = threading.Thread(target=get_instance_details, args=('i-aaaaaaaaaaaaaaaaa',))
+        first.start()
+        assert _wait_until(lambda: mock_ec2_client.describe_instances.call_count > 0)
+        
+        followers = [
+            threading.Thread(target=lambda: results.update(state=get_instance_state('i-bbbbbbbbbbbbbbbbb'))),
+            threading.Thread(target=lambda: results.update(tags=get_instance_tags('i-ccccccccccccccccc')))
+        ]
+        for thread in followers:
+            thread.start()
+        assert _wait_until(lambda: len(_describe_batcher._pending) >= 2)
+        
+        release_first.set()
+        for thread in [first] + followers:
+            thread.join(5)
+        
+        assert mock_ec2_client.describe_instances.call_count == 2
+        assert results == {'state': 'stopped', 'tags': [{'Key': 'Name', 'Value': 'i-ccccccccccccccccc'}]}
+
+def test_describe_batcher_retries_failed_batch_individually():
+    """Test one bad instance ID does not fail the other lookups in its batch"""
+    from src.aws_client import _describe_batcher
+    
+    def describe_instances(InstanceIds):
+        if 'i-bbbbbbbbbbbbbbbbb' in InstanceIds:
+            raise Exception("InvalidInstanceID.NotFound")
+        return {'Reservations': [{'Instances': [
+            {'InstanceId': instance_id, 'State': {'Name': 'running'}} for instance_id in InstanceIds
+        ]}]}
+    
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.side_effect = describe_instances
+        mock_client.return_value = mock_ec2_client
+        
+        from concurrent.futures import Future
+        batch = {'i-aaaaaaaaaaaaaaaaa': Future(), 'i-bbbbbbbbbbbbbbbbb': Future()}
+        _describe_batcher._describe(batch)
+        
+        assert batch['i-aaaaaaaaaaaaaaaaa'].result()['InstanceId'] == 'i-aaaaaaaaaaaaaaaaa'
+        with pytest.raises(Exception):
+            batch['i-bbbbbbbbbbbbbbbbb'].result()
+
+# Identifier resolution tests
+def test_resolve_identifier_instance_id_returned_directly():
+    """Test well-formed instance IDs skip the Name tag lookup"""
+    with patch('src.aws_client.get_instance_by_name') as mock_get_by_name:
+        from src.aws_client import resolve_instance_identifier
+        assert resolve_instance_identifier('i-0df9c53001c5c837d') == 'i-0df9c53001c5c837d'
+        mock_get_by_name.assert_not_called()
+
+def test_resolve_identifier_name_with_instance_prefix():
+    """Test names that merely start with 'i-' are looked up by Name tag"""
+    with patch('src.aws_client.get_instance_by_name') as mock_get_by_name:
+        mock_get_by_name.return_value = 'i-0df9c53001c5c837d'
+        from src.aws_client import resolve_instance_identifier
+        assert resolve_instance_identifier('i-web.aopstest.com') == 'i-0df9c53001c5c837d'
+        assert mock_get_by_name.call_args_list[0].args[0] == 'i-web.aopstest.com'
+
+def test_resolve_identifier_rejects_malformed_instance_ids():
+    """Test only 8- or 17-hex-digit IDs are treated as instance IDs"""
+    with patch('src.aws_client.get_instance_by_name') as mock_get_by_name:
+        mock_get_by_name.return_value = None
+        from src.aws_client import resolve_instance_identifier
+        assert resolve_instance_identifier('i-0df9c530') == 'i-0df9c530'
+        for malformed in ('i-', 'i-Q@', 'i-0df9c53001c5', 'i-0DF9C53001C5C837D'):
+            mock_get_by_name.reset_mock()
+            assert resolve_instance_identifier(malformed) is None
+            mock_get_by_name.assert_called()
+
+def test_get_instance_by_name_filters_server_side():
+    """Test Name lookups filter by tag and state server-side with small pages"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.get_paginator.return_value.paginate.return_value = [{'Reservations': [{'Instances': [{
+            'InstanceId': 'i-0df9c53001c5c837d',
+            'State': {'Name': 'running'},
+            'Tags': [{'Key': 'Name', 'Value': 'web01'}, {'Key': 'EC2ControlsEnabled', 'Value': 'true'}]
+        }]}]}]
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_instance_by_name
+        
+        assert get_instance_by_name('web01') == 'i-0df9c53001c5c837d'
+        call_kwargs = mock_ec2_client.get_paginator.return_value.paginate.call_args.kwargs
+        assert {'Name': 'tag:Name', 'Values': ['web01']} in call_kwargs['Filters']
+        assert call_kwargs['PaginationConfig'] == {'PageSize': 50}
+
+def test_state_filter_shared_and_unchanged():
+    """Test lookups reuse the module-level state filter without mutating it"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_paginate = mock_ec2_client.get_paginator.return_value.paginate
+        mock_paginate.return_value = [{'Reservations': []}]
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_all_instances, get_instance_by_name, _STATE_FILTER
+        
+        get_all_instances()
+        assert mock_paginate.call_args.kwargs['Filters'] == [_STATE_FILTER]
+        get_instance_by_name('web01')
+        assert mock_paginate.call_args.kwargs['Filters'][1] is _STATE_FILTER
+        assert _STATE_FILTER == {'Name': 'instance-state-name', 'Values': ['pending', 'running', 'stopping', 'stopped']}
+
+def test_get_controllable_instances_filters_by_tag_server_side():
+    """Test only tagged instances are requested and falsy tag values are still excluded"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_paginate = mock_ec2_client.get_paginator.return_value.paginate
+        mock_paginate.return_value = [{'Reservations': [{'Instances': [
+            {'InstanceId': 'i-aaaaaaaaaaaaaaaaa', 'Tags': [{'Key': 'EC2ControlsEnabled', 'Value': 'true'}]},
+            {'InstanceId': 'i-bbbbbbbbbbbbbbbbb', 'Tags': [{'Key': 'EC2ControlsEnabled', 'Value': 'off'}]}
+        ]}]}]
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_controllable_instances, _STATE_FILTER, _CONTROL_TAG_FILTER
+        
+        instances = get_controllable_instances()
+        
+        assert [i['InstanceId'] for i in instances] == ['i-aaaaaaaaaaaaaaaaa']
+        assert mock_paginate.call_args.kwargs['Filters'] == [_STATE_FILTER, _CONTROL_TAG_FILTER]
+
+def test_get_all_instances_follows_pages():
+    """Test get_all_instances collects instances from every describe_instances page"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.get_paginator.return_value.paginate.return_value = [
+            {'Reservations': [{'Instances': [{'InstanceId': 'i-aaaaaaaaaaaaaaaaa'}, {'InstanceId': 'i-bbbbbbbbbbbbbbbbb'}]}]},
+            {'Reservations': []},
+            {'Reservations': [{'Instances': [{'InstanceId': 'i-ccccccccccccccccc'}]}]}
+        ]
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_all_instances
+        
+        instances = get_all_instances()
+        
+        assert [i['InstanceId'] for i in instances] == ['i-aaaaaaaaaaaaaaaaa', 'i-bbbbbbbbbbbbbbbbb', 'i-ccccccccccccccccc']
+        mock_ec2_client.get_paginator.assert_called_once_with('describe_instances')
+        assert mock_ec2_client.get_paginator.return_value.paginate.call_args.kwargs['PaginationConfig'] == {'PageSize': 1000}
+
+# EC2 client configuration tests
+def test_ec2_client_uses_shared_config():
+    """Test the EC2 client is built from the shared session with pool and retry tuning"""
+    with patch('src.aws_client._ec2_client', None), \
+         patch('src.aws_client._session') as mock_session:
+        from src.aws_client import _get_ec2_client
+        
+        _get_ec2_client()
+        config = mock_session.client.call_args.kwargs['config']
+        assert mock_session.client.call_args.args[0] == 'ec2'
+        assert config.max_pool_connections == 50
+        assert config.retries['mode'] == 'adaptive'
+        assert config.tcp_keepalive is True
+
+def test_ec2_client_created_lazily_once():
+    """Test the session and client are only built on first use and then reused"""
+    with patch('src.aws_client._ec2_client', None), \
+         patch('src.aws_client._session', None), \
+         patch('src.aws_client.boto3.Session') as mock_session_cls:
+        from src.aws_client import _get_ec2_client
+        
+        mock_session_cls.assert_not_called()
+        first = _get_ec2_client()
+        assert _get_ec2_client() is first
+        mock_session_cls.assert_called_once()
+        mock_session_cls.return_value.get_credentials.assert_called_once_with()
+        botocore_session = mock_session_cls.call_args.kwargs['botocore_session']
+        assert botocore_session.get_config_variable('metadata_service_num_attempts') == 1
+        mock_session_cls.return_value.client.assert_called_once()
+
+# Waiter tests
+def test_start_instance_wait_uses_waiter():
+    """Test start_instance(wait=True) waits with the instance_running waiter"""
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
+         patch('src.aws_client.get_instance_state') as mock_get_state, \
+         patch('src.aws_client.get_instance_name') as mock_get_name, \
+         patch('src.aws_client._get_ec2_client') as mock_client:
+        
+        mock_can_control.return_value = True
+        mock_get_state.return_value = 'stopped'
+        mock_get_name.return_value = 'test-instance'
+        mock_ec2_client = Mock()
+        mock_ec2_client.start_instances.return_value = {
+            'StartingInstances': [{
+                'PreviousState': {'Name': 'stopped'},
+                'CurrentState': {'Name': 'pending'}
+            }]
+        }
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import start_instance
+        
+        assert start_instance('i-0df9c53001c5c837d', wait=True) is True
+        mock_ec2_client.get_waiter.assert_called_once_with('instance_running')
+        mock_ec2_client.get_waiter.return_value.wait.assert_called_once_with(
+            InstanceIds=['i-0df9c53001c5c837d'],
+            WaiterConfig={'Delay': 5, 'MaxAttempts': 18}
+        )
+
+def test_stop_instance_wait_timeout():
+    """Test stop_instance(wait=True) reports failure when the waiter gives up"""
+    with patch('src.aws_client.get_instance_details'), \
+         patch('src.aws_client.can_control_instance_by_id') as mock_can_control, \
+         patch('src.aws_client.get_instance_state') as mock_get_state, \
+         patch('src.aws_client.get_instance_name') as mock_get_name, \
+         patch('src.aws_client._get_ec2_client') as mock_client:
+        
+        mock_can_control.return_value = True
+        mock_get_state.return_value = 'running'
+        mock_get_name.return_value = 'test-instance'
+        mock_ec2_client = Mock()
+        mock_ec2_client.stop_instances.return_value = {
+            'StoppingInstances': [{
+                'PreviousState': {'Name': 'running'},
+                'CurrentState': {'Name': 'stopping'}
+            }]
+        }
+        mock_ec2_client.get_waiter.return_value.wait.side_effect = Exception("Waiter InstanceStopped failed: Max attempts exceeded")
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import stop_instance
+        
+        assert stop_instance('i-0df9c53001c5c837d', wait=True) is False
+        mock_ec2_client.get_waiter.assert_called_once_with('instance_stopped')
+
+# Bulk instance lookup tests
+def test_get_instances_bulk_chunks_and_indexes():
+    """Test get_instances_bulk issues one describe_instances per chunk and indexes by InstanceId"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.side_effect = lambda InstanceIds: {
+            'Reservations': [{'Instances': [
+                {'InstanceId': iid, 'State': {'Name': 'running'}, 'Tags': [{'Key': 'Name', 'Value': f'name-{iid}'}]}
+                for iid in InstanceIds
+            ]}]
+        }
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_instances_bulk, get_instance_state, get_instance_name, get_instance_details
+        
+        ids = [f'i-{n:017x}' for n in range(5)]
+        bulk = get_instances_bulk(ids + ids[:2], chunk_size=2)
+        
+        assert list(bulk) == ids
+        assert mock_ec2_client.describe_instances.call_count == 3
+        assert get_instance_state(ids[0], bulk=bulk) == 'running'
+        assert get_instance_name(ids[4], bulk=bulk) == f'name-{ids[4]}'
+        assert get_instance_state('i-00000000000000099', bulk=bulk) is None
+        # Results warm the details cache
+        assert get_instance_details(ids[3])['InstanceId'] == ids[3]
+        assert mock_ec2_client.describe_instances.call_count == 3
+
+def test_get_instances_bulk_skips_bad_ids():
+    """Test get_instances_bulk retries a failed chunk per ID and drops the IDs AWS rejects"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        def describe(InstanceIds):
+            if 'i-0bad0000000000000' in InstanceIds:
+                raise Exception("InvalidInstanceID.NotFound")
+            return {'Reservations': [{'Instances': [{'InstanceId': iid, 'State': {'Name': 'stopped'}} for iid in InstanceIds]}]}
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.side_effect = describe
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_instances_bulk
+        
+        bulk = get_instances_bulk(['i-0df9c53001c5c837d', 'i-0bad0000000000000'])
+        
+        assert list(bulk) == ['i-0df9c53001c5c837d']
+
+# Audit log writer tests
+def test_log_aws_operation_is_written_by_background_thread(caplog):
+    """Test AWS audit entries are queued and serialized off the calling thread"""
+    import json
+    import logging
+    from src.aws_client import _log_aws_operation, _audit_q
+    
+    with caplog.at_level(logging.INFO, logger='src.aws_client'):
+        _log_aws_operation("start_instances", "i-0df9c53001c5c837d", {"previous_state": "stopped"})
+        _audit_q.join()
+    
+    audit_lines = [r.getMessage() for r in caplog.records if r.getMessage().startswith('AWS_AUDIT: ')]
+    assert len(audit_lines) == 1
+    entry = json.loads(audit_lines[0][len('AWS_AUDIT: '):])
+    assert entry['aws_operation'] == 'start_instances'
+    assert entry['status'] == 'SUCCESS'
+    assert entry['details'] == {"previous_state": "stopped"}
+    assert 'T' in entry['timestamp']
+
+def test_log_aws_operation_skipped_when_info_disabled():
+    """Test no audit entry is built or queued when INFO logging is off"""
+    from src.aws_client import _log_aws_operation, logger
+    
+    with patch.object(logger, 'isEnabledFor', return_value=False), \
+         patch('src.aws_client._audit_q') as mock_queue:
+        _log_aws_operation("start_instances", "i-0df9c53001c5c837d")
+        mock_queue.put_nowait.assert_not_called()
+
+def test_audit_serializer_encodes_datetimes_as_iso8601():
+    """Test the audit serializer (orjson or stdlib fallback) writes datetimes as ISO-8601"""
+    import json
+    from datetime import datetime, timezone
+    from src.aws_client import dumps_json, _json_default
+    
+    launch_time = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    entry = {'details': {'launch_time': launch_time}}
+    assert json.loads(dumps_json(entry)) == {'details': {'launch_time': '2024-01-02T03:04:05+00:00'}}
+    assert json.dumps(entry, default=_json_default) == '{"details": {"launch_time": "2024-01-02T03:04:05+00:00"}}'
+
+# Tag projection tests
+def test_get_instance_name_reuses_tags_dict():
+    """Test the Tags list is projected into a dict once per instance"""
+    from src.aws_client import get_instance_name, _tags_dict
+    
+    instance = {'InstanceId': 'i-0df9c53001c5c837d', 'Tags': [
+        {'Key': 'Name', 'Value': 'web01'},
+        {'Key': 'Owner', 'Value': 'ops'}
+    ]}
+    bulk = {'i-0df9c53001c5c837d': instance}
+    
+    assert get_instance_name('i-0df9c53001c5c837d', bulk=bulk) == 'web01'
+    assert instance['_tags'] == {'Name': 'web01', 'Owner': 'ops'}
+    assert _tags_dict(instance) is instance['_tags']
+    assert _tags_dict({'InstanceId': 'i-0df9c53001c5c837d'}) == {}
+
+# Worker pool tests
+def test_get_instances_bulk_chunks_run_on_worker_pool():
+    """Test bulk lookups spanning several chunks describe them concurrently on the shared pool"""
+    import threading
+    with patch('src.aws_client._describe_instances_by_ids') as mock_describe:
+        threads = set()
+        def describe(instance_ids):
+            threads.add(threading.current_thread().name)
+            return {instance_id: {'InstanceId': instance_id, 'State': {'Name': 'running'}} for instance_id in instance_ids}
+        mock_describe.side_effect = describe
+        
+        from src.aws_client import get_instances_bulk, map_instances
+        
+        ids = [f'i-{n:017x}' for n in range(5)]
+        assert list(get_instances_bulk(ids, chunk_size=2)) == ids
+        assert mock_describe.call_count == 3
+        assert threads and all(name.startswith('ec2') for name in threads)
+        assert map_instances(['i-aaaaaaaaaaaaaaaaa', 'i-bbbbbbbbbbbbbbbbb'], len) == [19, 19]
+
+# CloudWatch EMF audit tests
+def test_audit_entries_in_emf_format(caplog):
+    """Test audit entries carry EMF metadata and the latency of the preceding EC2 call"""
+    import boto3
+    import json
+    import logging
+    from botocore.stub import Stubber
+    from src.aws_client import _log_aws_operation, _audit_q, _register_latency_hooks
+    
+    client = boto3.client('ec2', region_name='us-west-2', aws_access_key_id='test', aws_secret_access_key='test')
+    _register_latency_hooks(client)
+    
+    with patch('src.aws_client.AWS_AUDIT_EMF', True), \
+         Stubber(client) as stubber, \
+         caplog.at_level(logging.INFO, logger='src.aws_client'):
+        stubber.add_response('describe_instances', {'Reservations': []}, {'InstanceIds': ['i-0df9c53001c5c837d']})
+        client.describe_instances(InstanceIds=['i-0df9c53001c5c837d'])
+        _log_aws_operation("describe_instances", "i-0df9c53001c5c837d", {"error": "no_reservations_found"}, False)
+        _log_aws_operation("describe_instances", "i-0df9c53001c5c837d")
+        _audit_q.join()
+    
+    entries = [json.loads(r.getMessage()[len('AWS_AUDIT: '):]) for r in caplog.records if r.getMessage().startswith('AWS_AUDIT: ')]
+    assert len(entries) == 2
+    timed, untimed = entries
+    assert timed['Latency'] >= 0
+    assert timed['Operations'] == 1
+    directive = timed['_aws']['CloudWatchMetrics'][0]
+    assert directive['Dimensions'] == [['aws_operation', 'status']]
+    assert [m['Name'] for m in directive['Metrics']] == ['Operations', 'Latency']
+    assert isinstance(timed['_aws']['Timestamp'], int)
+    # The latency is consumed by the first audit entry after the call
+    assert untimed['Latency'] is None
+    assert [m['Name'] for m in untimed['_aws']['CloudWatchMetrics'][0]['Metrics']] == ['Operations']
+
+def test_batched_lookups_report_leader_latency():
+    """Test lookups that joined a batch carry the latency of the DescribeInstances call that served them"""
+    import threading
+    from concurrent.futures import Future
+    from src.aws_client import _DescribeBatcher, _batched_result, _call_timing
+    
+    def describe(instance_ids):
+        _call_timing.latency_ms = 12.5
+        return {instance_id: {'InstanceId': instance_id} for instance_id in instance_ids}
+    
+    with patch('src.aws_client._describe_instances_by_ids', side_effect=describe):
+        batch = {'i-aaaaaaaaaaaaaaaaa': Future(), 'i-bbbbbbbbbbbbbbbbb': Future()}
+        _DescribeBatcher(max_batch=1000)._describe(batch)
+    
+    seen = {}
+    def follower():
+        seen['result'] = _batched_result(batch['i-bbbbbbbbbbbbbbbbb'])
+        seen['latency'] = getattr(_call_timing, 'latency_ms', None)
+    thread = threading.Thread(target=follower)
+    thread.start()
+    thread.join(5)
+    
+    assert seen['result'] == {'InstanceId': 'i-bbbbbbbbbbbbbbbbb'}
+    assert seen['latency'] == 12.5
+
+# Instance name cache tests
+def test_get_instance_name_cached_across_invalidation():
+    """Test names are cached for the process, survive per-instance invalidation and skip failures"""
+    with patch('src.aws_client.get_instance_details') as mock_get_details:
+        mock_get_details.side_effect = [
+            None,
+            {'InstanceId': 'i-0df9c53001c5c837d', 'Tags': [{'Key': 'Name', 'Value': 'web01'}]}
+        ]
+        
+        from src.aws_client import get_instance_name, invalidate
+        
+        assert get_instance_name('i-0df9c53001c5c837d') is None
+        assert get_instance_name('i-0df9c53001c5c837d') == 'web01'
+        invalidate('i-0df9c53001c5c837d')
+        assert get_instance_name('i-0df9c53001c5c837d') == 'web01'
+        assert mock_get_details.call_count == 2
+        
+        invalidate()
+        mock_get_details.side_effect = None
+        mock_get_details.return_value = {'InstanceId': 'i-0df9c53001c5c837d', 'Tags': [{'Key': 'Name', 'Value': 'web02'}]}
+        assert get_instance_name('i-0df9c53001c5c837d') == 'web02'
+
+# Instance summary tests
+def test_instance_summary_built_once():
+    """Test the audit summary of an instance is computed once and reused"""
+    from datetime import datetime, timezone
+    from src.aws_client import _instance_summary
+    
+    instance = {
+        'InstanceId': 'i-0df9c53001c5c837d',
+        'InstanceType': 't3.micro',
+        'LaunchTime': datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        'State': {'Name': 'running'}
+    }
+    
+    summary = _instance_summary(instance)
+    assert summary == {'instance_type': 't3.micro', 'launch_time': '2024-01-02T03:04:05+00:00', 'state': 'running'}
+    assert _instance_summary(instance) is summary
+    assert _instance_summary({'State': {'Name': 'stopped'}})['launch_time'] is None
+
+# Control tag tests
+def test_can_control_instance_tag_values():
+    """Test EC2ControlsEnabled values that allow and deny control"""
+    from src.aws_client import can_control_instance
+    
+    def instance(value):
+        return {'InstanceId': 'i-0df9c53001c5c837d', 'Tags': [{'Key': 'Name', 'Value': 'web01'}, {'Key': 'EC2ControlsEnabled', 'Value': value}]}
+    
+    for value in ('true', 'True', '1', 'yes', 'enabled'):
+        assert can_control_instance(instance(value)) is True
+    for value in ('false', 'FALSE', '0', 'no', 'Disabled', 'off', ''):
+        assert can_control_instance(instance(value)) is False
+    assert can_control_instance({'InstanceId': 'i-0df9c53001c5c837d', 'Tags': [{'Key': 'Name', 'Value': 'web01'}]}) is False
+    assert can_control_instance({'InstanceId': 'i-0df9c53001c5c837d'}) is False
+    assert can_control_instance(None) is False
+
+# Fuzzy search ranking tests
+def test_fuzzy_search_instances_ranks_and_limits_matches():
+    """Test exact matches rank first, then prefix matches, then by name, keeping the top 10"""
+    def instance(instance_id, name):
+        return {'InstanceId': instance_id, 'State': {'Name': 'running'}, 'Tags': [{'Key': 'Name', 'Value': name}]}
+    
+    with patch('src.aws_client._iter_controllable_instances') as mock_controllable:
+        mock_controllable.return_value = [
+            instance('i-00000000000000001', 'my-web'),
+            instance('i-00000000000000002', 'Web'),
+            instance('i-00000000000000003', 'web-api'),
+            instance('i-00000000000000004', 'db'),
+        ] + [instance(f'i-1{n:016x}', f'z-web-{n:02d}') for n in range(12)]
+        
+        from src.aws_client import fuzzy_search_instances
+        
+        results = fuzzy_search_instances('web')
+        assert [r['Name'] for r in results[:4]] == ['Web', 'web-api', 'my-web', 'z-web-00']
+        assert len(results) == 10
+        assert results[0] == {'InstanceId': 'i-00000000000000002', 'Name': 'Web', 'State': 'running'}
+
+def test_fuzzy_search_instances_matches_literally_ignoring_case():
+    """Test search terms match case-insensitively and regex metacharacters are taken literally"""
+    with patch('src.aws_client._iter_controllable_instances') as mock_controllable:
+        mock_controllable.return_value = [
+            {'InstanceId': 'i-00000000000000001', 'State': {'Name': 'running'}, 'Tags': [{'Key': 'Name', 'Value': 'API.prod'}]},
+            {'InstanceId': 'i-00000000000000002', 'State': {'Name': 'stopped'}, 'Tags': [{'Key': 'Name', 'Value': 'apixprod'}]},
+            {'InstanceId': 'i-00000000000000003', 'State': {'Name': 'stopped'}}
+        ]
+        
+        from src.aws_client import fuzzy_search_instances
+        
+        assert [r['InstanceId'] for r in fuzzy_search_instances('api.')] == ['i-00000000000000001']
+        assert fuzzy_search_instances('I-00000000000000003') == [
+            {'InstanceId': 'i-00000000000000003', 'Name': None, 'State': 'stopped'}
+        ]
+
+# Prefetched instance tests
+def test_power_actions_reuse_prefetched_instance():
+    """Test start/stop/restart skip DescribeInstances when handed the instance's details"""
+    def instance(state):
+        return {'InstanceId': 'i-0df9c53001c5c837d', 'State': {'Name': state},
+                'Tags': [{'Key': 'EC2ControlsEnabled', 'Value': 'true'}, {'Key': 'Name', 'Value': 'web01'}]}
+    
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.start_instances.return_value = {'StartingInstances': [{'PreviousState': {'Name': 'stopped'}, 'CurrentState': {'Name': 'pending'}}]}
+        mock_ec2_client.stop_instances.return_value = {'StoppingInstances': [{'PreviousState': {'Name': 'running'}, 'CurrentState': {'Name': 'stopping'}}]}
+        mock_ec2_client.reboot_instances.return_value = {}
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import start_instance, stop_instance, restart_instance
+        
+        assert start_instance('i-0df9c53001c5c837d', instance=instance('stopped')) is True
+        assert stop_instance('i-0df9c53001c5c837d', instance=instance('running')) is True
+        assert restart_instance('i-0df9c53001c5c837d', instance=instance('running')) is True
+        assert start_instance('i-0df9c53001c5c837d', instance={'InstanceId': 'i-0df9c53001c5c837d', 'State': {'Name': 'stopped'}}) is False
+        mock_ec2_client.describe_instances.assert_not_called()
+        assert mock_ec2_client.start_instances.call_count == 1
+
+# EC2 client initialization tests
+def test_ec2_client_created_once_under_concurrency():
+    """Test concurrent first calls share a single client, and warmup primes it"""
+    import threading
+    import src.aws_client as aws_client
+    
+    created = []
+    def make_client(*args, **kwargs):
+        created.append(threading.current_thread().name)
+        return Mock()
+    
+    with patch.object(aws_client, '_ec2_client', None), \
+         patch('src.aws_client._get_session') as mock_session:
+        mock_session.return_value.client.side_effect = make_client
+        
+        threads = [threading.Thread(target=aws_client._get_ec2_client) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        
+        assert len(created) == 1
+        assert aws_client.warmup() is True
+        aws_client._ec2_client.describe_regions.assert_called_once_with(RegionNames=[aws_client.aws_region])
+        
+        aws_client._ec2_client.describe_regions.side_effect = Exception("no credentials")
+        assert aws_client.warmup() is False
+
+# Combined tag write tests
+def test_set_instance_tags_writes_all_tags_in_one_call():
+    """Test several tags are written with a single create_tags call and invalid input makes no call"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import set_instance_tags
+        
+        assert set_instance_tags('i-0df9c53001c5c837d', {
+            'PowerScheduleOnTime': '9am',
+            'PowerScheduleOffTime': '5pm',
+            'PowerScheduleDisabledUntil': 'indefinite'
+        }) is True
+        mock_ec2_client.create_tags.assert_called_once_with(Resources=['i-0df9c53001c5c837d'], Tags=[
+            {'Key': 'PowerScheduleOnTime', 'Value': '9am'},
+            {'Key': 'PowerScheduleOffTime', 'Value': '5pm'},
+            {'Key': 'PowerScheduleDisabledUntil', 'Value': 'indefinite'}
+        ])
+        
+        assert set_instance_tags('i-0df9c53001c5c837d', {}) is False
+        assert set_instance_tags('i-0df9c53001c5c837d', {f'Key{n}': 'x' for n in range(51)}) is False
+        assert mock_ec2_client.create_tags.call_count == 1
+        
+        mock_ec2_client.create_tags.side_effect = Exception("UnauthorizedOperation")
+        assert set_instance_tags('i-0df9c53001c5c837d', {'Stakeholders': 'alice'}) is False
+
+# Pod identity tests
+def test_audit_entries_use_pod_identity_read_at_import():
+    """Test audit entries carry the pod name and namespace captured when the module loaded"""
+    from src.aws_client import _log_aws_operation, _audit_q, logger
+    
+    with patch.object(logger, 'isEnabledFor', return_value=True), \
+         patch('src.aws_client.POD_NAME', 'ec2-controls-abc'), \
+         patch('src.aws_client.POD_NAMESPACE', 'ops'), \
+         patch('src.aws_client.os.environ.get') as mock_environ_get, \
+         patch.object(_audit_q, 'put_nowait') as mock_put:
+        _log_aws_operation("describe_instances", "i-0df9c53001c5c837d")
+        
+    entry = mock_put.call_args[0][0]
+    assert (entry['pod_name'], entry['namespace']) == ('ec2-controls-abc', 'ops')
+    mock_environ_get.assert_not_called()
+
+# Audit timestamp tests
+def test_audit_timestamp_formatting_matches_isoformat():
+    """Test audit timestamps are formatted from time_ns like an aware UTC datetime's isoformat"""
+    from datetime import datetime, timezone
+    from src.aws_client import _format_timestamp
+    
+    moment = datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    epoch_ns = int(moment.timestamp()) * 1_000_000_000 + 678901234
+    assert _format_timestamp(epoch_ns) == moment.isoformat() == '2024-01-02T03:04:05.678901+00:00'
+    assert _format_timestamp(epoch_ns + 1_000_000_000) == '2024-01-02T03:04:06.678901+00:00'
+    assert _format_timestamp(1_700_000_000 * 1_000_000_000) == '2023-11-14T22:13:20.000000+00:00'
+
+# AWS operation decorator tests
+def test_tag_writers_audit_failures_through_decorator():
+    """Test tag writers log and audit AWS errors with their call details and return False"""
+    with patch('src.aws_client._get_ec2_client') as mock_client, \
+         patch('src.aws_client._log_aws_operation') as mock_audit:
+        mock_ec2_client = Mock()
+        mock_ec2_client.create_tags.side_effect = Exception("UnauthorizedOperation")
+        mock_ec2_client.delete_tags.side_effect = Exception("UnauthorizedOperation")
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import set_power_schedule_tags, delete_stakeholders_tag
+        
+        assert set_power_schedule_tags.__name__ == 'set_power_schedule_tags'
+        assert set_power_schedule_tags('i-0df9c53001c5c837d', '9am') is False
+        mock_audit.assert_called_once()
+        operation, target, details, success, error = mock_audit.call_args[0]
+        assert (operation, target, success) == ("set_power_schedule_tags", 'i-0df9c53001c5c837d', False)
+        assert details == {"error": "UnauthorizedOperation", "on_time": '9am', "off_time": None}
+        assert str(error) == "UnauthorizedOperation"
+        
+        assert delete_stakeholders_tag('i-0df9c53001c5c837d') is False
+        assert mock_audit.call_args[0][:4] == ("delete_stakeholders_tag", 'i-0df9c53001c5c837d', {"error": "UnauthorizedOperation"}, False)
+
+# Restart lookup tests
+def test_restart_instance_makes_a_single_describe_call():
+    """Test restart reads control tag, state and name from one DescribeInstances response"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.return_value = {'Reservations': [{'Instances': [{
+            'InstanceId': 'i-0df9c53001c5c837d',
+            'State': {'Name': 'running'},
+            'Tags': [{'Key': 'EC2ControlsEnabled', 'Value': 'true'}, {'Key': 'Name', 'Value': 'web01'}]
+        }]}]}
+        mock_ec2_client.reboot_instances.return_value = {}
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import restart_instance
+        
+        assert restart_instance('i-0df9c53001c5c837d') is True
+        mock_ec2_client.describe_instances.assert_called_once_with(InstanceIds=['i-0df9c53001c5c837d'])
+        mock_ec2_client.reboot_instances.assert_called_once_with(InstanceIds=['i-0df9c53001c5c837d'])
+
+# Name lookup pagination tests
+def test_get_instance_by_name_stops_paging_after_second_match():
+    """Test an ambiguous name is reported without fetching the remaining result pages"""
+    def page(instance_id):
+        return {'Reservations': [{'Instances': [{
+            'InstanceId': instance_id,
+            'State': {'Name': 'running'},
+            'Tags': [{'Key': 'Name', 'Value': 'web01'}, {'Key': 'EC2ControlsEnabled', 'Value': 'true'}]
+        }]}]}
+    
+    fetched = []
+    def paginate(**kwargs):
+        for instance_id in ('i-aaaaaaaaaaaaaaaaa', 'i-bbbbbbbbbbbbbbbbb', 'i-ccccccccccccccccc'):
+            fetched.append(instance_id)
+            yield page(instance_id)
+    
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.get_paginator.return_value.paginate.side_effect = paginate
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_instance_by_name
+        
+        assert get_instance_by_name('web01') is None
+        assert fetched == ['i-aaaaaaaaaaaaaaaaa', 'i-bbbbbbbbbbbbbbbbb']
+
+# Audit writer batching tests
+def test_audit_writer_takes_queued_entries_in_batches():
+    """Test the audit writer drains up to a batch of queued entries per wakeup, one log line each"""
+    import queue as queue_module
+    with patch('src.aws_client._audit_q', queue_module.Queue()) as audit_q, \
+         patch('src.aws_client._AUDIT_BATCH_SIZE', 3), \
+         patch('src.aws_client._write_audit_entry') as mock_write:
+        from src.aws_client import _take_audit_batch, _flush_audit_queue
+        
+        for n in range(5):
+            audit_q.put(n)
+        
+        assert _take_audit_batch() == [0, 1, 2]
+        _flush_audit_queue()
+        assert [c[0][0] for c in mock_write.call_args_list] == [3, 4]
+        with pytest.raises(queue_module.Empty):
+            _take_audit_batch(block=False)
+
+# Streaming instance listing tests
+def test_fuzzy_search_streams_controllable_instances_across_pages():
+    """Test fuzzy search consumes paginated, server-filtered results and skips uncontrollable instances"""
+    def instance(instance_id, name, enabled):
+        return {'InstanceId': instance_id, 'State': {'Name': 'running'},
+                'Tags': [{'Key': 'Name', 'Value': name}, {'Key': 'EC2ControlsEnabled', 'Value': enabled}]}
+    
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.get_paginator.return_value.paginate.return_value = iter([
+            {'Reservations': [{'Instances': [instance('i-aaaaaaaaaaaaaaaaa', 'web01', 'true')]}]},
+            {'Reservations': [{'Instances': [instance('i-bbbbbbbbbbbbbbbbb', 'web02', 'false'),
+                                             instance('i-ccccccccccccccccc', 'web03', 'true')]}]}
+        ])
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import fuzzy_search_instances, _STATE_FILTER, _CONTROL_TAG_FILTER
+        
+        results = fuzzy_search_instances('web')
+        assert [r['InstanceId'] for r in results] == ['i-aaaaaaaaaaaaaaaaa', 'i-ccccccccccccccccc']
+        mock_ec2_client.get_paginator.return_value.paginate.assert_called_once_with(
+            PaginationConfig={'PageSize': 1000}, Filters=[_STATE_FILTER, _CONTROL_TAG_FILTER])
+
+# AWS error classification tests
+def test_parse_aws_error_message_classifies_error_codes():
+    """Test AWS error strings map to the error types reported to users"""
+    from src.aws_client import _parse_aws_error_message
+    
+    def error(code, message='details'):
+        return f"An error occurred ({code}) when calling the StartInstances operation: {message}"
+    
+    assert _parse_aws_error_message(error('IncorrectInstanceState', "The instance 'i-1' is not in a state from which it can be started.")) == "instance_cannot_start_from_current_state"
+    assert _parse_aws_error_message(error('IncorrectInstanceState', "The instance 'i-1' is not in a state from which it can be stopped.")) == "instance_cannot_stop_from_current_state"
+    assert _parse_aws_error_message(error('IncorrectInstanceState')) == "incorrect_instance_state"
+    assert _parse_aws_error_message(error('InvalidInstanceID.NotFound')) == "invalid_instance_id"
+    assert _parse_aws_error_message(error('UnauthorizedOperation')) == "unauthorized_operation"
+    assert _parse_aws_error_message(error('RequestLimitExceeded')) == "rate_limit_exceeded"
+    assert _parse_aws_error_message(error('InsufficientInstanceCapacity')) == "insufficient_capacity"
+    assert _parse_aws_error_message(error('UnsupportedOperation')) == "unsupported_operation"
+    assert _parse_aws_error_message(error('InternalError')) == "aws_error"
+    assert _parse_aws_error_message('') == "Unknown AWS error"
+
+# State transition table tests
+def test_validate_transition_rejections():
+    """Test power actions are allowed only from their valid states and rejections are audited"""
+    with patch('src.aws_client._log_aws_operation') as mock_audit:
+        from src.aws_client import _validate_transition
+        
+        assert _validate_transition('start', 'i-0df9c53001c5c837d', 'stopped') is True
+        assert _validate_transition('stop', 'i-0df9c53001c5c837d', 'running') is True
+        assert _validate_transition('restart', 'i-0df9c53001c5c837d', 'running') is True
+        mock_audit.assert_not_called()
+        
+        assert _validate_transition('restart', 'i-0df9c53001c5c837d', 'stopped') is False
+        mock_audit.assert_called_with("reboot_instances", 'i-0df9c53001c5c837d', {"error": "instance_stopped", "current_state": 'stopped'}, False)
+        assert _validate_transition('stop', 'i-0df9c53001c5c837d', 'shutting-down') is False
+        mock_audit.assert_called_with("stop_instances", 'i-0df9c53001c5c837d', {"error": "invalid_state_for_stop", "current_state": 'shutting-down'}, False)
+        assert _validate_transition('start', 'i-0df9c53001c5c837d', None) is False
+        mock_audit.assert_called_with("start_instances", 'i-0df9c53001c5c837d', {"error": "state_unknown"}, False)
+
+# Tag dict projection tests
+def test_tag_getters_share_one_cached_tag_dict():
+    """Test the tag getters read one cached {Key: Value} projection and failed lookups are not cached"""
+    with patch('src.aws_client._fetch_instance_tags') as mock_fetch:
+        mock_fetch.side_effect = [None, [
+            {'Key': 'PowerScheduleOffTime', 'Value': '5pm'},
+            {'Key': 'PowerScheduleOnTime', 'Value': '9am'},
+            {'Key': 'Stakeholders', 'Value': 'alice,bob'}
+        ]]
+        
+        from src.aws_client import get_power_schedule_tags, get_disable_schedule_tag, get_stakeholders_tag
+        
+        assert get_stakeholders_tag('i-0df9c53001c5c837d') is None
+        assert get_power_schedule_tags('i-0df9c53001c5c837d') == {'on_time': '9am', 'off_time': '5pm'}
+        assert get_stakeholders_tag('i-0df9c53001c5c837d') == 'alice,bob'
+        assert get_disable_schedule_tag('i-0df9c53001c5c837d') is None
+        assert mock_fetch.call_count == 2
+
+# Tag write batching tests
+def test_tag_writer_groups_queued_writes_by_tag_set():
+    """Test writes queued behind an in-flight request go out as one request per distinct tag set"""
+    import threading
+    from src.aws_client import _tag_writer
+    
+    release_first = threading.Event()
+    def create_tags(Resources, Tags):
+        if Resources == ['i-aaaaaaaaaaaaaaaaa']:
+            release_first.wait(5)
+    
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.create_tags.side_effect = create_tags
+        mock_client.return_value = mock_ec2_client
+        
+        on_9am = [{'Key': 'PowerScheduleOnTime', 'Value': '9am'}]
+        on_8am = [{'Key': 'PowerScheduleOnTime', 'Value': '8am'}]
+        writes = [('i-aaaaaaaaaaaaaaaaa', on_9am), ('i-bbbbbbbbbbbbbbbbb', on_9am),
+                  ('i-ccccccccccccccccc', on_9am), ('i-ddddddddddddddddd', on_8am)]
+        threads = [threading.Thread(target=_tag_writer.submit, args=('create_tags', instance_id, tags)) for instance_id, tags in writes]
+        threads[0].start()
+        assert _wait_until(lambda: mock_ec2_client.create_tags.call_count > 0)
+        for thread in threads[1:]:
+            thread.start()
+        assert _wait_until(lambda: sum(len(group) for group in _tag_writer._pending.values()) >= 3)
+        
+        release_first.set()
+        for thread in threads:
+            thread.join(5)
+        
+        calls = sorted((sorted(c.kwargs['Resources']), c.kwargs['Tags'][0]['Value']) for c in mock_ec2_client.create_tags.call_args_list[1:])
+        assert calls == [(['i-bbbbbbbbbbbbbbbbb', 'i-ccccccccccccccccc'], '9am'), (['i-ddddddddddddddddd'], '8am')]
+        assert not _tag_writer._pending
+
+def test_tag_writer_retries_failed_batch_individually():
+    """Test one bad instance ID does not fail the other tag writes in its batch"""
+    from concurrent.futures import Future
+    from src.aws_client import _tag_writer
+    
+    def delete_tags(Resources, Tags):
+        if 'i-bbbbbbbbbbbbbbbbb' in Resources:
+            raise Exception("InvalidInstanceID.NotFound")
+    
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.delete_tags.side_effect = delete_tags
+        mock_client.return_value = mock_ec2_client
+        
+        batch = {'i-aaaaaaaaaaaaaaaaa': Future(), 'i-bbbbbbbbbbbbbbbbb': Future()}
+        _tag_writer._write('delete_tags', [{'Key': 'Stakeholders'}], batch)
+        
+        assert batch['i-aaaaaaaaaaaaaaaaa'].result() is None
+        with pytest.raises(Exception):
+            batch['i-bbbbbbbbbbbbbbbbb'].result()
+        assert mock_ec2_client.delete_tags.call_count == 3
+
+# Fuzzy search index tests
+def test_fuzzy_search_index_cached_until_instance_changes():
+    """Test repeated searches reuse the cached index and a change made by this service rebuilds it"""
+    with patch('src.aws_client._iter_controllable_instances') as mock_controllable:
+        mock_controllable.side_effect = lambda: iter([
+            {'InstanceId': 'i-aaaaaaaaaaaaaaaaa', 'State': {'Name': 'running'}, 'Tags': [{'Key': 'Name', 'Value': 'web01'}]},
+            {'InstanceId': 'i-bbbbbbbbbbbbbbbbb', 'State': {'Name': 'stopped'}, 'Tags': [{'Key': 'Name', 'Value': 'db01'}]}
+        ])
+        
+        from src.aws_client import fuzzy_search_instances, invalidate
+        
+        assert [r['Name'] for r in fuzzy_search_instances('web')] == ['web01']
+        assert [r['Name'] for r in fuzzy_search_instances('DB')] == ['db01']
+        assert mock_controllable.call_count == 1
+        
+        invalidate('i-bbbbbbbbbbbbbbbbb')
+        assert fuzzy_search_instances('01') != []
+        assert mock_controllable.call_count == 2
+
+# Audit payload size tests
+def test_large_listings_audit_id_sample_and_digest():
+    """Test long instance listings are audited as a sample plus a digest rather than every ID"""
+    from src.aws_client import _audit_instance_ids
+    
+    instances = [{'InstanceId': f'i-{n:017x}'} for n in range(60)]
+    details = _audit_instance_ids(instances, "instance_ids")
+    assert set(details) == {"instance_ids_sample", "instance_ids_blake2b"}
+    assert details["instance_ids_sample"] == [f'i-{n:017x}' for n in range(10)]
+    assert _audit_instance_ids(list(reversed(instances)), "instance_ids")["instance_ids_blake2b"] == details["instance_ids_blake2b"]
+    assert _audit_instance_ids(instances[:3], "controllable_instance_ids") == {
+        "controllable_instance_ids": ['i-00000000000000000', 'i-00000000000000001', 'i-00000000000000002']
+    }
+
+# Identifier form tests
+def test_resolve_identifier_rejects_invalid_name_without_lookup():
+    """Test wildcard, control-character and over-long identifiers are rejected before any describe call"""
+    with patch('src.aws_client.get_instance_by_name') as mock_by_name:
+        mock_by_name.return_value = 'i-1234567890abcdef0'
+        
+        from src.aws_client import resolve_instance_identifier
+        
+        for invalid in ('web*', 'db?', 'web01\n', 'a' * 257, ''):
+            assert resolve_instance_identifier(invalid) is None
+        mock_by_name.assert_not_called()
+        
+        assert resolve_instance_identifier('web-01.example.com') == 'i-1234567890abcdef0'
+        mock_by_name.assert_called_once_with('web-01.example.com')
+
+def test_resolve_identifier_accepts_punctuated_names():
+    """Test Name tag values with punctuation EC2 allows still resolve"""
+    with patch('src.aws_client.get_instance_by_name') as mock_by_name:
+        mock_by_name.return_value = 'i-1234567890abcdef0'
+        
+        from src.aws_client import resolve_instance_identifier
+        
+        for name in ('web (prod)', "bob's-box", 'db#1', 'a&b', 'web,01', 'db;drop', 'café', 'a' * 256):
+            mock_by_name.reset_mock()
+            assert resolve_instance_identifier(name) == 'i-1234567890abcdef0'
+            mock_by_name.assert_called_once_with(name)
+
+# Power action lookup reuse tests
+def test_power_actions_reuse_describe_for_log_name():
+    """Test start/stop/restart name the instance from their pre-flight describe rather than re-fetching it"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.return_value = {'Reservations': [{'Instances': [{
+            'InstanceId': 'i-0df9c53001c5c837d',
+            'State': {'Name': 'stopped'},
+            'Tags': [{'Key': 'Name', 'Value': 'web01'}, {'Key': 'EC2ControlsEnabled', 'Value': 'true'}]
+        }]}]}
+        mock_ec2_client.start_instances.return_value = {'StartingInstances': [{
+            'PreviousState': {'Name': 'stopped'}, 'CurrentState': {'Name': 'pending'}
+        }]}
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import start_instance
+        
+        with patch('src.aws_client.logger') as mock_logger:
+            assert start_instance('i-0df9c53001c5c837d') is True
+        
+        assert mock_ec2_client.describe_instances.call_count == 1
+        logged = [str(c.args[0]) % c.args[1:] for c in mock_logger.info.call_args_list]
+        assert "AWS: Started web01 (i-0df9c53001c5c837d)" in logged
+
+# Client configuration tests
+def test_ec2_client_config_bounds_retries_and_timeouts():
+    """Test the shared client config uses adaptive retries and explicit timeouts"""
+    from src.aws_client import _client_config
+    
+    assert _client_config.retries['mode'] == 'adaptive'
+    assert _client_config.retries['total_max_attempts'] == 3
+    assert _client_config.connect_timeout == 1
+    assert _client_config.read_timeout == 5
+    assert _client_config.tcp_keepalive is True
+
+# Listing cache warm-up tests
+def test_stakeholder_listing_reads_tags_from_listing():
+    """Test per-instance lookups after a controllable listing are served from the warmed cache"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.get_paginator.return_value.paginate.return_value = [{'Reservations': [{'Instances': [
+            {'InstanceId': 'i-aaaaaaaaaaaaaaaaa', 'State': {'Name': 'running'}, 'Tags': [
+                {'Key': 'Name', 'Value': 'web01'}, {'Key': 'EC2ControlsEnabled', 'Value': 'true'},
+                {'Key': 'Stakeholders', 'Value': 'U123,U456'}]},
+            {'InstanceId': 'i-bbbbbbbbbbbbbbbbb', 'State': {'Name': 'stopped'}, 'Tags': [
+                {'Key': 'Name', 'Value': 'db01'}, {'Key': 'EC2ControlsEnabled', 'Value': 'true'}]}
+        ]}]}]
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_instances_by_stakeholder
+        
+        assert get_instances_by_stakeholder('U456') == [
+            {'instance_id': 'i-aaaaaaaaaaaaaaaaa', 'instance_name': 'web01', 'state': 'running'}
+        ]
+        mock_ec2_client.describe_instances.assert_not_called()
+
+def test_stakeholder_listing_filters_by_tag_server_side():
+    """Test stakeholder listings ask EC2 only for instances whose Stakeholders tag mentions the user"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.get_paginator.return_value.paginate.return_value = [{'Reservations': [{'Instances': [
+            {'InstanceId': 'i-aaaaaaaaaaaaaaaaa', 'State': {'Name': 'running'}, 'Tags': [
+                {'Key': 'EC2ControlsEnabled', 'Value': 'true'}, {'Key': 'Stakeholders', 'Value': 'U1234'}]}
+        ]}]}]
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_instances_by_stakeholder
+        
+        # U1234 matches the *U123* wildcard but is a different user
+        assert get_instances_by_stakeholder('U123') == []
+        filters = mock_ec2_client.get_paginator.return_value.paginate.call_args.kwargs['Filters']
+        assert {'Name': 'tag:Stakeholders', 'Values': ['*U123*']} in filters
+        mock_ec2_client.describe_instances.assert_not_called()
+
+# Stakeholder set tests
+def test_stakeholder_changes_use_parsed_set():
+    """Test stakeholder checks share one parsed set and writes store the sorted result"""
+    with patch('src.aws_client._lookup_tag_dict') as mock_tags, \
+         patch('src.aws_client.set_stakeholders_tag') as mock_set:
+        mock_tags.return_value = {'Stakeholders': 'U2, U1,,U3'}
+        mock_set.return_value = True
+        
+        from src.aws_client import add_stakeholder, remove_stakeholder, is_user_stakeholder
+        
+        assert is_user_stakeholder('i-0df9c53001c5c837d', 'U1') is True
+        assert add_stakeholder('i-0df9c53001c5c837d', 'U1') == (True, "already_stakeholder")
+        assert add_stakeholder('i-0df9c53001c5c837d', 'U0') == (True, "added")
+        mock_set.assert_called_once_with('i-0df9c53001c5c837d', ['U0', 'U1', 'U2', 'U3'])
+        assert remove_stakeholder('i-0df9c53001c5c837d', 'U2') == (True, "removed")
+        mock_set.assert_called_with('i-0df9c53001c5c837d', ['U1', 'U3'])
+        assert mock_tags.call_count == 1
+
+def test_failed_stakeholder_read_not_cached():
+    """Test a failed tag read is not cached as an empty stakeholder set"""
+    with patch('src.aws_client._fetch_instance_tags') as mock_fetch:
+        mock_fetch.return_value = None
+        
+        from src.aws_client import is_user_stakeholder, _get_stakeholders
+        
+        assert _get_stakeholders('i-0df9c53001c5c837d') is None
+        assert is_user_stakeholder('i-0df9c53001c5c837d', 'U1') is False
+        
+        mock_fetch.return_value = [{'Key': 'Stakeholders', 'Value': 'U1,U2'}]
+        assert _get_stakeholders('i-0df9c53001c5c837d') == frozenset({'U1', 'U2'})
+        assert is_user_stakeholder('i-0df9c53001c5c837d', 'U1') is True
+
+# Background power action tests
+def test_ec2_power_valid_transition_runs_in_background():
+    """Test a valid power change is queued rather than run on the request thread"""
+    with app.app_context():
+        with patch('src.handlers.resolve_instance_identifier') as mock_resolve, \
+             patch('src.handlers.get_instance_state') as mock_get_state, \
+             patch('src.handlers.start_instance') as mock_start, \
+             patch('src.handlers.submit_power_action') as mock_submit, \
+             patch('src.handlers.get_instance_name') as mock_get_name, \
+             patch('src.handlers.can_control_instance_by_id') as mock_can_control:
+            
+            mock_resolve.return_value = 'i-0df9c53001c5c837d'
+            mock_get_state.return_value = 'stopped'
+            mock_get_name.return_value = 'test-instance'
+            mock_can_control.return_value = True
+            
+            request = Mock()
+            request.form = {'user_id': 'U08QYU6AX0V', 'text': 'i-0df9c53001c5c837d on'}
+            
+            result = handle_ec2_power(request)
+            assert "Requested on for `test-instance`" in result.json['text']
+            mock_submit.assert_called_once_with(mock_start, 'i-0df9c53001c5c837d')
+            mock_start.assert_not_called()
+
+def test_ec2_power_invalid_transition_runs_inline():
+    """Test a power change the current state rules out is rejected inline and not queued"""
+    with app.app_context():
+        with patch('src.handlers.resolve_instance_identifier') as mock_resolve, \
+             patch('src.handlers.get_instance_state') as mock_get_state, \
+             patch('src.handlers.stop_instance') as mock_stop, \
+             patch('src.handlers.submit_power_action') as mock_submit, \
+             patch('src.handlers.get_instance_name') as mock_get_name, \
+             patch('src.handlers.can_control_instance_by_id') as mock_can_control:
+            
+            mock_resolve.return_value = 'i-0df9c53001c5c837d'
+            mock_get_state.return_value = 'stopped'
+            mock_stop.return_value = False
+            mock_get_name.return_value = 'test-instance'
+            mock_can_control.return_value = True
+            
+            request = Mock()
+            request.form = {'user_id': 'U08QYU6AX0V', 'text': 'i-0df9c53001c5c837d off'}
+            
+            result = handle_ec2_power(request)
+            assert "is already stopped" in result.json['text']
+            mock_stop.assert_called_once_with('i-0df9c53001c5c837d')
+            mock_submit.assert_not_called()
+
+def test_submit_power_action_runs_on_pool():
+    """Test submitted power actions run on the background pool and return their result via the future"""
+    from src.aws_client import submit_power_action
+    
+    action = Mock(return_value=True)
+    assert submit_power_action(action, 'i-0df9c53001c5c837d').result(timeout=5) is True
+    action.assert_called_once_with('i-0df9c53001c5c837d')
+
+def test_background_power_failure_audited_as_warning():
+    """Test a queued power change that EC2 fails is audited at WARNING with the requesting user"""
+    import logging
+    from src.handlers import _apply_power_action
+    
+    with patch('src.handlers._log_user_action') as mock_audit:
+        start = Mock(return_value=False)
+        assert _apply_power_action(start, 'start', 'i-0df9c53001c5c837d', 'stopped', 'U08QYU6AX0V', 'tester') is True
+        assert _wait_until(lambda: mock_audit.called)
+        start.assert_called_once_with('i-0df9c53001c5c837d')
+        args, kwargs = mock_audit.call_args
+        assert args[:4] == ('U08QYU6AX0V', 'tester', 'ec2_power_start_failed', 'i-0df9c53001c5c837d')
+        assert args[5] is False and kwargs == {'level': logging.WARNING}
+        
+        mock_audit.reset_mock()
+        stop = Mock(side_effect=Exception("throttled"))
+        _apply_power_action(stop, 'stop', 'i-0df9c53001c5c837d', 'running', 'U08QYU6AX0V', 'tester')
+        assert _wait_until(lambda: mock_audit.called)
+        assert mock_audit.call_args.args[4]['error'] == "throttled"
+        
+        mock_audit.reset_mock()
+        restart = Mock(return_value=True)
+        _apply_power_action(restart, 'restart', 'i-0df9c53001c5c837d', 'running', 'U08QYU6AX0V', 'tester')
+        assert _wait_until(lambda: restart.called)
+        mock_audit.assert_not_called()
+
+# Stakeholder edit batching tests
+def test_concurrent_stakeholder_edits_share_one_write():
+    """Test stakeholder edits queued behind an in-flight write are applied together in one write"""
+    import threading
+    from src.aws_client import add_stakeholder, remove_stakeholder, invalidate, _stakeholder_editor
+    
+    stored = {'Stakeholders': 'U1'}
+    release_first = threading.Event()
+    
+    def set_stakeholders_tag(instance_id, stakeholders_list):
+        if stakeholders_list == ['U1', 'U2']:
+            release_first.wait(5)
+        stored['Stakeholders'] = ','.join(stakeholders_list)
+        invalidate(instance_id)
+        return True
+    
+    with patch('src.aws_client._lookup_tag_dict', side_effect=lambda instance_id: dict(stored)), \
+         patch('src.aws_client.set_stakeholders_tag', side_effect=set_stakeholders_tag) as mock_set:
+        results = {}
+        def edit(edit_fn, user_id):
+            results[user_id] = edit_fn('i-0df9c53001c5c837d', user_id)
+        
+        first = threading.Thread(target=edit, args=(add_stakeholder, 'U2'))
+        first.start()
+        assert _wait_until(lambda: mock_set.call_count > 0)
+        
+        followers = [threading.Thread(target=edit, args=args) for args in ((add_stakeholder, 'U3'), (remove_stakeholder, 'U1'))]
+        for thread in followers:
+            thread.start()
+        assert _wait_until(lambda: len(_stakeholder_editor._pending.get('i-0df9c53001c5c837d', ())) >= 2)
+        
+        release_first.set()
+        for thread in [first] + followers:
+            thread.join(5)
+        
+        assert results == {'U2': (True, "added"), 'U3': (True, "added"), 'U1': (True, "removed")}
+        assert mock_set.call_count == 2
+        assert stored['Stakeholders'] == 'U2,U3'
+
+def test_stakeholder_edit_skips_write_when_read_fails():
+    """Test a failed tag read fails the queued edits without overwriting the Stakeholders tag"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.side_effect = Exception("throttled")
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import add_stakeholder, remove_stakeholder
+        
+        assert add_stakeholder('i-0df9c53001c5c837d', 'U1') == (False, "error")
+        assert remove_stakeholder('i-0df9c53001c5c837d', 'U1') == (False, "error")
+        mock_ec2_client.create_tags.assert_not_called()
+        mock_ec2_client.delete_tags.assert_not_called()
+
+# Parsed input cache tests
+def test_parse_hours_audits_each_input_once():
+    """Test repeated hours strings, valid or not, are parsed and audited only the first time"""
+    with patch('src.disable_schedule._log_disable_schedule_operation') as mock_audit:
+        assert parse_hours('2h') == 2
+        assert parse_hours('2h') == 2
+        assert parse_hours('abc') is None
+        assert parse_hours('abc') is None
+        assert mock_audit.call_count == 1
+
+def test_disable_until_parse_is_shared():
+    """Test a disable tag value is parsed once and offset-less values are read as UTC"""
+    from datetime import datetime, timezone
+    from src.disable_schedule import _parse_disable_until
+    
+    parsed = _parse_disable_until('2030-01-02T03:04:05')
+    assert parsed == datetime(2030, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert _parse_disable_until('2030-01-02T03:04:05') is parsed
+    with pytest.raises(ValueError):
+        _parse_disable_until('not-a-date')
+
+# Filtered audit tests
+def test_schedule_audits_skipped_when_info_filtered():
+    """Test schedule audit entries are not built or serialized when INFO is filtered out"""
+    from src.schedule import _log_schedule_operation
+    from src.disable_schedule import _log_disable_schedule_operation
+    
+    for module, log_operation in (('src.schedule', _log_schedule_operation), ('src.disable_schedule', _log_disable_schedule_operation)):
+        with patch(f'{module}.logger') as mock_logger, patch(f'{module}.json.dumps') as mock_dumps:
+            mock_logger.isEnabledFor.return_value = False
+            log_operation("get_schedule", 'i-0df9c53001c5c837d', {"found": True})
+            mock_logger.info.assert_not_called()
+            mock_dumps.assert_not_called()
+
+# Unchanged stakeholder write tests
+def test_set_stakeholders_tag_skips_unchanged_value():
+    """Test writing the stakeholder list the tag already holds makes no CreateTags call"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.return_value = {'Reservations': [{'Instances': [{
+            'InstanceId': 'i-0df9c53001c5c837d',
+            'State': {'Name': 'running'},
+            'Tags': [{'Key': 'Stakeholders', 'Value': 'U1,U2'}]
+        }]}]}
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_stakeholders_tag, set_stakeholders_tag
+        
+        assert get_stakeholders_tag('i-0df9c53001c5c837d') == 'U1,U2'
+        assert set_stakeholders_tag('i-0df9c53001c5c837d', ['U2', 'U1']) is True
+        mock_ec2_client.create_tags.assert_not_called()
+        
+        assert set_stakeholders_tag('i-0df9c53001c5c837d', ['U3', 'U1']) is True
+        mock_ec2_client.create_tags.assert_called_once_with(
+            Resources=['i-0df9c53001c5c837d'], Tags=[{'Key': 'Stakeholders', 'Value': 'U1,U3'}])
+
+# Power command parsing tests
+def test_ec2_power_command_parsing():
+    """Test power commands accept one or two whitespace-separated words and reject anything else"""
+    with app.app_context():
+        with patch('src.handlers.resolve_instance_identifier') as mock_resolve, \
+             patch('src.handlers.get_instance_state') as mock_get_state, \
+             patch('src.handlers.get_instance_name') as mock_get_name:
+            mock_resolve.return_value = 'i-0df9c53001c5c837d'
+            mock_get_state.return_value = 'running'
+            mock_get_name.return_value = 'web01'
+            
+            request = Mock()
+            request.form = {'user_id': 'U08QYU6AX0V', 'text': '  web01  '}
+            assert handle_ec2_power(request) == "Instance `web01` (i-0df9c53001c5c837d) is currently running"
+            mock_resolve.assert_called_once_with('web01')
+            
+            for text in ('', 'web01 on now'):
+                request.form = {'user_id': 'U08QYU6AX0V', 'text': text}
+                assert handle_ec2_power(request) == "Usage: <instance-id|instance-name> [on|off|restart]"
+
+def test_disable_until_fast_path_matches_fromisoformat():
+    """Test the fast parse of values set_disable_schedule writes agrees with datetime.fromisoformat"""
+    from datetime import datetime, timezone
+    from src.disable_schedule import _parse_disable_until
+    
+    for value in ('2030-01-02T03:04:05+00:00', '2030-01-02T03:04:05.000123+00:00', '2030-01-02T03:04:05-07:00'):
+        assert _parse_disable_until(value) == datetime.fromisoformat(value)
+    assert _parse_disable_until('2030-01-02T03:04:05+00:00').tzinfo is timezone.utc
+    with pytest.raises(ValueError):
+        _parse_disable_until('2030-02-30T03:04:05+00:00')
+
+# Bulk describe cache tests
+def test_get_instances_bulk_describes_only_uncached_ids():
+    """Test bulk lookups reuse cached instance details and describe only the rest"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.describe_instances.side_effect = lambda InstanceIds: {'Reservations': [{'Instances': [
+            {'InstanceId': instance_id, 'State': {'Name': 'running'}} for instance_id in InstanceIds
+        ]}]}
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import get_instance_details, get_instances_bulk
+        
+        get_instance_details('i-aaaaaaaaaaaaaaaaa')
+        bulk = get_instances_bulk(['i-aaaaaaaaaaaaaaaaa', 'i-bbbbbbbbbbbbbbbbb'])
+        
+        assert set(bulk) == {'i-aaaaaaaaaaaaaaaaa', 'i-bbbbbbbbbbbbbbbbb'}
+        assert mock_ec2_client.describe_instances.call_count == 2
+        assert mock_ec2_client.describe_instances.call_args.kwargs == {'InstanceIds': ['i-bbbbbbbbbbbbbbbbb']}
+        
+        get_instances_bulk(['i-aaaaaaaaaaaaaaaaa', 'i-bbbbbbbbbbbbbbbbb'])
+        assert mock_ec2_client.describe_instances.call_count == 2
+
+# Instance ID validation tests
+def test_is_valid_instance_id():
+    """Test only i- followed by 8 or 17 lowercase hex characters is a valid instance ID"""
+    from src.handlers import _is_valid_instance_id
+    
+    assert _is_valid_instance_id('i-0df9c530')
+    assert _is_valid_instance_id('i-0df9c53001c5c837d')
+    for invalid in ('', 'i-', 'i-0df9c53', 'i-0df9c53001', 'i-0DF9C53001C5C837D', 'i-0df9c53001c5c837dx', 'x-0df9c530', 'i-0df9c53g'):
+        assert not _is_valid_instance_id(invalid)
+
+# Name resolution reuse tests
+def test_resolved_name_shares_describe_with_control_check():
+    """Test resolving a Name and then checking control, state and name costs one describe"""
+    with patch('src.aws_client._get_ec2_client') as mock_client:
+        mock_ec2_client = Mock()
+        mock_ec2_client.get_paginator.return_value.paginate.return_value = [{'Reservations': [{'Instances': [{
+            'InstanceId': 'i-0df9c53001c5c837d',
+            'State': {'Name': 'running'},
+            'Tags': [{'Key': 'Name', 'Value': 'web01'}, {'Key': 'EC2ControlsEnabled', 'Value': 'true'}]
+        }]}]}]
+        mock_client.return_value = mock_ec2_client
+        
+        from src.aws_client import resolve_instance_identifier, can_control_instance_by_id, get_instance_state, get_instance_name
+        
+        assert resolve_instance_identifier('web01') == 'i-0df9c53001c5c837d'
+        assert can_control_instance_by_id('i-0df9c53001c5c837d') is True
+        assert get_instance_state('i-0df9c53001c5c837d') == 'running'
+        assert get_instance_name('i-0df9c53001c5c837d') == 'web01'
+        mock_ec2_client.describe_instances.assert_not_called()